@@ -16,6 +16,7 @@ PROJECT_ROOT = Path(__file__).resolve().parent
 if str(PROJECT_ROOT) not in sys.path:
     sys.path.insert(0, str(PROJECT_ROOT))
 
+from src.llm_cache import LLMResponseCache
 from src.skill_registry import SkillRegistry
 from src.skills_graph import create_skills_graph
 
@@ -23,6 +24,8 @@ from src.skills_graph import create_skills_graph
 # Constants
 # ---------------------------------------------------------------------------
 SKILLS_DIR = str(PROJECT_ROOT / "skills")
+MANIFEST_PATH = str(PROJECT_ROOT / ".skills_manifest.json")
+LLM_CACHE_PATH = str(PROJECT_ROOT / ".llm_cache.sqlite")
 
 # ---------------------------------------------------------------------------
 # Page config
@@ -66,8 +69,13 @@ if "messages" not in st.session_state:
     st.session_state.messages = []
 if "graph" not in st.session_state:
     st.session_state.graph = None
+if "llm_cache" not in st.session_state:
+    st.session_state.llm_cache = LLMResponseCache(path=LLM_CACHE_PATH)
 if "registry" not in st.session_state:
-    st.session_state.registry = SkillRegistry(base_path=SKILLS_DIR)
+    st.session_state.registry = SkillRegistry(
+        base_path=SKILLS_DIR,
+        manifest_path=MANIFEST_PATH,
+    )
 
 # ---------------------------------------------------------------------------
 # Sidebar
@@ -100,7 +108,12 @@ with st.sidebar:
     # Graph init button
     if st.button("Initialize Graph", use_container_width=True):
         try:
-            st.session_state.graph = create_skills_graph(skills_base_path=SKILLS_DIR)
+            st.session_state.graph = create_skills_graph(
+                skills_base_path=SKILLS_DIR,
+                manifest_path=MANIFEST_PATH,
+                warm_up=True,
+                llm_cache=st.session_state.llm_cache,
+            )
             st.success("Graph initialized!")
         except Exception as e:
             st.error(f"Failed: {e}")
@@ -153,6 +166,8 @@ if user_input := st.chat_input("Ask anything..."):
             try:
                 st.session_state.graph = create_skills_graph(
                     skills_base_path=SKILLS_DIR,
+                    manifest_path=MANIFEST_PATH,
+                    llm_cache=st.session_state.llm_cache,
                 )
             except Exception:
                 st.session_state.graph = None
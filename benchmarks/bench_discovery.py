@@ -0,0 +1,89 @@
+"""Benchmark: sequential vs. thread-pooled skill discovery.
+
+Builds a synthetic tree of skill directories and times ``SkillRegistry``
+construction with ``max_workers=1`` against the default thread pool.  Use
+``--latency-ms`` to add a fixed delay to every ``skill.yaml`` stat and read,
+emulating a slow or network-mounted skills directory.
+
+Usage::
+
+    python benchmarks/bench_discovery.py --skills 2000 --latency-ms 2
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import tempfile
+import time
+from pathlib import Path
+from unittest.mock import patch
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.skill_registry import SkillRegistry  # noqa: E402
+
+
+def build_tree(root: Path, count: int) -> None:
+    for i in range(count):
+        skill_dir = root / f"skill_{i:05d}"
+        skill_dir.mkdir()
+        (skill_dir / "skill.yaml").write_text(
+            f"name: skill_{i:05d}\n"
+            f"description: Synthetic skill number {i}\n"
+            "triggers:\n"
+            f"  - run skill {i}\n"
+            f"  - synthetic task {i}\n"
+            "entry_point: main.py\n"
+            "version: 1.0.0\n",
+            encoding="utf-8",
+        )
+
+
+def time_load(root: Path, max_workers, latency: float, repeat: int) -> float:
+    stamp = SkillRegistry._file_stamp
+    parse = SkillRegistry._parse_yaml
+
+    def slow_stamp(path):
+        time.sleep(latency)
+        return stamp(path)
+
+    def slow_parse(yaml_path, directory):
+        time.sleep(latency)
+        return parse(yaml_path, directory)
+
+    best = float("inf")
+    with patch.object(SkillRegistry, "_file_stamp", staticmethod(slow_stamp)), \
+            patch.object(SkillRegistry, "_parse_yaml", staticmethod(slow_parse)):
+        for _ in range(repeat):
+            start = time.perf_counter()
+            registry = SkillRegistry(base_path=str(root), max_workers=max_workers)
+            best = min(best, time.perf_counter() - start)
+    assert len(registry.list_skills()) > 0
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--skills", type=int, default=2000)
+    parser.add_argument("--latency-ms", type=float, default=0.0)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    latency = args.latency_ms / 1000.0
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        build_tree(root, args.skills)
+        sequential = time_load(root, 1, latency, args.repeat)
+        parallel = time_load(root, args.workers, latency, args.repeat)
+
+    print(f"skills:      {args.skills}")
+    print(f"latency:     {args.latency_ms:.1f} ms per file operation")
+    print(f"sequential:  {sequential * 1000:9.1f} ms")
+    print(f"thread pool: {parallel * 1000:9.1f} ms")
+    print(f"speed-up:    {sequential / parallel:9.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,135 @@
+"""Benchmark: per-call chat clients vs. the pooled LLMProvider.
+
+Starts a local fake Azure OpenAI endpoint (HTTP/1.1 with keep-alive) and
+issues ``--calls`` chat completions twice:
+
+* ``per-call``: a new ``AzureChatOpenAI`` with its own ``httpx.Client`` for
+  every call, as the nodes did before the provider existed,
+* ``pooled``: clients from one :class:`LLMProvider`, sharing a pool.
+
+For each it reports the wall time per call and the number of TCP
+connections the server accepted.  ``--latency`` adds a delay to every new
+connection, standing in for TCP/TLS setup to a remote endpoint.
+
+Usage::
+
+    python benchmarks/bench_llm_provider.py --calls 200 --latency 0.005
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import httpx
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from langchain_core.messages import HumanMessage  # noqa: E402
+from langchain_openai import AzureChatOpenAI  # noqa: E402
+
+from src.llm_provider import LLMProvider, LLMSettings  # noqa: E402
+
+_COMPLETION = json.dumps({
+    "id": "chatcmpl-bench",
+    "object": "chat.completion",
+    "created": 0,
+    "model": "bench",
+    "choices": [{
+        "index": 0,
+        "message": {"role": "assistant", "content": "ok"},
+        "finish_reason": "stop",
+    }],
+    "usage": {"prompt_tokens": 1, "completion_tokens": 1, "total_tokens": 2},
+}).encode("utf-8")
+
+
+class FakeAzureHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep connections open between requests
+    disable_nagle_algorithm = True  # headers and body go out as separate writes
+    connections = 0
+    connection_latency = 0.0
+    _lock = threading.Lock()
+
+    def setup(self) -> None:
+        # One handler instance per accepted connection.
+        with FakeAzureHandler._lock:
+            FakeAzureHandler.connections += 1
+        time.sleep(self.connection_latency)
+        super().setup()
+
+    def do_POST(self) -> None:  # noqa: N802
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(_COMPLETION)))
+        self.end_headers()
+        self.wfile.write(_COMPLETION)
+
+    def log_message(self, format: str, *args) -> None:
+        pass
+
+
+def client_kwargs(endpoint: str) -> dict:
+    return {
+        "azure_endpoint": endpoint,
+        "azure_deployment": "bench",
+        "api_key": "bench-key",
+        "api_version": "2024-06-01",
+        "max_retries": 0,
+        "temperature": 0,
+    }
+
+
+def run(label: str, get_llm, calls: int) -> None:
+    FakeAzureHandler.connections = 0
+    messages = [HumanMessage(content="ping")]
+    start = time.perf_counter()
+    for _ in range(calls):
+        get_llm().invoke(messages)
+    elapsed = time.perf_counter() - start
+    print(
+        f"{label:10s} {elapsed / calls * 1000:8.2f} ms/call"
+        f"   {FakeAzureHandler.connections:5d} connections"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--calls", type=int, default=200)
+    parser.add_argument("--latency", type=float, default=0.005,
+                        help="simulated connection setup time in seconds")
+    args = parser.parse_args()
+
+    FakeAzureHandler.connection_latency = args.latency
+    server = ThreadingHTTPServer(("127.0.0.1", 0), FakeAzureHandler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    endpoint = f"http://127.0.0.1:{server.server_address[1]}"
+    kwargs = client_kwargs(endpoint)
+
+    def per_call():
+        # Like the old ``_get_llm``, but with an explicit fresh HTTP client
+        # so the comparison does not depend on library-level client caching.
+        return AzureChatOpenAI(http_client=httpx.Client(), **kwargs)
+
+    provider = LLMProvider(
+        roles={"default": LLMSettings(azure_deployment="bench", max_retries=0)},
+        client_factory=lambda settings, http: AzureChatOpenAI(http_client=http, **kwargs),
+    )
+
+    print(f"calls: {args.calls}   connection latency: {args.latency * 1000:.1f} ms")
+    run("per-call", per_call, args.calls)
+    run("pooled", provider.get, args.calls)
+
+    provider.close()
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
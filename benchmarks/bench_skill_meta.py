@@ -0,0 +1,90 @@
+"""Benchmark: memory per skill and allocations per search.
+
+Builds a synthetic registry of ``--skills`` skills and reports, using
+``tracemalloc``:
+
+* bytes retained per loaded skill (metadata plus indexes),
+* bytes and blocks allocated by one ``search_skills`` call that hits
+  ``--hits`` skills, and by one ``list_skills`` call.
+
+Usage::
+
+    python benchmarks/bench_skill_meta.py --skills 10000
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import tempfile
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.skill_registry import SkillRegistry  # noqa: E402
+
+
+def build_tree(root: Path, count: int, hits: int) -> None:
+    for i in range(count):
+        skill_dir = root / f"skill_{i:05d}"
+        skill_dir.mkdir()
+        shared = "  - common trigger\n" if i < hits else ""
+        (skill_dir / "skill.yaml").write_text(
+            f"name: skill_{i:05d}\n"
+            f"description: Synthetic skill number {i} for memory benchmarks\n"
+            "triggers:\n"
+            f"  - Run Skill {i}\n"
+            f"  - Synthetic Task {i}\n"
+            f"  - Benchmark Phrase {i}\n"
+            f"{shared}"
+            "entry_point: main.py\n"
+            "version: 1.0.0\n",
+            encoding="utf-8",
+        )
+
+
+def measure(fn, repeat: int = 100) -> tuple[float, float]:
+    """Return (bytes, blocks) allocated per call of *fn*, on average."""
+    fn()  # warm up
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    results = [fn() for _ in range(repeat)]
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    stats = after.compare_to(before, "filename")
+    size = sum(s.size_diff for s in stats)
+    blocks = sum(s.count_diff for s in stats)
+    del results
+    return size / repeat, blocks / repeat
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--skills", type=int, default=10000)
+    parser.add_argument("--hits", type=int, default=20)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        build_tree(root, args.skills, args.hits)
+
+        tracemalloc.start()
+        registry = SkillRegistry(base_path=str(root))
+        retained, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        assert len(registry.search_skills("a common trigger")) == args.hits
+        search_bytes, search_blocks = measure(
+            lambda: registry.search_skills("a common trigger")
+        )
+        list_bytes, list_blocks = measure(registry.list_skills, repeat=5)
+
+    print(f"skills:               {args.skills}")
+    print(f"retained per skill:   {retained / args.skills:10.0f} B")
+    print(f"search ({args.hits} hits):     {search_bytes:10.0f} B  {search_blocks:8.1f} blocks")
+    print(f"list_skills:          {list_bytes:10.0f} B  {list_blocks:8.1f} blocks")
+
+
+if __name__ == "__main__":
+    main()
@@ -7,33 +7,34 @@ be tested without heavy dependencies.
 
 from __future__ import annotations
 
-from typing import Any
+from typing import Any, Generator
 
+Stream = Generator[dict, None, dict]
 
-def _extract_text(params: dict) -> dict:
+
+def _stream_extract_text(params: dict) -> Stream:
     input_path = params.get("input_path", "document.pdf")
     pages = params.get("pages")
     total_pages = 10  # simulated
 
     if pages:
-        page_texts = {
-            p: f"[Extracted text from page {p + 1} of {input_path}]"
-            for p in pages
-            if 0 <= p < total_pages
-        }
+        selected = [p for p in dict.fromkeys(pages) if 0 <= p < total_pages]
     else:
-        page_texts = {
-            p: f"[Extracted text from page {p + 1} of {input_path}]"
-            for p in range(total_pages)
-        }
+        selected = list(range(total_pages))
+
+    texts: list[str] = []
+    for p in selected:
+        text = f"[Extracted text from page {p + 1} of {input_path}]"
+        texts.append(text)
+        yield {"page": p, "text": text}
 
     return {
         "status": "success",
         "operation": "extract_text",
         "input_path": input_path,
         "page_count": total_pages,
-        "text": "\n".join(page_texts.values()),
-        "pages_processed": len(page_texts),
+        "text": "\n".join(texts),
+        "pages_processed": len(texts),
     }
 
 
@@ -98,11 +99,14 @@ def _merge(params: dict) -> dict:
     }
 
 
-def _split(params: dict) -> dict:
+def _stream_split(params: dict) -> Stream:
     input_path = params.get("input_path", "document.pdf")
     output_path = params.get("output_path", "/tmp")
     page_count = 10  # simulated
-    output_files = [f"{output_path}/page_{i + 1}.pdf" for i in range(page_count)]
+    output_files: list[str] = []
+    for i in range(page_count):
+        output_files.append(f"{output_path}/page_{i + 1}.pdf")
+        yield {"page": i, "output_file": output_files[-1]}
     return {
         "status": "success",
         "operation": "split",
@@ -184,12 +188,27 @@ def _fill_form(params: dict) -> dict:
     }
 
 
+def _collect(stream: Stream) -> dict:
+    """Run a streaming operation to completion and return its final result."""
+    while True:
+        try:
+            next(stream)
+        except StopIteration as stop:
+            return stop.value
+
+
+# Operations that can report per-page progress.
+_STREAMING_OPERATIONS: dict[str, Any] = {
+    "extract_text": _stream_extract_text,
+    "split": _stream_split,
+}
+
 _OPERATIONS: dict[str, Any] = {
-    "extract_text": _extract_text,
+    "extract_text": lambda params: _collect(_stream_extract_text(params)),
     "extract_tables": _extract_tables,
     "extract_metadata": _extract_metadata,
     "merge": _merge,
-    "split": _split,
+    "split": lambda params: _collect(_stream_split(params)),
     "rotate": _rotate,
     "create": _create,
     "encrypt": _encrypt,
@@ -218,3 +237,19 @@ def execute(params: dict) -> dict:
             "message": f"Unknown operation: {operation}",
         }
     return handler(params)
+
+
+def execute_stream(params: dict) -> Stream:
+    """Execute a PDF operation, yielding per-page results as they are ready.
+
+    ``extract_text`` yields ``{"page", "text"}`` and ``split`` yields
+    ``{"page", "output_file"}`` chunks; other operations yield nothing.
+
+    Returns
+    -------
+    The same dict :func:`execute` returns.
+    """
+    handler = _STREAMING_OPERATIONS.get(params.get("operation", ""))
+    if handler is None:
+        return execute(params)
+    return (yield from handler(params))
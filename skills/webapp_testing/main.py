@@ -9,7 +9,7 @@ from __future__ import annotations
 
 import os
 from datetime import datetime
-from typing import Any
+from typing import Any, Generator
 
 
 def _simulate_screenshot(path: str | None, url: str) -> dict:
@@ -84,6 +84,21 @@ def execute(params: dict) -> dict:
     -------
     Dict with ``status``, ``results``, ``url``, and ``browser_config``.
     """
+    stream = execute_stream(params)
+    while True:
+        try:
+            next(stream)
+        except StopIteration as stop:
+            return stop.value
+
+
+def execute_stream(params: dict) -> Generator[dict, None, dict]:
+    """Like :func:`execute`, but yield each action's result as it completes.
+
+    Returns
+    -------
+    The same dict :func:`execute` returns.
+    """
     url = params.get("url", "http://localhost:3000")
     actions = params.get("actions", [])
     wait_for_idle = params.get("wait_for_idle", True)
@@ -102,15 +117,18 @@ def execute(params: dict) -> dict:
         action_type = action.get("type", "")
         handler = _ACTION_HANDLERS.get(action_type)
         if handler is None:
-            results.append({
+            result = {
                 "action": action_type,
                 "status": "error",
                 "message": f"Unknown action type: {action_type}",
-            })
+            }
+            results.append(result)
+            yield result
             continue
 
         result = handler(action, url)
         results.append(result)
+        yield result
 
         # Collect console logs separately for easy access
         if action_type == "get_console_logs":
@@ -0,0 +1,220 @@
+"""Cache: small thread-safe caches shared by the registry and executor."""
+
+from __future__ import annotations
+
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Callable, Hashable, NamedTuple, Optional
+
+_MISSING = object()
+
+
+class CacheInfo(NamedTuple):
+    """Hit/miss statistics, in the spirit of :func:`functools.lru_cache`."""
+
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+class LRUCache:
+    """Bounded least-recently-used mapping with hit/miss counters.
+
+    Parameters
+    ----------
+    maxsize:
+        Maximum number of entries; the least recently used entry is evicted
+        first.  ``0`` disables caching (every lookup is a miss).
+    ttl:
+        Optional default lifetime of an entry in seconds.
+    sizeof:
+        Optional function giving the "weight" of a value.  When set,
+        *maxsize* bounds the total weight instead of the entry count.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 128,
+        ttl: Optional[float] = None,
+        sizeof: Optional[Callable[[Any], int]] = None,
+    ) -> None:
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._sizeof = sizeof
+        # key -> (value, expires_at | None, weight)
+        self._data: OrderedDict[Hashable, tuple[Any, Optional[float], int]] = OrderedDict()
+        self._weight = 0
+        self._hits = 0
+        self._misses = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Return the cached value for *key* (counting a hit), else *default*."""
+        with self._lock:
+            item = self._data.get(key, _MISSING)
+            if item is not _MISSING:
+                value, expires_at, weight = item
+                if expires_at is None or expires_at > time.monotonic():
+                    self._data.move_to_end(key)
+                    self._hits += 1
+                    return value
+                del self._data[key]
+                self._weight -= weight
+            self._misses += 1
+            return default
+
+    def put(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        """Store *value* under *key*, evicting least recently used entries."""
+        weight = self._sizeof(value) if self._sizeof else 1
+        if self.maxsize <= 0 or weight > self.maxsize:
+            return
+        lifetime = ttl if ttl is not None else self.ttl
+        expires_at = time.monotonic() + lifetime if lifetime is not None else None
+        with self._lock:
+            old = self._data.pop(key, None)
+            if old is not None:
+                self._weight -= old[2]
+            self._data[key] = (value, expires_at, weight)
+            self._weight += weight
+            while self._weight > self.maxsize:
+                _, (_, _, evicted) = self._data.popitem(last=False)
+                self._weight -= evicted
+
+    def pop(self, key: Hashable, default: Any = None) -> Any:
+        """Remove *key* and return its value, or *default* if absent."""
+        with self._lock:
+            item = self._data.pop(key, None)
+            if item is None:
+                return default
+            self._weight -= item[2]
+            return item[0]
+
+    def clear(self) -> None:
+        """Drop every entry; the hit/miss counters are kept."""
+        with self._lock:
+            self._data.clear()
+            self._weight = 0
+
+    def info(self) -> CacheInfo:
+        with self._lock:
+            return CacheInfo(self._hits, self._misses, self.maxsize, len(self._data))
+
+
+class SQLiteCache:
+    """Persistent key/value cache backed by a single SQLite file.
+
+    Values are stored as text (callers serialise them, typically as JSON).
+    The database runs in WAL mode, so several processes (e.g. Streamlit
+    workers) can share one file.  Entries expire after their TTL, and the
+    least recently written entries are pruned once *max_entries* is exceeded.
+
+    Parameters
+    ----------
+    path:
+        Location of the SQLite database file; parent directories are created.
+    max_entries:
+        Upper bound on the number of stored entries.
+    ttl:
+        Optional default lifetime of an entry in seconds.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        max_entries: int = 10_000,
+        ttl: Optional[float] = None,
+    ) -> None:
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self.path = path
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._hits = 0
+        self._misses = 0
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, timeout=30, check_same_thread=False)
+        with self._lock, self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS cache ("
+                " key TEXT PRIMARY KEY,"
+                " value TEXT NOT NULL,"
+                " expires_at REAL,"
+                " written_at REAL NOT NULL)"
+            )
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS cache_written_at ON cache (written_at)"
+            )
+
+    def get(self, key: str, default: Any = None, *, with_expiry: bool = False) -> Any:
+        """Return the stored value for *key*, else *default*.
+
+        With *with_expiry* a hit is returned as ``(value, expires_at)``,
+        where ``expires_at`` is a :func:`time.time` timestamp or ``None``, so
+        callers copying the entry elsewhere can keep its remaining lifetime.
+        """
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value, expires_at FROM cache WHERE key = ?", (key,)
+            ).fetchone()
+            if row is not None and (row[1] is None or row[1] > now):
+                self._hits += 1
+                return (row[0], row[1]) if with_expiry else row[0]
+            self._misses += 1
+            return default
+
+    @staticmethod
+    def remaining_ttl(expires_at: Optional[float]) -> Optional[float]:
+        """Seconds left until *expires_at* (``None``: never expires)."""
+        if expires_at is None:
+            return None
+        return max(0.0, expires_at - time.time())
+
+    def put(self, key: str, value: str, ttl: Optional[float] = None) -> None:
+        if self.max_entries <= 0:
+            return
+        now = time.time()
+        lifetime = ttl if ttl is not None else self.ttl
+        expires_at = now + lifetime if lifetime is not None else None
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO cache (key, value, expires_at, written_at)"
+                " VALUES (?, ?, ?, ?)",
+                (key, value, expires_at, now),
+            )
+            self._conn.execute(
+                "DELETE FROM cache WHERE expires_at IS NOT NULL AND expires_at <= ?",
+                (now,),
+            )
+            self._conn.execute(
+                "DELETE FROM cache WHERE key IN ("
+                " SELECT key FROM cache ORDER BY written_at DESC LIMIT -1 OFFSET ?)",
+                (self.max_entries,),
+            )
+
+    def clear(self) -> None:
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM cache")
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM cache").fetchone()[0]
+
+    def info(self) -> CacheInfo:
+        return CacheInfo(self._hits, self._misses, self.max_entries, len(self))
@@ -0,0 +1,115 @@
+"""LLM Cache: memoizes deterministic chat completions across requests."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+from typing import Any, Callable, Optional, Sequence
+
+from langchain_core.messages import AIMessage, BaseMessage
+
+from .cache import CacheInfo, LRUCache, SQLiteCache
+
+# Chat model attributes that change what a prompt produces.
+_MODEL_FIELDS = ("deployment_name", "model_name", "temperature", "max_tokens")
+
+
+class LLMResponseCache:
+    """Two-tier cache of chat completion texts.
+
+    The key hashes the model's identity (deployment, model name, sampling
+    settings) together with the full prompt.  The routing and params prompts
+    embed the skill list and the skill's documentation and schema, so editing
+    a skill changes the key and stale answers are never served.  Only calls
+    to models with an explicit ``temperature == 0`` are cached; an unset
+    temperature means the service default, which samples.
+
+    Parameters
+    ----------
+    maxsize:
+        Number of responses kept in the in-process LRU tier.
+    ttl:
+        Lifetime of a cached response in seconds (both tiers); ``None``
+        means no expiry.
+    path:
+        Optional SQLite file used as a persistent second tier, shareable
+        between processes (e.g. Streamlit workers).
+    max_entries:
+        Size limit of the SQLite tier.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 512,
+        ttl: Optional[float] = 3600.0,
+        path: Optional[str] = None,
+        max_entries: int = 10_000,
+    ) -> None:
+        self._memory = LRUCache(maxsize=maxsize, ttl=ttl)
+        self._disk = SQLiteCache(path, max_entries=max_entries, ttl=ttl) if path else None
+
+    def invoke(
+        self,
+        llm: Any,
+        messages: Sequence[BaseMessage],
+        validate: Optional[Callable[[str], bool]] = None,
+    ) -> AIMessage:
+        """Return ``llm.invoke(messages)``, answering repeats from the cache.
+
+        A fresh reply is stored only if *validate* (when given) accepts its
+        text, so a malformed completion is retried on the next call rather
+        than served for the whole TTL.
+        """
+        key = self._key(llm, messages)
+        if key is None:
+            return llm.invoke(messages)
+        content = self._memory.get(key)
+        if content is None and self._disk is not None:
+            hit = self._disk.get(key, with_expiry=True)
+            if hit is not None:
+                content, expires_at = hit
+                self._memory.put(key, content, ttl=SQLiteCache.remaining_ttl(expires_at))
+        if content is not None:
+            return AIMessage(content=content)
+
+        response = llm.invoke(messages)
+        if isinstance(response.content, str) and (
+            validate is None or validate(response.content)
+        ):
+            self._memory.put(key, response.content)
+            if self._disk is not None:
+                self._disk.put(key, response.content)
+        return response
+
+    def info(self) -> dict[str, Optional[CacheInfo]]:
+        """Return hit/miss statistics of the memory and disk tiers.
+
+        A disk hit is also counted as a memory miss.
+        """
+        return {
+            "memory": self._memory.info(),
+            "disk": self._disk.info() if self._disk else None,
+        }
+
+    def clear(self) -> None:
+        """Drop every cached response from both tiers."""
+        self._memory.clear()
+        if self._disk is not None:
+            self._disk.clear()
+
+    @staticmethod
+    def _key(llm: Any, messages: Sequence[BaseMessage]) -> Optional[str]:
+        """Return the cache key, or ``None`` if the call is not deterministic."""
+        temperature = getattr(llm, "temperature", None)
+        if not isinstance(temperature, (int, float)) or temperature != 0:
+            return None
+        model = {name: getattr(llm, name, None) for name in _MODEL_FIELDS}
+        prompt = [(message.type, message.content) for message in messages]
+        canonical = json.dumps(
+            [type(llm).__name__, model, prompt],
+            sort_keys=True,
+            separators=(",", ":"),
+            ensure_ascii=False,
+            default=str,
+        )
+        return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
@@ -0,0 +1,124 @@
+"""LLM Provider: process-wide chat clients sharing pooled HTTP connections."""
+
+from __future__ import annotations
+
+import threading
+from dataclasses import dataclass
+from typing import Any, Callable, Optional
+
+import httpx
+from langchain_openai import AzureChatOpenAI
+
+DEFAULT_ROLE = "default"
+
+
+@dataclass(frozen=True)
+class LLMSettings:
+    """Model settings for one node role (``select``, ``params``, ``respond``).
+
+    ``None`` fields are left to :class:`AzureChatOpenAI`'s own defaults
+    (typically the ``AZURE_OPENAI_*`` environment variables).
+    """
+
+    azure_deployment: Optional[str] = None
+    temperature: float = 0.0
+    max_tokens: Optional[int] = None
+    timeout: Optional[float] = None
+    max_retries: Optional[int] = None
+
+
+class LLMProvider:
+    """Hands out chat clients that share one pooled, keep-alive HTTP client.
+
+    Clients are created on first use and cached per distinct
+    :class:`LLMSettings`, so roles with identical settings share a client
+    and every client reuses the same connection pool.  Instances are
+    thread-safe.
+
+    Parameters
+    ----------
+    roles:
+        Per-role settings; roles without an entry use the ``"default"`` one
+        (or ``LLMSettings()``).
+    max_connections, max_keepalive_connections, keepalive_expiry:
+        Limits of the shared :class:`httpx.Client` connection pool;
+        idle connections are kept open for *keepalive_expiry* seconds.
+    client_factory:
+        Builds a chat client from ``(settings, http_client)``.  Defaults to
+        :class:`AzureChatOpenAI`; tests and benchmarks may substitute their
+        own.
+    """
+
+    def __init__(
+        self,
+        roles: Optional[dict[str, LLMSettings]] = None,
+        max_connections: int = 20,
+        max_keepalive_connections: int = 10,
+        keepalive_expiry: float = 30.0,
+        client_factory: Optional[Callable[[LLMSettings, httpx.Client], Any]] = None,
+    ) -> None:
+        self.roles = dict(roles or {})
+        self.limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+        )
+        self._client_factory = client_factory or _azure_chat_client
+        self._http_client: Optional[httpx.Client] = None
+        self._clients: dict[LLMSettings, Any] = {}
+        self._lock = threading.Lock()
+
+    def settings_for(self, role: str) -> LLMSettings:
+        """Return the settings used for *role*."""
+        settings = self.roles.get(role) or self.roles.get(DEFAULT_ROLE)
+        return settings if settings is not None else LLMSettings()
+
+    def get(self, role: str = DEFAULT_ROLE) -> Any:
+        """Return the (shared) chat client for *role*."""
+        settings = self.settings_for(role)
+        client = self._clients.get(settings)
+        if client is not None:
+            return client
+        with self._lock:
+            client = self._clients.get(settings)
+            if client is None:
+                if self._http_client is None:
+                    self._http_client = httpx.Client(limits=self.limits)
+                client = self._client_factory(settings, self._http_client)
+                self._clients[settings] = client
+            return client
+
+    def close(self) -> None:
+        """Drop cached clients and close the pooled connections."""
+        with self._lock:
+            http_client, self._http_client = self._http_client, None
+            self._clients.clear()
+        if http_client is not None:
+            http_client.close()
+
+
+def _azure_chat_client(settings: LLMSettings, http_client: httpx.Client) -> AzureChatOpenAI:
+    kwargs: dict[str, Any] = {"temperature": settings.temperature, "http_client": http_client}
+    if settings.azure_deployment is not None:
+        kwargs["azure_deployment"] = settings.azure_deployment
+    if settings.max_tokens is not None:
+        kwargs["max_tokens"] = settings.max_tokens
+    if settings.timeout is not None:
+        kwargs["timeout"] = settings.timeout
+    if settings.max_retries is not None:
+        kwargs["max_retries"] = settings.max_retries
+    return AzureChatOpenAI(**kwargs)
+
+
+_default_provider: Optional[LLMProvider] = None
+_default_lock = threading.Lock()
+
+
+def get_default_provider() -> LLMProvider:
+    """Return the process-wide provider used when none is injected."""
+    global _default_provider
+    if _default_provider is None:
+        with _default_lock:
+            if _default_provider is None:
+                _default_provider = LLMProvider()
+    return _default_provider
@@ -4,12 +4,21 @@ from __future__ import annotations
 
 import json
 import logging
-from typing import Any, Optional
+import threading
+from typing import Any, Callable, Optional
 
 from langchain_openai import AzureChatOpenAI
 from langchain_core.messages import AIMessage, BaseMessage, HumanMessage, SystemMessage
+from langchain_core.runnables.config import ContextThreadPoolExecutor
 from typing_extensions import TypedDict
 
+try:
+    from langgraph.config import get_stream_writer
+except ImportError:  # langgraph < 0.3 has no custom stream mode
+    get_stream_writer = None
+
+from .llm_cache import LLMResponseCache
+from .llm_provider import LLMProvider, get_default_provider
 from .skill_executor import SkillExecutor
 from .skill_registry import SkillRegistry
 
@@ -33,8 +42,42 @@ class GraphState(TypedDict):
 # Shared helpers
 # ------------------------------------------------------------------
 
-def _get_llm() -> AzureChatOpenAI:
-    return AzureChatOpenAI(temperature=0)
+def _get_llm(role: str = "default", provider: Optional[LLMProvider] = None) -> AzureChatOpenAI:
+    """Return the shared chat client for *role* (``select``, ``params``,
+    ``respond``) from *provider*, or from the process-wide default one."""
+    return (provider or get_default_provider()).get(role)
+
+
+def _invoke(
+    llm: AzureChatOpenAI,
+    cache: Optional[LLMResponseCache],
+    messages: list[BaseMessage],
+    expect: type,
+) -> BaseMessage:
+    """``llm.invoke(messages)``, served from *cache* when one is given.
+
+    Only replies that parse as a JSON value of type *expect* are cached.
+    """
+    if cache is None:
+        return llm.invoke(messages)
+    return cache.invoke(llm, messages, validate=lambda text: _parses_as(text, expect))
+
+
+def _parses_as(text: str, expect: type) -> bool:
+    try:
+        return isinstance(json.loads(text), expect)
+    except (json.JSONDecodeError, TypeError):
+        return False
+
+
+def _stream_writer() -> Optional[Callable[[Any], None]]:
+    """Return LangGraph's custom stream writer, or ``None`` outside a run."""
+    if get_stream_writer is None:
+        return None
+    try:
+        return get_stream_writer()
+    except RuntimeError:
+        return None
 
 
 def _last_human_query(messages: list[BaseMessage]) -> str:
@@ -49,10 +92,110 @@ def _last_human_query(messages: list[BaseMessage]) -> str:
 # Node: analyze_query
 # ------------------------------------------------------------------
 
-def analyze_query(state: GraphState, *, registry: SkillRegistry) -> dict[str, Any]:
-    """Inspect the latest user message and search for matching skills."""
+class RoutingStats:
+    """Thread-safe counters of how ``analyze_query`` routed each request.
+
+    ``fast_path`` counts requests sent straight to ``load_skill_context``,
+    ``llm_routed`` those handed to ``select_skills`` and ``no_match`` those
+    with no candidate skill.
+    """
+
+    def __init__(self) -> None:
+        self._counts = {"fast_path": 0, "llm_routed": 0, "no_match": 0}
+        self._lock = threading.Lock()
+
+    def record(self, outcome: str) -> None:
+        with self._lock:
+            self._counts[outcome] += 1
+
+    def snapshot(self) -> dict[str, int]:
+        with self._lock:
+            return dict(self._counts)
+
+    @property
+    def fast_path_rate(self) -> float:
+        """Share of requests with a candidate skill that took the fast path."""
+        counts = self.snapshot()
+        total = counts["fast_path"] + counts["llm_routed"]
+        return counts["fast_path"] / total if total else 0.0
+
+
+def match_confidence(available: list[dict]) -> float:
+    """Return how clearly the best candidate skill beats the others.
+
+    ``1.0`` for a single candidate and ``0.0`` for none.  For scored
+    (ranked or fuzzy) results it is the top score's share of the top two,
+    so it approaches ``1.0`` as the best skill dominates the runner-up.
+    Several unscored trigger matches are indistinguishable, so they score
+    ``0.0`` and a tie goes to the router at any positive threshold.
+    """
+    if not available:
+        return 0.0
+    if len(available) == 1:
+        return 1.0
+    first, second = available[0].get("score"), available[1].get("score")
+    if first is None or second is None:
+        return 0.0
+    total = first + second
+    return first / total if total > 0 else 0.5
+
+
+def analyze_query(
+    state: GraphState,
+    *,
+    registry: SkillRegistry,
+    top_k: Optional[int] = None,
+    min_score: float = 0.0,
+    fuzzy_threshold: Optional[float] = None,
+    fast_path_threshold: Optional[float] = None,
+    stats: Optional[RoutingStats] = None,
+) -> dict[str, Any]:
+    """Inspect the latest user message and search for matching skills.
+
+    When *top_k* is given the registry's ranked (BM25) search is used and
+    only the *top_k* best-scoring skills above *min_score* are offered to the
+    router, keeping the ``select_skills`` prompt small.  Otherwise trigger
+    matching is used, falling back to fuzzy n-gram matching above
+    *fuzzy_threshold* (if set) when no trigger matches.
+
+    If *fast_path_threshold* is set and the :func:`match_confidence` of the
+    candidates reaches it, the best skill is selected directly and the
+    ``select_skills`` LLM call is skipped.  The confidence is measured
+    against the runner-up even when *top_k* truncates it away, and fuzzy
+    matches never take the fast path.  Routing outcomes are counted in
+    *stats* when given.
+    """
     query = _last_human_query(state["messages"])
-    available = registry.search_skills(query)
+    if top_k is not None:
+        # Always fetch a runner-up: a lone survivor of the truncation would
+        # otherwise look like a certain match.
+        ranked = registry.search_skills(
+            query, ranked=True, top_k=max(top_k, 2), min_score=min_score
+        )
+        confidence = match_confidence(ranked)
+        available = ranked[:top_k]
+    else:
+        available = registry.search_skills(query, fuzzy_threshold=fuzzy_threshold)
+        # Scored results here come from the fuzzy fallback: no trigger
+        # matched, which is too weak to skip the router.
+        fuzzy = bool(available) and "score" in available[0]
+        confidence = 0.0 if fuzzy else match_confidence(available)
+
+    if not available:
+        outcome = "no_match"
+    elif fast_path_threshold is not None and confidence >= fast_path_threshold:
+        outcome = "fast_path"
+    else:
+        outcome = "llm_routed"
+    if stats is not None:
+        stats.record(outcome)
+
+    if outcome == "fast_path":
+        return {
+            "available_skills": available,
+            "selected_skills": [available[0]["name"]],
+            "next_action": "load_skill_context",
+        }
     next_action = "select_skills" if available else "respond"
     return {
         "available_skills": available,
@@ -71,18 +214,27 @@ strings, e.g. ["report_generator"].  If none are appropriate, return [].
 Do NOT include any other text, only the JSON array."""
 
 
-def select_skills(state: GraphState) -> dict[str, Any]:
-    """Ask the LLM to pick the most relevant skill(s)."""
+def select_skills(
+    state: GraphState,
+    *,
+    llm_provider: Optional[LLMProvider] = None,
+    llm_cache: Optional[LLMResponseCache] = None,
+) -> dict[str, Any]:
+    """Ask the LLM to pick the most relevant skill(s).
+
+    With *llm_cache*, a repeated query against the same skill set is
+    answered without calling the model.
+    """
     query = _last_human_query(state["messages"])
     skills_desc = json.dumps(state["available_skills"], indent=2)
 
-    llm = _get_llm()
-    response = llm.invoke([
+    llm = _get_llm("select", llm_provider)
+    response = _invoke(llm, llm_cache, [
         SystemMessage(content=_SELECT_SYSTEM),
         HumanMessage(
             content=f"User query: {query}\n\nAvailable skills:\n{skills_desc}"
         ),
-    ])
+    ], expect=list)
 
     try:
         selected = json.loads(response.content)
@@ -123,49 +275,165 @@ You are a skill parameter extractor.  Given the skill documentation, its JSON
 schema (if any), and the user's request, produce ONLY a JSON object with the
 parameters needed to call the skill.  Do NOT include any other text."""
 
+_BATCH_PARAMS_SYSTEM = """\
+You are a skill parameter extractor.  Given the user's request and the
+documentation and JSON schema (if any) of several skills, produce ONLY a JSON
+object with one key per skill name, whose value is the JSON object of
+parameters needed to call that skill.  Do NOT include any other text."""
+
 
 def execute_skills(
     state: GraphState,
     *,
     executor: SkillExecutor,
+    max_concurrency: int = 4,
+    batch_params: bool = False,
+    llm_provider: Optional[LLMProvider] = None,
+    llm_cache: Optional[LLMResponseCache] = None,
 ) -> dict[str, Any]:
-    """For each selected skill, let the LLM produce params then execute."""
+    """For each selected skill, let the LLM produce params then execute.
+
+    Skills are processed concurrently on up to *max_concurrency* threads
+    (each doing its own params call and execution), so latency approaches
+    that of the slowest skill rather than the sum.  Results are merged in
+    selection order.
+
+    With *batch_params*, the params of all selected skills are requested in
+    one LLM call returning a JSON object keyed by skill name; skills missing
+    from (or malformed in) that response fall back to their own call.
+    Params replies are served from *llm_cache* when one is given.
+
+    Partial results of streaming skills are forwarded as
+    ``{"skill": name, "chunk": ...}`` to LangGraph's ``"custom"`` stream
+    mode as they arrive; the node's own output only carries final results.
+    """
     query = _last_human_query(state["messages"])
-    results: dict[str, Any] = {}
-    llm = _get_llm()
+    llm = _get_llm("params", llm_provider)
+    writer = _stream_writer()
+    skill_names = state["selected_skills"]
+    contexts = state["skill_contexts"]
+
+    batched: dict[str, dict] = {}
+    if batch_params and len(skill_names) > 1:
+        batched = _extract_params_batch(llm, llm_cache, skill_names, contexts, query)
+
+    def _run(skill_name: str) -> Any:
+        params = batched.get(skill_name)
+        if params is None:
+            params = _extract_params(
+                llm, llm_cache, skill_name, contexts.get(skill_name, {}), query
+            )
+        return _execute_one(executor, skill_name, params, writer)
 
-    for skill_name in state["selected_skills"]:
-        ctx = state["skill_contexts"].get(skill_name, {})
-        skill_doc = ctx.get("skill_doc") or "(no documentation)"
-        schema = json.dumps(ctx.get("schema")) if ctx.get("schema") else "(no schema)"
-
-        # Ask LLM to produce execution parameters
-        response = llm.invoke([
-            SystemMessage(content=_PARAMS_SYSTEM),
-            HumanMessage(
-                content=(
-                    f"User request: {query}\n\n"
-                    f"Skill documentation:\n{skill_doc}\n\n"
-                    f"Parameter schema:\n{schema}"
-                )
-            ),
-        ])
-
-        try:
-            params = json.loads(response.content)
-        except (json.JSONDecodeError, TypeError):
-            logger.warning("Could not parse params for %s: %s", skill_name, response.content)
-            params = {}
-
-        result = executor.execute_skill(skill_name, params)
-        results[skill_name] = result
+    workers = max(1, min(max_concurrency, len(skill_names)))
+    if workers == 1:
+        outputs = [_run(name) for name in skill_names]
+    else:
+        # Copies the run's context into each thread, so LangGraph's stream
+        # writer and LangChain callbacks keep working there.
+        with ContextThreadPoolExecutor(max_workers=workers) as pool:
+            outputs = list(pool.map(_run, skill_names))
 
     return {
-        "execution_results": results,
+        "execution_results": dict(zip(skill_names, outputs)),
         "next_action": "respond",
     }
 
 
+def _describe_skill(ctx: dict) -> tuple[str, str]:
+    """Return the documentation and schema text shown to the LLM."""
+    skill_doc = ctx.get("skill_doc") or "(no documentation)"
+    schema = json.dumps(ctx.get("schema")) if ctx.get("schema") else "(no schema)"
+    return skill_doc, schema
+
+
+def _extract_params(
+    llm: AzureChatOpenAI,
+    llm_cache: Optional[LLMResponseCache],
+    skill_name: str,
+    ctx: dict,
+    query: str,
+) -> dict:
+    """Ask the LLM for one skill's params; ``{}`` if the reply is not JSON."""
+    skill_doc, schema = _describe_skill(ctx)
+    response = _invoke(llm, llm_cache, [
+        SystemMessage(content=_PARAMS_SYSTEM),
+        HumanMessage(
+            content=(
+                f"User request: {query}\n\n"
+                f"Skill documentation:\n{skill_doc}\n\n"
+                f"Parameter schema:\n{schema}"
+            )
+        ),
+    ], expect=dict)
+
+    try:
+        return json.loads(response.content)
+    except (json.JSONDecodeError, TypeError):
+        logger.warning("Could not parse params for %s: %s", skill_name, response.content)
+        return {}
+
+
+def _extract_params_batch(
+    llm: AzureChatOpenAI,
+    llm_cache: Optional[LLMResponseCache],
+    skill_names: list[str],
+    contexts: dict,
+    query: str,
+) -> dict[str, dict]:
+    """Ask the LLM for every skill's params at once.
+
+    Returns the params of each skill the reply covers with a JSON object;
+    an unparseable reply yields ``{}`` so every skill falls back.
+    """
+    sections = []
+    for skill_name in skill_names:
+        skill_doc, schema = _describe_skill(contexts.get(skill_name, {}))
+        sections.append(
+            f"## Skill: {skill_name}\n\n"
+            f"Skill documentation:\n{skill_doc}\n\n"
+            f"Parameter schema:\n{schema}"
+        )
+    response = _invoke(llm, llm_cache, [
+        SystemMessage(content=_BATCH_PARAMS_SYSTEM),
+        HumanMessage(content=f"User request: {query}\n\n" + "\n\n".join(sections)),
+    ], expect=dict)
+
+    try:
+        parsed = json.loads(response.content)
+    except (json.JSONDecodeError, TypeError):
+        logger.warning("Could not parse batched params: %s", response.content)
+        return {}
+    if not isinstance(parsed, dict):
+        logger.warning("Batched params are not a JSON object: %s", response.content)
+        return {}
+    batched = {
+        name: parsed[name] for name in skill_names if isinstance(parsed.get(name), dict)
+    }
+    missing = [name for name in skill_names if name not in batched]
+    if missing:
+        logger.warning("Batched params missing for %s; extracting individually", missing)
+    return batched
+
+
+def _execute_one(
+    executor: SkillExecutor,
+    skill_name: str,
+    params: dict,
+    writer: Optional[Callable[[Any], None]],
+) -> Any:
+    """Execute a skill, forwarding streamed chunks to *writer* if given."""
+    if writer is None:
+        return executor.execute_skill(skill_name, params)
+    result = None
+    for event in executor.stream_skill(skill_name, params):
+        if event["event"] == "chunk":
+            writer({"skill": skill_name, "chunk": event["data"]})
+        else:
+            result = event["data"]
+    return result
+
+
 # ------------------------------------------------------------------
 # Node: respond
 # ------------------------------------------------------------------
@@ -176,7 +444,11 @@ craft a clear, informative response to the user's request.  If no skills were
 executed, answer the query directly using your own knowledge."""
 
 
-def respond(state: GraphState) -> dict[str, Any]:
+def respond(
+    state: GraphState,
+    *,
+    llm_provider: Optional[LLMProvider] = None,
+) -> dict[str, Any]:
     """Generate a final natural-language response."""
     query = _last_human_query(state["messages"])
     exec_results = state.get("execution_results") or {}
@@ -190,7 +462,7 @@ def respond(state: GraphState) -> dict[str, Any]:
 
     context_block = "\n\n".join(context_parts) if context_parts else "(no skill results)"
 
-    llm = _get_llm()
+    llm = _get_llm("respond", llm_provider)
     response = llm.invoke([
         SystemMessage(content=_RESPOND_SYSTEM),
         HumanMessage(
@@ -0,0 +1,294 @@
+"""Param Validation: compiles skill ``schema.json`` files into validators.
+
+A schema is turned, once, into a tree of small closures that check (and
+where unambiguous, coerce) the params an LLM produced before they reach a
+skill's ``execute()``.  Only the JSON Schema subset the skills use is
+interpreted: ``type`` (a name or a list of names), ``properties``,
+``required``, ``additionalProperties`` (boolean), ``enum``, ``items``,
+``minimum``/``maximum`` and ``minLength``/``maxLength``.  Any other keyword,
+and any of these with a value of the wrong shape (e.g. ``properties`` given
+as a list), is ignored, so an unusual schema degrades to a looser check
+rather than rejecting valid calls.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Callable
+
+Validator = Callable[[Any, str], Any]
+
+_TRUE_STRINGS = frozenset({"true", "yes", "1"})
+_FALSE_STRINGS = frozenset({"false", "no", "0"})
+
+
+class ParamValidationError(ValueError):
+    """Params do not match a skill's schema.
+
+    Attributes
+    ----------
+    path:
+        Location of the offending value, e.g. ``"actions[1].type"``; empty
+        for the params object itself.
+    """
+
+    def __init__(self, path: str, message: str) -> None:
+        self.path = path
+        super().__init__(f"{path}: {message}" if path else message)
+
+
+def compile_schema(schema: dict) -> Callable[[Any], Any]:
+    """Compile *schema* into a function returning the validated params.
+
+    The returned function raises :class:`ParamValidationError` on the first
+    mismatch.  Values that can be converted losslessly — numeric strings for
+    ``integer``/``number``, ``"true"``/``"false"`` for ``boolean``, integral
+    floats for ``integer`` — are coerced; the input is never mutated, a
+    coerced copy is returned instead.
+    """
+    check = _compile(schema)
+
+    def validate(params: Any) -> Any:
+        return check(params, "")
+
+    return validate
+
+
+# ----------------------------------------------------------------------
+# Compilation
+# ----------------------------------------------------------------------
+
+def _compile(schema: Any) -> Validator:
+    if not isinstance(schema, dict):
+        return _accept
+
+    checks: list[Validator] = []
+    types = schema.get("type")
+    if isinstance(types, str):
+        checks.append(_compile_type([types]))
+    elif isinstance(types, list):
+        checks.append(_compile_type([name for name in types if isinstance(name, str)]))
+    if isinstance(schema.get("enum"), list):
+        checks.append(_compile_enum(schema["enum"]))
+    if "properties" in schema or "required" in schema or "additionalProperties" in schema:
+        checks.append(_compile_object(schema))
+    if "items" in schema:
+        checks.append(_compile_items(schema["items"]))
+    minimum, maximum = _bound(schema, "minimum"), _bound(schema, "maximum")
+    if minimum is not None or maximum is not None:
+        checks.append(_compile_range(minimum, maximum))
+    min_length, max_length = _bound(schema, "minLength"), _bound(schema, "maxLength")
+    if min_length is not None or max_length is not None:
+        checks.append(_compile_length(min_length, max_length))
+
+    if not checks:
+        return _accept
+    if len(checks) == 1:
+        return checks[0]
+
+    def check_all(value: Any, path: str) -> Any:
+        for check in checks:
+            value = check(value, path)
+        return value
+
+    return check_all
+
+
+def _accept(value: Any, path: str) -> Any:
+    return value
+
+
+def _bound(schema: dict, keyword: str) -> Any:
+    """Return a numeric bound from *schema*, or ``None`` if absent or not a number."""
+    value = schema.get(keyword)
+    return value if _is_number(value) else None
+
+
+def _compile_type(names: list[str]) -> Validator:
+    converters = [_TYPE_CONVERTERS[name] for name in names if name in _TYPE_CONVERTERS]
+    if not converters:
+        return _accept
+    expected = " or ".join(names)
+
+    def check_type(value: Any, path: str) -> Any:
+        # Exact matches first, so a ["string", "integer"] union keeps "5".
+        for matches, _ in converters:
+            if matches(value):
+                return value
+        for _, coerce in converters:
+            converted = coerce(value)
+            if converted is not _NO_COERCION:
+                return converted
+        raise ParamValidationError(path, f"expected {expected}, got {_type_name(value)}")
+
+    return check_type
+
+
+def _compile_enum(options: list) -> Validator:
+    allowed = list(options)
+
+    def check_enum(value: Any, path: str) -> Any:
+        if value not in allowed:
+            raise ParamValidationError(
+                path, f"{value!r} is not one of {', '.join(map(repr, allowed))}"
+            )
+        return value
+
+    return check_enum
+
+
+def _compile_object(schema: dict) -> Validator:
+    declared = schema.get("properties")
+    properties = {
+        name: _compile(sub)
+        for name, sub in (declared.items() if isinstance(declared, dict) else ())
+    }
+    listed = schema.get("required")
+    required = tuple(
+        name for name in (listed if isinstance(listed, list) else ())
+        if isinstance(name, str)
+    )
+    closed = schema.get("additionalProperties") is False
+
+    def check_object(value: Any, path: str) -> Any:
+        if not isinstance(value, dict):
+            return value  # a "type" check, if any, reports this
+        for name in required:
+            if name not in value:
+                raise ParamValidationError(path, f"missing required property {name!r}")
+        result = value
+        for name, item in value.items():
+            check = properties.get(name)
+            if check is None:
+                if closed:
+                    raise ParamValidationError(path, f"unexpected property {name!r}")
+                continue
+            checked = check(item, f"{path}.{name}" if path else name)
+            if checked is not item:
+                if result is value:
+                    result = dict(value)
+                result[name] = checked
+        return result
+
+    return check_object
+
+
+def _compile_items(schema: Any) -> Validator:
+    check_item = _compile(schema)
+
+    def check_items(value: Any, path: str) -> Any:
+        if not isinstance(value, list):
+            return value
+        result = value
+        for index, item in enumerate(value):
+            checked = check_item(item, f"{path}[{index}]")
+            if checked is not item:
+                if result is value:
+                    result = list(value)
+                result[index] = checked
+        return result
+
+    return check_items
+
+
+def _compile_range(minimum: Any, maximum: Any) -> Validator:
+    def check_range(value: Any, path: str) -> Any:
+        if not isinstance(value, (int, float)) or isinstance(value, bool):
+            return value
+        if minimum is not None and value < minimum:
+            raise ParamValidationError(path, f"{value} is less than the minimum {minimum}")
+        if maximum is not None and value > maximum:
+            raise ParamValidationError(path, f"{value} is greater than the maximum {maximum}")
+        return value
+
+    return check_range
+
+
+def _compile_length(min_length: Any, max_length: Any) -> Validator:
+    def check_length(value: Any, path: str) -> Any:
+        if not isinstance(value, str):
+            return value
+        if min_length is not None and len(value) < min_length:
+            raise ParamValidationError(path, f"shorter than {min_length} characters")
+        if max_length is not None and len(value) > max_length:
+            raise ParamValidationError(path, f"longer than {max_length} characters")
+        return value
+
+    return check_length
+
+
+# ----------------------------------------------------------------------
+# Type checks and coercions
+# ----------------------------------------------------------------------
+
+_NO_COERCION = object()
+
+
+def _is_integer(value: Any) -> bool:
+    return isinstance(value, int) and not isinstance(value, bool)
+
+
+def _is_number(value: Any) -> bool:
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def _to_integer(value: Any) -> Any:
+    if isinstance(value, float) and value.is_integer():
+        return int(value)
+    if isinstance(value, str):
+        try:
+            return int(value.strip())
+        except ValueError:
+            pass
+    return _NO_COERCION
+
+
+def _to_number(value: Any) -> Any:
+    if isinstance(value, str):
+        try:
+            return float(value.strip())
+        except ValueError:
+            pass
+    return _NO_COERCION
+
+
+def _to_boolean(value: Any) -> Any:
+    if isinstance(value, str):
+        lowered = value.strip().lower()
+        if lowered in _TRUE_STRINGS:
+            return True
+        if lowered in _FALSE_STRINGS:
+            return False
+    return _NO_COERCION
+
+
+def _never(value: Any) -> Any:
+    return _NO_COERCION
+
+
+_TYPE_CONVERTERS: dict[str, tuple[Callable[[Any], bool], Callable[[Any], Any]]] = {
+    "string": (lambda v: isinstance(v, str), _never),
+    "integer": (_is_integer, _to_integer),
+    "number": (_is_number, _to_number),
+    "boolean": (lambda v: isinstance(v, bool), _to_boolean),
+    "object": (lambda v: isinstance(v, dict), _never),
+    "array": (lambda v: isinstance(v, list), _never),
+    "null": (lambda v: v is None, _never),
+}
+
+
+def _type_name(value: Any) -> str:
+    if value is None:
+        return "null"
+    if isinstance(value, bool):
+        return "boolean"
+    if isinstance(value, int):
+        return "integer"
+    if isinstance(value, float):
+        return "number"
+    if isinstance(value, str):
+        return "string"
+    if isinstance(value, list):
+        return "array"
+    if isinstance(value, dict):
+        return "object"
+    return type(value).__name__
@@ -2,29 +2,198 @@
 
 from __future__ import annotations
 
+import asyncio
+import hashlib
 import importlib.util
+import inspect
 import json
 import logging
+import multiprocessing
+import os
+import threading
+import time
+import weakref
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures import wait as wait_futures
+from concurrent.futures.process import BrokenProcessPool
 from pathlib import Path
-from typing import Any, Optional
+from types import ModuleType
+from typing import Any, Callable, Iterable, Iterator, Optional
 
+from .cache import CacheInfo, LRUCache, SQLiteCache
+from .param_validation import ParamValidationError, compile_schema
 from .skill_registry import SkillMeta, SkillRegistry
 
 logger = logging.getLogger(__name__)
 
+BACKENDS = ("inline", "process")
+
+
+class _DeadlineExceeded(Exception):
+    """A skill call ran past its deadline (never raised by skill code)."""
+
 
 class SkillExecutor:
     """Loads context files and dynamically executes skill entry points.
 
+    A skill's ``execute(params)`` returns a result dict; it may also be a
+    coroutine function or a generator function.  Skills that can report
+    partial results define ``execute_stream(params)``: a generator that
+    yields partial-result dicts (e.g. one per page) and *returns* the final
+    result dict.  :meth:`stream_skill` forwards those chunks as they are
+    produced, while :meth:`execute_skill` only returns the final result.
+
     Parameters
     ----------
     registry:
         A :class:`SkillRegistry` instance used to resolve skill names to
         their on-disk locations.
+    context_cache_bytes:
+        Upper bound on the total size of ``SKILL.md`` / ``schema.json`` text
+        kept in the context cache.  ``0`` disables it.
+    backend:
+        Default execution backend: ``"inline"`` runs ``execute()`` in the
+        calling thread, ``"process"`` runs it in a warm pool of worker
+        processes (useful for CPU-bound skills, which would otherwise hold
+        the GIL).  A skill can override this with ``execution.backend`` in
+        its ``skill.yaml``.
+    max_workers:
+        Size of the process pool.  Defaults to the number of CPUs.
+    max_threads:
+        Size of the thread pool :meth:`execute_skill_async` uses to run
+        synchronous ``execute`` functions off the event loop.
+    result_cache_size:
+        Number of results of ``cacheable`` skills kept in memory.
+    result_cache_path:
+        Optional SQLite file used as a second, persistent result cache tier
+        (shareable between processes).
+    default_timeout:
+        Deadline in seconds for skills that do not set ``execution.timeout``
+        in their ``skill.yaml``.  ``None`` means no deadline.
+    validate_params:
+        Check params against the skill's ``schema.json`` (coercing where
+        lossless) before running it; invalid calls return an error without
+        executing the skill.
     """
 
-    def __init__(self, registry: SkillRegistry) -> None:
+    def __init__(
+        self,
+        registry: SkillRegistry,
+        context_cache_bytes: int = 4 * 1024 * 1024,
+        backend: str = "inline",
+        max_workers: Optional[int] = None,
+        max_threads: Optional[int] = None,
+        result_cache_size: int = 256,
+        result_cache_path: Optional[str] = None,
+        default_timeout: Optional[float] = None,
+        validate_params: bool = True,
+    ) -> None:
+        if backend not in BACKENDS:
+            raise ValueError(f"Unknown backend {backend!r}; expected one of {BACKENDS}")
         self.registry = registry
+        self.backend = backend
+        self.max_workers = max_workers
+        self.max_threads = max_threads
+        self.default_timeout = default_timeout
+        self.validate_params = validate_params
+        self._process_pool: Optional[ProcessPoolExecutor] = None
+        self._thread_pool: Optional[ThreadPoolExecutor] = None
+        # Pools killed over an overdue call; calls they fail are resubmitted.
+        self._terminated_pools: weakref.WeakSet[ProcessPoolExecutor] = weakref.WeakSet()
+        # Memoized results of skills declaring ``execution.cacheable``,
+        # stored as JSON text so hits hand out independent copies.
+        self._results = LRUCache(maxsize=result_cache_size)
+        self._results_disk = SQLiteCache(result_cache_path) if result_cache_path else None
+        # Keyed on (directory, SKILL.md stamp, schema.json stamp), so an
+        # edited file simply misses and the stale entry ages out.
+        self._contexts = LRUCache(maxsize=context_cache_bytes, sizeof=_context_size)
+        # entry-point path -> ((mtime_ns, size), module)
+        self._modules: dict[Path, tuple[tuple[int, int], ModuleType]] = {}
+        # schema.json path -> ((mtime_ns, size), compiled validator | None)
+        self._validators: dict[Path, tuple[tuple[int, int], Optional[Callable]]] = {}
+        self._warm_up: Optional[Future] = None
+        self._lock = threading.Lock()
+
+    # ------------------------------------------------------------------
+    # Warm-up
+    # ------------------------------------------------------------------
+
+    def warm_up(self, skill_names: Optional[Iterable[str]] = None) -> dict[str, Any]:
+        """Preload skills so their first call does not pay start-up costs.
+
+        For every skill (or just *skill_names*) this imports the entry point,
+        loads ``SKILL.md``/``schema.json`` into the context cache and
+        compiles the params validator.  If any skill uses the ``process``
+        backend, the worker processes are started as well (they preload
+        their modules in the pool initializer).
+
+        Returns ``{"warmed": [names], "failed": {name: error}}``; a skill
+        that fails to load is reported, not raised.
+        """
+        if skill_names is None:
+            metas = self.registry.get_all_skills()
+        else:
+            metas = [
+                meta for meta in map(self.registry.get_skill_by_name, skill_names)
+                if meta is not None
+            ]
+        warmed: list[str] = []
+        failed: dict[str, str] = {}
+        start_workers = False
+        for meta in metas:
+            try:
+                self.load_skill_context(meta.name)
+                self._get_validator(meta)
+                resolved = self._resolve_entry(meta.name)
+                if isinstance(resolved, dict):
+                    failed[meta.name] = resolved["error"]
+                    continue
+                if self._backend_for(meta) == "process":
+                    start_workers = True
+                else:
+                    self._get_module(meta.name, resolved[1], resolved[2])
+            except Exception as exc:
+                logger.exception("Warm-up of skill '%s' failed", meta.name)
+                failed[meta.name] = str(exc)
+            else:
+                warmed.append(meta.name)
+        if start_workers:
+            self._start_workers()
+        return {"warmed": warmed, "failed": failed}
+
+    def start_warm_up(self) -> Future:
+        """Run :meth:`warm_up` for every skill on a background thread.
+
+        Returns a :class:`~concurrent.futures.Future` resolving to the
+        :meth:`warm_up` summary; repeated calls return the same future.  A
+        health check can poll :attr:`is_warm`, block on ``future.result()``
+        or ``await asyncio.wrap_future(future)``.
+        """
+        with self._lock:
+            if self._warm_up is not None:
+                return self._warm_up
+            future: Future = Future()
+            self._warm_up = future
+
+        def _run() -> None:
+            future.set_running_or_notify_cancel()
+            try:
+                future.set_result(self.warm_up())
+            except BaseException as exc:
+                future.set_exception(exc)
+
+        threading.Thread(target=_run, name="skill-warm-up", daemon=True).start()
+        return future
+
+    @property
+    def is_warm(self) -> bool:
+        """``True`` once a warm-up started by :meth:`start_warm_up` succeeded.
+
+        A warm-up that raised never reports warm; its exception is available
+        from ``start_warm_up().exception()``.
+        """
+        future = self._warm_up
+        return future is not None and future.done() and future.exception() is None
 
     # ------------------------------------------------------------------
     # Context loading
@@ -34,52 +203,639 @@ class SkillExecutor:
         """Read ``SKILL.md`` and ``schema.json`` for the given skill.
 
         Returns a dict with keys ``skill_doc`` (str) and ``schema``
-        (dict | None).
+        (dict | None).  Both are served from an in-memory cache validated
+        against the files' mtime and size, so a warm lookup costs two
+        ``stat()`` calls.  The returned ``schema`` is shared between callers
+        and must not be mutated.
         """
         meta = self.registry.get_skill_by_name(skill_name)
         if meta is None:
             return {"error": f"Skill '{skill_name}' not found"}
 
-        skill_doc = self._read_text(meta.directory / "SKILL.md")
-        schema = self._read_json(meta.directory / "schema.json")
+        doc_path = meta.directory / "SKILL.md"
+        schema_path = meta.directory / "schema.json"
+        key = (meta.directory, self._file_stamp(doc_path), self._file_stamp(schema_path))
+        cached = self._contexts.get(key)
+        if cached is None:
+            cached = (self._read_text(doc_path), self._read_json_text(schema_path))
+            self._contexts.put(key, cached)
+        skill_doc, (_, schema) = cached
 
         return {
             "skill_doc": skill_doc,
             "schema": schema,
         }
 
+    def context_cache_info(self) -> CacheInfo:
+        """Return hit/miss statistics of the skill context cache."""
+        return self._contexts.info()
+
     # ------------------------------------------------------------------
     # Execution
     # ------------------------------------------------------------------
 
-    def execute_skill(self, skill_name: str, params: dict) -> dict[str, Any]:
+    def execute_skill(
+        self,
+        skill_name: str,
+        params: dict,
+        timeout: Optional[float] = None,
+    ) -> dict[str, Any]:
         """Dynamically import and run a skill's ``execute(params)`` function.
 
         Returns the dict produced by the skill, or a dict with an ``error``
-        key if something goes wrong.
+        key if something goes wrong.  Skills routed to the ``process``
+        backend run in a worker process with the same contract.  A coroutine
+        ``execute`` is driven to completion on a private event loop.
+
+        *timeout* (seconds) overrides the skill's ``execution.timeout`` and
+        the executor's ``default_timeout``.  A call past its deadline returns
+        ``{"error": ..., "error_type": "timeout"}``.  Coroutine skills are
+        cancelled, and an overrunning process call has its worker pool
+        terminated and replaced; other calls that were running on that pool
+        are resubmitted to the new one (so they start over).  An inline
+        synchronous ``execute`` already running cannot be interrupted, so it
+        is abandoned and its result discarded.
+
+        Params are first checked against the skill's compiled
+        ``schema.json``; a mismatch returns ``{"error": ...,
+        "error_type": "invalid_params", "path": ...}`` without running the
+        skill.
+        """
+        resolved = self._resolve_entry(skill_name)
+        if isinstance(resolved, dict):
+            return resolved
+        meta, entry, stamp = resolved
+        params, invalid = self._check_params(meta, params)
+        if invalid is not None:
+            return invalid
+        cache_key = self._result_key(meta, params)
+        if cache_key is not None:
+            cached = self._cached_result(cache_key, meta)
+            if cached is not None:
+                return cached
+
+        deadline = self._timeout_for(meta, timeout)
+        try:
+            if self._backend_for(meta) == "process":
+                result = self._run_in_process(skill_name, entry, params, deadline)
+            else:
+                module = self._get_module(skill_name, entry, stamp)
+                execute_fn = getattr(module, "execute", None)
+                if deadline is None or inspect.iscoroutinefunction(execute_fn):
+                    result = _call_execute(module, skill_name, params, deadline)
+                else:
+                    future = self._get_thread_pool().submit(
+                        _call_execute, module, skill_name, params
+                    )
+                    result = _wait_with_deadline(future, deadline)
+        except _DeadlineExceeded:
+            return self._timeout_failure(skill_name, deadline)
+        except BrokenProcessPool as exc:
+            return self._process_failure(skill_name, exc)
+        except Exception as exc:
+            logger.exception("Skill '%s' execution failed", skill_name)
+            return {"error": str(exc)}
+        if cache_key is not None:
+            self._store_result(cache_key, meta, result)
+        return result
+
+    async def execute_skill_async(
+        self,
+        skill_name: str,
+        params: dict,
+        timeout: Optional[float] = None,
+    ) -> dict[str, Any]:
+        """Async counterpart of :meth:`execute_skill`.
+
+        Coroutine ``execute`` functions are awaited directly on the running
+        loop, synchronous ones are offloaded to the executor's thread pool,
+        and process-routed skills are awaited without blocking the loop.
+        The result-or-``{"error": ...}`` contract and the deadline handling
+        are the same as for :meth:`execute_skill`.
+        """
+        resolved = self._resolve_entry(skill_name)
+        if isinstance(resolved, dict):
+            return resolved
+        meta, entry, stamp = resolved
+        params, invalid = self._check_params(meta, params)
+        if invalid is not None:
+            return invalid
+        cache_key = self._result_key(meta, params)
+        if cache_key is not None:
+            cached = self._cached_result(cache_key, meta)
+            if cached is not None:
+                return cached
+
+        deadline = self._timeout_for(meta, timeout)
+        try:
+            if self._backend_for(meta) == "process":
+                result = await self._run_in_process_async(skill_name, entry, params, deadline)
+            else:
+                module = self._get_module(skill_name, entry, stamp)
+                execute_fn = getattr(module, "execute", None)
+                if execute_fn is None:
+                    return {"error": f"Skill '{skill_name}' has no execute() function"}
+                if inspect.iscoroutinefunction(execute_fn):
+                    pending = execute_fn(params)
+                else:
+                    loop = asyncio.get_running_loop()
+                    pending = loop.run_in_executor(
+                        self._get_thread_pool(), _call_execute, module, skill_name, params
+                    )
+                result = await _await_with_deadline(pending, deadline)
+        except _DeadlineExceeded:
+            return self._timeout_failure(skill_name, deadline)
+        except BrokenProcessPool as exc:
+            return self._process_failure(skill_name, exc)
+        except Exception as exc:
+            logger.exception("Skill '%s' execution failed", skill_name)
+            return {"error": str(exc)}
+        if cache_key is not None:
+            self._store_result(cache_key, meta, result)
+        return result
+
+    def stream_skill(
+        self,
+        skill_name: str,
+        params: dict,
+        timeout: Optional[float] = None,
+    ) -> Iterator[dict[str, Any]]:
+        """Run a skill, yielding its partial results as they are produced.
+
+        Yields ``{"event": "chunk", "data": ...}`` for each partial result of
+        a streaming skill, then exactly one ``{"event": "result", "data":
+        ...}`` holding what :meth:`execute_skill` would have returned.  Skills
+        without a streaming entry point, cached results and process-routed
+        skills produce the result event only.  Under a deadline each step of
+        the stream runs on the thread pool and is waited for with the time
+        left, so a blocked skill cannot hold the caller past it; an overrun
+        ends with a timeout error, and the abandoned stream is closed once
+        its current step returns.
         """
+        resolved = self._resolve_entry(skill_name)
+        if isinstance(resolved, dict):
+            yield _result_event(resolved)
+            return
+        meta, entry, stamp = resolved
+        stream_fn = None
+        if self._backend_for(meta) == "inline":
+            try:
+                stream_fn = _stream_function(self._get_module(skill_name, entry, stamp))
+            except Exception as exc:
+                logger.exception("Skill '%s' execution failed", skill_name)
+                yield _result_event({"error": str(exc)})
+                return
+        if stream_fn is None:
+            yield _result_event(self.execute_skill(skill_name, params, timeout))
+            return
+
+        params, invalid = self._check_params(meta, params)
+        if invalid is not None:
+            yield _result_event(invalid)
+            return
+        cache_key = self._result_key(meta, params)
+        if cache_key is not None:
+            cached = self._cached_result(cache_key, meta)
+            if cached is not None:
+                yield _result_event(cached)
+                return
+
+        deadline = self._timeout_for(meta, timeout)
+        expires_at = time.monotonic() + deadline if deadline is not None else None
+        try:
+            stream = stream_fn(params)
+        except Exception as exc:
+            logger.exception("Skill '%s' execution failed", skill_name)
+            yield _result_event({"error": str(exc)})
+            return
+        pool = self._get_thread_pool() if expires_at is not None else None
+        running: Optional[Future] = None
+        try:
+            while True:
+                try:
+                    if pool is None:
+                        finished, value = _advance(stream)
+                    else:
+                        remaining = expires_at - time.monotonic()
+                        if remaining <= 0:
+                            raise _DeadlineExceeded()
+                        running = pool.submit(_advance, stream)
+                        finished, value = _wait_with_deadline(running, remaining)
+                        running = None
+                except _DeadlineExceeded:
+                    yield _result_event(self._timeout_failure(skill_name, deadline))
+                    return
+                except Exception as exc:
+                    logger.exception("Skill '%s' execution failed", skill_name)
+                    result = {"error": str(exc)}
+                    break
+                if finished:
+                    result = _final_result(skill_name, value)
+                    break
+                yield {"event": "chunk", "data": value}
+        finally:
+            if running is None:
+                stream.close()
+            else:
+                # A generator cannot be closed while another thread runs it.
+                running.add_done_callback(lambda _: stream.close())
+        if cache_key is not None:
+            self._store_result(cache_key, meta, result)
+        yield _result_event(result)
+
+    def execute_many(
+        self,
+        calls: Iterable[tuple[str, dict]],
+        max_concurrency: Optional[int] = None,
+        timeout: Optional[float] = None,
+    ) -> list[dict[str, Any]]:
+        """Run several ``(skill_name, params)`` calls concurrently.
+
+        Calls are spread over at most *max_concurrency* threads (default: one
+        per call, capped at ``max_threads`` if set).  Each call goes through
+        :meth:`execute_skill`, so process-routed skills fan out across the
+        worker processes and cacheable ones are memoized.  Results are
+        returned in input order; a failing call yields its own
+        ``{"error": ...}`` dict without affecting the others.  *timeout*
+        applies to each call, as in :meth:`execute_skill`.
+        """
+        calls = list(calls)
+        limit = max_concurrency or self.max_threads or len(calls)
+        workers = max(1, min(limit, len(calls)))
+        if workers == 1:
+            return [self._execute_isolated(name, params, timeout) for name, params in calls]
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="skill-batch") as pool:
+            futures = [
+                pool.submit(self._execute_isolated, name, params, timeout)
+                for name, params in calls
+            ]
+            return [future.result() for future in futures]
+
+    async def execute_many_async(
+        self,
+        calls: Iterable[tuple[str, dict]],
+        max_concurrency: Optional[int] = None,
+        timeout: Optional[float] = None,
+    ) -> list[dict[str, Any]]:
+        """Async counterpart of :meth:`execute_many` built on
+        :meth:`execute_skill_async`, bounded by an :class:`asyncio.Semaphore`.
+        """
+        calls = list(calls)
+        semaphore = asyncio.Semaphore(max_concurrency or max(1, len(calls)))
+
+        async def _run(name: str, params: dict) -> dict[str, Any]:
+            async with semaphore:
+                try:
+                    return await self.execute_skill_async(name, params, timeout)
+                except Exception as exc:
+                    logger.exception("Skill '%s' execution failed", name)
+                    return {"error": str(exc)}
+
+        return list(await asyncio.gather(*(_run(name, params) for name, params in calls)))
+
+    def result_cache_info(self) -> dict[str, Optional[CacheInfo]]:
+        """Return hit/miss statistics of the memory and disk result caches.
+
+        A disk hit is also counted as a memory miss.
+        """
+        return {
+            "memory": self._results.info(),
+            "disk": self._results_disk.info() if self._results_disk else None,
+        }
+
+    def shutdown(self) -> None:
+        """Stop the worker processes and threads, if any were started."""
+        self._reset_process_pool()
+        with self._lock:
+            pool, self._thread_pool = self._thread_pool, None
+        if pool is not None:
+            pool.shutdown(wait=False)
+
+    def invalidate(self, skill_name: Optional[str] = None) -> None:
+        """Drop cached modules and schema validators for *skill_name*, or for
+        every skill if omitted.
+
+        Also clears the context cache (and, for all skills, the in-memory
+        result cache).  Entry points and context files are
+        re-read automatically when their mtime or size changes; this is for
+        forcing a fresh module (and fresh module-level state) regardless.
+        """
+        with self._lock:
+            if skill_name is None:
+                self._modules.clear()
+                self._validators.clear()
+                self._contexts.clear()
+                self._results.clear()
+                return
+            meta = self.registry.get_skill_by_name(skill_name)
+            if meta is not None:
+                self._modules.pop(meta.directory / meta.entry_point, None)
+                self._validators.pop(meta.directory / "schema.json", None)
+                # Context entries are keyed on file stamps; dropping them all
+                # is simpler than tracking which belong to this skill.
+                self._contexts.clear()
+
+    # ------------------------------------------------------------------
+    # Internal helpers
+    # ------------------------------------------------------------------
+
+    def _resolve_entry(
+        self,
+        skill_name: str,
+    ) -> tuple[SkillMeta, Path, tuple[int, int]] | dict[str, Any]:
+        """Return ``(meta, entry_path, stamp)`` or an ``{"error": ...}`` dict."""
         meta = self.registry.get_skill_by_name(skill_name)
         if meta is None:
             return {"error": f"Skill '{skill_name}' not found"}
 
         entry = meta.directory / meta.entry_point
-        if not entry.exists():
+        stamp = self._file_stamp(entry)
+        if stamp is None:
             return {"error": f"Entry point not found: {entry}"}
+        return meta, entry, stamp
 
+    def _execute_isolated(
+        self,
+        skill_name: str,
+        params: dict,
+        timeout: Optional[float],
+    ) -> dict[str, Any]:
+        """:meth:`execute_skill`, guaranteed not to raise."""
         try:
-            module = self._import_module(skill_name, entry)
-            execute_fn = getattr(module, "execute", None)
-            if execute_fn is None:
-                return {"error": f"Skill '{skill_name}' has no execute() function"}
-            result = execute_fn(params)
-            return result
+            return self.execute_skill(skill_name, params, timeout)
         except Exception as exc:
             logger.exception("Skill '%s' execution failed", skill_name)
             return {"error": str(exc)}
 
-    # ------------------------------------------------------------------
-    # Internal helpers
-    # ------------------------------------------------------------------
+    def _result_key(self, meta: SkillMeta, params: dict) -> Optional[str]:
+        """Return the memoization key for a call, or ``None`` if not cacheable.
+
+        The key hashes the skill name, its version and the canonical JSON form
+        of *params*; params that are not JSON-serialisable are never cached.
+        """
+        if not meta.cacheable:
+            return None
+        try:
+            canonical = json.dumps(
+                [meta.name, meta.version, params],
+                sort_keys=True,
+                separators=(",", ":"),
+                ensure_ascii=False,
+            )
+        except (TypeError, ValueError):
+            return None
+        return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+    def _cached_result(self, key: str, meta: SkillMeta) -> Optional[dict[str, Any]]:
+        text = self._results.get(key)
+        if text is None and self._results_disk is not None:
+            entry = self._results_disk.get(key, with_expiry=True)
+            if entry is not None:
+                # Keep the disk entry's remaining lifetime, not a fresh TTL.
+                text, expires_at = entry
+                self._results.put(key, text, ttl=SQLiteCache.remaining_ttl(expires_at))
+        return json.loads(text) if text is not None else None
+
+    def _store_result(self, key: str, meta: SkillMeta, result: Any) -> None:
+        """Memoize *result* unless it reports an executor-level error."""
+        if not isinstance(result, dict) or "error" in result:
+            return
+        try:
+            text = json.dumps(result)
+        except (TypeError, ValueError):
+            return
+        try:
+            self._results.put(key, text, ttl=meta.cache_ttl)
+            if self._results_disk is not None:
+                self._results_disk.put(key, text, ttl=meta.cache_ttl)
+        except Exception:
+            # The skill already ran; losing the memo must not lose the result.
+            logger.exception("Could not cache the result of skill '%s'", meta.name)
+
+    def _check_params(
+        self,
+        meta: SkillMeta,
+        params: dict,
+    ) -> tuple[dict, Optional[dict[str, Any]]]:
+        """Return ``(params, None)`` with params coerced, or ``(params, error)``."""
+        if not self.validate_params:
+            return params, None
+        validator = self._get_validator(meta)
+        if validator is None:
+            return params, None
+        try:
+            return validator(params), None
+        except ParamValidationError as exc:
+            return params, {
+                "error": f"Invalid params for skill '{meta.name}': {exc}",
+                "error_type": "invalid_params",
+                "path": exc.path,
+            }
+
+    def _get_validator(self, meta: SkillMeta) -> Optional[Callable[[Any], Any]]:
+        """Return the compiled ``schema.json`` validator, recompiling on change."""
+        path = meta.directory / "schema.json"
+        stamp = self._file_stamp(path)
+        if stamp is None:
+            return None
+        cached = self._validators.get(path)
+        if cached is not None and cached[0] == stamp:
+            return cached[1]
+        _, schema = self._read_json_text(path)
+        try:
+            validator = compile_schema(schema) if isinstance(schema, dict) else None
+        except Exception:
+            # Never let a malformed schema stop the skill from running.
+            logger.exception("Cannot compile %s; params are not validated", path)
+            validator = None
+        with self._lock:
+            self._validators[path] = (stamp, validator)
+        return validator
+
+    def _timeout_for(self, meta: SkillMeta, timeout: Optional[float]) -> Optional[float]:
+        """Return the effective deadline: per call, then per skill, then default."""
+        if timeout is not None:
+            return timeout
+        if meta.timeout is not None:
+            return meta.timeout
+        return self.default_timeout
+
+    @staticmethod
+    def _timeout_failure(skill_name: str, timeout: Optional[float]) -> dict[str, Any]:
+        logger.warning("Skill '%s' timed out after %ss", skill_name, timeout)
+        return {
+            "error": f"Skill '{skill_name}' timed out after {timeout}s",
+            "error_type": "timeout",
+        }
+
+    @staticmethod
+    def _process_failure(skill_name: str, exc: BaseException) -> dict[str, Any]:
+        logger.exception("Skill '%s' worker process died", skill_name)
+        return {"error": f"Worker process failed: {exc}"}
+
+    def _get_thread_pool(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._thread_pool is None:
+                self._thread_pool = ThreadPoolExecutor(
+                    max_workers=self.max_threads,
+                    thread_name_prefix="skill-exec",
+                )
+            return self._thread_pool
+
+    def _backend_for(self, meta: SkillMeta) -> str:
+        backend = meta.backend or self.backend
+        if backend not in BACKENDS:
+            logger.warning(
+                "Skill '%s' requests unknown backend %r; running inline", meta.name, backend
+            )
+            return "inline"
+        return backend
+
+    def _run_in_process(
+        self,
+        name: str,
+        entry: Path,
+        params: dict,
+        deadline: Optional[float],
+    ) -> Any:
+        """Run a call on the worker pool and wait for it until *deadline*.
+
+        An overdue call gets the pool killed (its worker may be stuck), which
+        fails every call in flight on it; those are resubmitted to the new
+        pool with the time they have left.
+        """
+        expires_at = time.monotonic() + deadline if deadline is not None else None
+        while True:
+            remaining = _time_left(expires_at)
+            if remaining is not None and remaining <= 0:
+                raise _DeadlineExceeded()
+            pool = self._get_process_pool()
+            try:
+                future = self._submit_to_process(pool, name, entry, params, remaining)
+                return _wait_with_deadline(future, remaining)
+            except _DeadlineExceeded:
+                self._reset_process_pool(pool, terminate=True)
+                raise
+            except BrokenProcessPool:
+                if not self._killed_by_executor(pool):
+                    raise
+
+    async def _run_in_process_async(
+        self,
+        name: str,
+        entry: Path,
+        params: dict,
+        deadline: Optional[float],
+    ) -> Any:
+        """Async counterpart of :meth:`_run_in_process`."""
+        expires_at = time.monotonic() + deadline if deadline is not None else None
+        while True:
+            remaining = _time_left(expires_at)
+            if remaining is not None and remaining <= 0:
+                raise _DeadlineExceeded()
+            pool = self._get_process_pool()
+            try:
+                future = self._submit_to_process(pool, name, entry, params, remaining)
+                return await _await_with_deadline(asyncio.wrap_future(future), remaining)
+            except _DeadlineExceeded:
+                self._reset_process_pool(pool, terminate=True)
+                raise
+            except BrokenProcessPool:
+                if not self._killed_by_executor(pool):
+                    raise
+
+    def _killed_by_executor(self, pool: ProcessPoolExecutor) -> bool:
+        """Whether *pool* broke because an overdue call had it terminated.
+
+        Any other breakage (a worker crashed) discards the pool and is
+        reported to the caller.
+        """
+        if pool in self._terminated_pools:
+            logger.info("Worker pool was reset for an overdue call; resubmitting")
+            return True
+        self._reset_process_pool(pool)
+        return False
+
+    @staticmethod
+    def _submit_to_process(
+        pool: ProcessPoolExecutor,
+        name: str,
+        entry: Path,
+        params: dict,
+        timeout: Optional[float] = None,
+    ) -> Future:
+        try:
+            return pool.submit(_run_in_worker, name, str(entry), params, timeout)
+        except RuntimeError as exc:
+            # Shut down by a concurrent reset between lookup and submit.
+            raise BrokenProcessPool(str(exc)) from exc
+
+    def _get_process_pool(self) -> ProcessPoolExecutor:
+        """Return the worker pool, starting it (and preloading modules) once."""
+        with self._lock:
+            if self._process_pool is None:
+                preload = [
+                    (meta.name, str(meta.directory / meta.entry_point))
+                    for meta in self.registry.get_all_skills()
+                    if self._backend_for(meta) == "process"
+                ]
+                # "spawn" avoids forking a parent that may be running threads
+                # (registry watcher, Streamlit, thread pools).
+                self._process_pool = ProcessPoolExecutor(
+                    max_workers=self.max_workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                    initializer=_preload_worker,
+                    initargs=(preload,),
+                )
+            return self._process_pool
+
+    def _start_workers(self) -> None:
+        """Spawn every worker process now instead of on first use."""
+        pool = self._get_process_pool()
+        count = self.max_workers or os.cpu_count() or 1
+        for future in [pool.submit(_noop) for _ in range(count)]:
+            future.result()
+
+    def _reset_process_pool(
+        self,
+        expected: Optional[ProcessPoolExecutor] = None,
+        terminate: bool = False,
+    ) -> None:
+        """Discard the worker pool; the next process call starts a new one.
+
+        With *expected*, only that pool is discarded (a pool already replaced
+        by a concurrent reset is left alone).  With *terminate*, its worker
+        processes are killed instead of being allowed to finish their calls;
+        the pool is remembered so calls it fails can be resubmitted.
+        """
+        with self._lock:
+            pool = self._process_pool
+            if pool is None or (expected is not None and pool is not expected):
+                return
+            self._process_pool = None
+            if terminate:
+                self._terminated_pools.add(pool)
+        if terminate:
+            _terminate_workers(pool)
+        pool.shutdown(wait=False, cancel_futures=True)
+
+    def _get_module(self, name: str, path: Path, stamp: tuple[int, int]) -> ModuleType:
+        """Return the imported entry point, re-importing only if it changed."""
+        cached = self._modules.get(path)
+        if cached is not None and cached[0] == stamp:
+            return cached[1]
+        module = self._import_module(name, path)
+        with self._lock:
+            self._modules[path] = (stamp, module)
+        return module
+
+    @staticmethod
+    def _file_stamp(path: Path) -> Optional[tuple[int, int]]:
+        try:
+            st = path.stat()
+        except OSError:
+            return None
+        return (st.st_mtime_ns, st.st_size)
 
     @staticmethod
     def _import_module(name: str, path: Path):
@@ -95,10 +851,178 @@ class SkillExecutor:
         return None
 
     @staticmethod
-    def _read_json(path: Path) -> Optional[dict]:
+    def _read_json_text(path: Path) -> tuple[Optional[str], Optional[dict]]:
+        """Return the raw text (used for cache sizing) and parsed JSON."""
         if path.exists():
+            text = path.read_text(encoding="utf-8")
             try:
-                return json.loads(path.read_text(encoding="utf-8"))
+                return text, json.loads(text)
             except json.JSONDecodeError:
                 logger.warning("Invalid JSON in %s", path)
+                return text, None
+        return None, None
+
+
+def _call_execute(
+    module: ModuleType,
+    skill_name: str,
+    params: dict,
+    timeout: Optional[float] = None,
+) -> dict[str, Any]:
+    """Call ``module.execute(params)`` synchronously, whatever its flavour.
+
+    A coroutine result is cancelled once *timeout* seconds have passed.
+    """
+    execute_fn = getattr(module, "execute", None)
+    if execute_fn is None:
+        return {"error": f"Skill '{skill_name}' has no execute() function"}
+    result = execute_fn(params)
+    if inspect.isawaitable(result):
+        result = _run_coroutine(result, timeout)
+    elif inspect.isgenerator(result):
+        result = _drain(skill_name, result)
+    return result
+
+
+def _stream_function(module: ModuleType) -> Optional[Callable[[dict], Iterator]]:
+    """Return the module's streaming entry point, if it has one."""
+    stream_fn = getattr(module, "execute_stream", None)
+    if stream_fn is not None:
+        return stream_fn
+    execute_fn = getattr(module, "execute", None)
+    if inspect.isgeneratorfunction(execute_fn):
+        return execute_fn
+    return None
+
+
+def _drain(skill_name: str, stream: Iterator) -> dict[str, Any]:
+    """Exhaust a streaming ``execute`` and return its final result."""
+    while True:
+        try:
+            next(stream)
+        except StopIteration as stop:
+            return _final_result(skill_name, stop.value)
+
+
+def _final_result(skill_name: str, value: Any) -> dict[str, Any]:
+    if value is None:
+        return {"error": f"Skill '{skill_name}' stream returned no result"}
+    return value
+
+
+def _advance(stream: Iterator) -> tuple[bool, Any]:
+    """Step *stream*: ``(False, chunk)``, or ``(True, return value)`` at its end."""
+    try:
+        return False, next(stream)
+    except StopIteration as stop:
+        return True, stop.value
+
+
+def _result_event(result: dict[str, Any]) -> dict[str, Any]:
+    return {"event": "result", "data": result}
+
+
+def _time_left(expires_at: Optional[float]) -> Optional[float]:
+    """Seconds until the monotonic *expires_at* (``None``: no deadline)."""
+    if expires_at is None:
         return None
+    return expires_at - time.monotonic()
+
+
+def _wait_with_deadline(future: Future, timeout: Optional[float]) -> Any:
+    """Return *future*'s result, cancelling it if *timeout* passes first."""
+    done, _ = wait_futures([future], timeout=timeout, return_when=FIRST_COMPLETED)
+    if not done:
+        future.cancel()
+        raise _DeadlineExceeded()
+    return future.result()
+
+
+async def _await_with_deadline(awaitable: Any, timeout: Optional[float]) -> Any:
+    """Await *awaitable*, cancelling it if *timeout* passes first.
+
+    Unlike :func:`asyncio.wait_for`, a ``TimeoutError`` raised by the skill
+    itself is passed through rather than reported as a missed deadline.
+    """
+    if timeout is None:
+        return await awaitable
+    task = asyncio.ensure_future(awaitable)
+    done, _ = await asyncio.wait({task}, timeout=timeout)
+    if not done:
+        task.cancel()
+        raise _DeadlineExceeded()
+    return task.result()
+
+
+def _run_coroutine(awaitable: Any, timeout: Optional[float] = None) -> Any:
+    """Run *awaitable* to completion from synchronous code.
+
+    Uses :func:`asyncio.run` unless this thread already runs an event loop,
+    in which case a helper thread hosts a fresh loop instead.
+    """
+    async def _await() -> Any:
+        return await _await_with_deadline(awaitable, timeout)
+
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(_await())
+    with ThreadPoolExecutor(max_workers=1) as helper:
+        return helper.submit(asyncio.run, _await()).result()
+
+
+# ----------------------------------------------------------------------
+# Worker-process side of the ``process`` backend
+# ----------------------------------------------------------------------
+
+# entry-point path -> ((mtime_ns, size), module), private to each worker.
+_WORKER_MODULES: dict[str, tuple[Optional[tuple[int, int]], ModuleType]] = {}
+
+
+def _worker_module(name: str, path: str) -> ModuleType:
+    stamp = SkillExecutor._file_stamp(Path(path))
+    cached = _WORKER_MODULES.get(path)
+    if cached is not None and cached[0] == stamp:
+        return cached[1]
+    module = SkillExecutor._import_module(name, Path(path))
+    _WORKER_MODULES[path] = (stamp, module)
+    return module
+
+
+def _preload_worker(entries: list[tuple[str, str]]) -> None:
+    """Pool initializer: import every process-routed skill up front."""
+    for name, path in entries:
+        try:
+            _worker_module(name, path)
+        except Exception:
+            logger.exception("Failed to preload skill '%s' in worker", name)
+
+
+def _terminate_workers(pool: ProcessPoolExecutor) -> None:
+    """Kill the worker processes of *pool* (before it is shut down)."""
+    terminate = getattr(pool, "terminate_workers", None)  # Python 3.14+
+    if terminate is not None:
+        terminate()
+        return
+    for process in list((getattr(pool, "_processes", None) or {}).values()):
+        if process.is_alive():
+            process.terminate()
+
+
+def _noop() -> None:
+    pass
+
+
+def _run_in_worker(
+    name: str,
+    path: str,
+    params: dict,
+    timeout: Optional[float] = None,
+) -> dict[str, Any]:
+    return _call_execute(_worker_module(name, path), name, params, timeout)
+
+
+def _context_size(value: tuple[Optional[str], tuple[Optional[str], Any]]) -> int:
+    """Approximate weight of a cached context: its source text length."""
+    skill_doc, (schema_text, _) = value
+    return len(skill_doc or "") + len(schema_text or "")
@@ -0,0 +1,302 @@
+"""Skill Index: in-memory search structures used by :class:`SkillRegistry`."""
+
+from __future__ import annotations
+
+import heapq
+import math
+import re
+import zlib
+from collections import Counter, deque
+from typing import Iterable, Optional
+
+import numpy as np
+
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+
+# Function words that carry no routing signal; dropped from ranked search so
+# conversational filler ("can you ... for me") does not score every skill.
+_STOPWORDS = frozenset(
+    "a an and are as at be by can do for from how i in is it me my of on or "
+    "please should the this to up we what with you your".split()
+)
+
+
+def tokenize(text: str) -> list[str]:
+    """Split *text* into lowered alphanumeric tokens."""
+    return _TOKEN_RE.findall(text.lower())
+
+
+class TriggerIndex:
+    """Aho-Corasick automaton over the trigger phrases of every skill.
+
+    All triggers are compiled into a single trie with failure links, so a
+    query is matched against the whole skill set in one left-to-right pass
+    whose cost is linear in the query length (plus the number of hits).
+
+    Matching semantics are identical to ``trigger.lower() in text.lower()``
+    evaluated for every trigger: a skill matches when *any* of its triggers
+    occurs as a substring of the (lowered) text.
+
+    Parameters
+    ----------
+    triggers_by_skill:
+        One iterable of trigger phrases per skill.  Skills are identified by
+        their position in this sequence.
+    """
+
+    def __init__(self, triggers_by_skill: Iterable[Iterable[str]]) -> None:
+        # Node 0 is the root.  ``_goto[n]`` maps a character to the child
+        # node, ``_fail[n]`` is the failure link and ``_out[n]`` holds the
+        # ids of every skill with a trigger ending at ``n`` (including those
+        # inherited through failure links).
+        self._goto: list[dict[str, int]] = [{}]
+        self._fail: list[int] = [0]
+        self._out: list[frozenset[int]] = [frozenset()]
+        # Skills with an empty trigger match every query.
+        always: set[int] = set()
+        outputs: list[set[int]] = [set()]
+
+        size = 0
+        for skill_id, triggers in enumerate(triggers_by_skill):
+            size = skill_id + 1
+            for trigger in triggers:
+                phrase = trigger.lower()
+                if not phrase:
+                    always.add(skill_id)
+                    continue
+                node = 0
+                for ch in phrase:
+                    nxt = self._goto[node].get(ch)
+                    if nxt is None:
+                        nxt = len(self._goto)
+                        self._goto[node][ch] = nxt
+                        self._goto.append({})
+                        self._fail.append(0)
+                        outputs.append(set())
+                    node = nxt
+                outputs[node].add(skill_id)
+
+        self._size = size
+        self._always = frozenset(always)
+        self._build_failure_links(outputs)
+
+    def __len__(self) -> int:
+        return self._size
+
+    def match(self, text: str) -> list[int]:
+        """Return the sorted ids of every skill with a trigger in *text*."""
+        goto = self._goto
+        fail = self._fail
+        out = self._out
+        found = set(self._always)
+        node = 0
+        for ch in text.lower():
+            while node and ch not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(ch, 0)
+            if out[node]:
+                found.update(out[node])
+        return sorted(found)
+
+    def match_many(self, texts: Iterable[str]) -> list[list[int]]:
+        """Return :meth:`match` results for every text in *texts*, in order.
+
+        Texts that are identical after lowering are only scanned once, which
+        makes replaying repetitive traffic much cheaper than calling
+        :meth:`match` in a loop.
+        """
+        seen: dict[str, list[int]] = {}
+        results: list[list[int]] = []
+        for text in texts:
+            lowered = text.lower()
+            ids = seen.get(lowered)
+            if ids is None:
+                ids = seen[lowered] = self.match(lowered)
+            results.append(ids)
+        return results
+
+    # ------------------------------------------------------------------
+    # Internal helpers
+    # ------------------------------------------------------------------
+
+    def _build_failure_links(self, outputs: list[set[int]]) -> None:
+        goto = self._goto
+        fail = self._fail
+        queue: deque[int] = deque(goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for ch, child in goto[node].items():
+                queue.append(child)
+                link = fail[node]
+                while link and ch not in goto[link]:
+                    link = fail[link]
+                candidate = goto[link].get(ch, 0)
+                fail[child] = candidate if candidate != child else 0
+                # BFS order guarantees the failure target is complete.
+                outputs[child] |= outputs[fail[child]]
+        self._out = [frozenset(ids) for ids in outputs]
+
+
+class BM25Index:
+    """Okapi BM25 ranking over one text document per skill.
+
+    The index is a plain inverted index (``token -> [(skill_id, tf), ...]``)
+    with precomputed IDF values and length normalisation factors, so scoring
+    a query only touches the postings of the query's own tokens.
+
+    Parameters
+    ----------
+    documents:
+        One document per skill.  Skills are identified by their position.
+    k1, b:
+        Standard BM25 term-frequency saturation and length normalisation
+        parameters.
+    """
+
+    def __init__(
+        self,
+        documents: Iterable[str],
+        k1: float = 1.5,
+        b: float = 0.75,
+    ) -> None:
+        self.k1 = k1
+        self.b = b
+        postings: dict[str, list[tuple[int, int]]] = {}
+        lengths: list[int] = []
+        for doc_id, document in enumerate(documents):
+            tokens = [t for t in tokenize(document) if t not in _STOPWORDS]
+            lengths.append(len(tokens))
+            for token, tf in Counter(tokens).items():
+                postings.setdefault(token, []).append((doc_id, tf))
+
+        n_docs = len(lengths)
+        avg_len = (sum(lengths) / n_docs) if n_docs else 0.0
+        self._size = n_docs
+        self._postings = postings
+        self._idf = {
+            token: math.log(1.0 + (n_docs - len(plist) + 0.5) / (len(plist) + 0.5))
+            for token, plist in postings.items()
+        }
+        # k1 * (1 - b + b * |d| / avgdl), precomputed per document.
+        self._norm = [
+            k1 * (1.0 - b + b * (length / avg_len if avg_len else 0.0))
+            for length in lengths
+        ]
+
+    def __len__(self) -> int:
+        return self._size
+
+    def search(
+        self,
+        text: str,
+        top_k: Optional[int] = None,
+        min_score: float = 0.0,
+    ) -> list[tuple[int, float]]:
+        """Return ``(skill_id, score)`` pairs ranked by descending score.
+
+        Only skills scoring strictly above *min_score* are returned; ties are
+        broken by skill id so results are deterministic.
+        """
+        scores: dict[int, float] = {}
+        norm = self._norm
+        k1_plus_1 = self.k1 + 1.0
+        for token in set(tokenize(text)) - _STOPWORDS:
+            plist = self._postings.get(token)
+            if not plist:
+                continue
+            idf = self._idf[token]
+            for doc_id, tf in plist:
+                scores[doc_id] = scores.get(doc_id, 0.0) + (
+                    idf * tf * k1_plus_1 / (tf + norm[doc_id])
+                )
+
+        hits = [(doc_id, score) for doc_id, score in scores.items() if score > min_score]
+        if top_k is not None:
+            return heapq.nsmallest(top_k, hits, key=_rank_key)
+        return sorted(hits, key=_rank_key)
+
+
+def _rank_key(hit: tuple[int, float]) -> tuple[float, int]:
+    return (-hit[1], hit[0])
+
+
+class NgramIndex:
+    """Hashed character n-gram similarity over one text document per skill.
+
+    Every document is turned into an L2-normalised bag of character
+    n-grams, hashed into *dim* buckets, and stored column-wise in a single
+    ``float32`` matrix.  Scoring a query is one sparse-times-dense product:
+    only the matrix rows of the query's own n-gram buckets are touched, so the
+    cost grows with the number of skills but not with *dim*.  Being purely
+    lexical it tolerates typos and spelling variants ("analyse", "emial")
+    without any model or network access.
+
+    Parameters
+    ----------
+    documents:
+        One document per skill.  Skills are identified by their position.
+    n:
+        Character n-gram length.
+    dim:
+        Number of hash buckets (rows of the feature matrix).
+    """
+
+    def __init__(self, documents: Iterable[str], n: int = 3, dim: int = 1024) -> None:
+        self.n = n
+        self.dim = dim
+        columns = [self._vector(document) for document in documents]
+        if columns:
+            # (dim, n_skills): a query gathers whole contiguous rows.
+            self._matrix = np.ascontiguousarray(np.stack(columns, axis=1))
+        else:
+            self._matrix = np.zeros((dim, 0), dtype=np.float32)
+
+    def __len__(self) -> int:
+        return self._matrix.shape[1]
+
+    def search(
+        self,
+        text: str,
+        top_k: Optional[int] = None,
+        min_score: float = 0.0,
+    ) -> list[tuple[int, float]]:
+        """Return ``(skill_id, cosine)`` pairs ranked by descending similarity.
+
+        Only skills scoring strictly above *min_score* are returned; ties are
+        broken by skill id so results are deterministic.
+        """
+        buckets, weights = self._features(text)
+        if not len(buckets) or not len(self):
+            return []
+        scores = weights @ self._matrix[buckets]
+        hits = np.flatnonzero(scores > min_score)
+        if top_k is not None and len(hits) > top_k:
+            keep = np.argpartition(-scores[hits], top_k - 1)[:top_k]
+            hits = hits[keep]
+        ranked = sorted(((int(i), float(scores[i])) for i in hits), key=_rank_key)
+        return ranked
+
+    # ------------------------------------------------------------------
+    # Internal helpers
+    # ------------------------------------------------------------------
+
+    def _features(self, text: str) -> tuple[np.ndarray, np.ndarray]:
+        """Return the unique hash buckets of *text* and their unit weights."""
+        padded = f" {' '.join(text.lower().split())} "
+        n = self.n
+        hashed = [
+            zlib.crc32(padded[i:i + n].encode("utf-8")) % self.dim
+            for i in range(len(padded) - n + 1)
+        ]
+        if not hashed:
+            return np.empty(0, dtype=np.intp), np.empty(0, dtype=np.float32)
+        buckets, counts = np.unique(np.asarray(hashed, dtype=np.intp), return_counts=True)
+        weights = counts.astype(np.float32)
+        weights /= np.linalg.norm(weights)
+        return buckets, weights
+
+    def _vector(self, text: str) -> np.ndarray:
+        vector = np.zeros(self.dim, dtype=np.float32)
+        buckets, weights = self._features(text)
+        vector[buckets] = weights
+        return vector
@@ -2,27 +2,187 @@
 
 from __future__ import annotations
 
+import json
 import logging
+import math
 import os
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Optional
+from typing import Any, Optional
 
 import yaml
 
+from .cache import CacheInfo, LRUCache
+from .skill_index import BM25Index, NgramIndex, TriggerIndex
+
 logger = logging.getLogger(__name__)
 
+_MANIFEST_VERSION = 5
+
+# libyaml's loader is several times faster than the pure-Python one.
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# Fingerprint slot of a file whose stamp has not been taken yet.
+_UNKNOWN = object()
+
+# Below this many pending skills a thread pool costs more than it saves.
+_PARALLEL_THRESHOLD = 8
+
+
+class _ReadOnlyDict(dict):
+    """A ``dict`` that refuses mutation.
+
+    Used for the per-skill result dicts shared between every search and
+    listing call.  Being a real ``dict`` subclass it still serialises with
+    :func:`json.dumps` and copies with ``dict(...)`` / ``{**d}``.
+    """
+
+    __slots__ = ()
+
+    def _readonly(self, *args: Any, **kwargs: Any) -> None:
+        raise TypeError("skill dicts are read-only; copy with dict(...) first")
+
+    __setitem__ = __delitem__ = __ior__ = _readonly
+    clear = pop = popitem = setdefault = update = _readonly
 
-@dataclass
+    def __reduce__(self):
+        return (type(self), (dict(self),))
+
+
+@dataclass(frozen=True, slots=True)
 class SkillMeta:
-    """Parsed metadata from a skill's skill.yaml."""
+    """Parsed metadata from a skill's skill.yaml.
+
+    Execution settings come from the optional ``execution`` mapping in
+    ``skill.yaml``, e.g.::
+
+        execution:
+          backend: process   # None: use the executor's default
+          cacheable: true    # results depend only on params
+          cache_ttl: 300     # seconds; None: no expiry
+          timeout: 30        # seconds per call; None: no deadline
+
+    Instances are immutable.  Lowered triggers and the read-only dict returned
+    by searches are computed once here, so the search paths do not allocate
+    per call.
+    """
 
     name: str
     description: str
-    triggers: list[str]
+    triggers: tuple[str, ...]
     entry_point: str
     version: str = "1.0.0"
     directory: Path = field(default_factory=lambda: Path("."))
+    backend: Optional[str] = None
+    cacheable: bool = False
+    cache_ttl: Optional[float] = None
+    timeout: Optional[float] = None
+    lowered_triggers: tuple[str, ...] = field(init=False, repr=False, compare=False)
+    _view: _ReadOnlyDict = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        triggers = tuple(self.triggers)
+        object.__setattr__(self, "triggers", triggers)
+        object.__setattr__(self, "lowered_triggers", tuple(t.lower() for t in triggers))
+        object.__setattr__(self, "_view", _ReadOnlyDict(
+            name=self.name,
+            description=self.description,
+            triggers=triggers,
+            version=self.version,
+        ))
+
+    def as_dict(self) -> dict:
+        """Return the shared, read-only search/listing dict for this skill."""
+        return self._view
+
+
+class _Snapshot:
+    """An indexed, immutable view of the skill set.
+
+    The registry publishes a new snapshot (a single attribute assignment) on
+    every reload, so a reader that grabbed one sees a consistent skill list
+    and indexes even while a reload is in progress.  The ranked and fuzzy
+    indexes are built on first use; building is idempotent and guarded by a
+    lock, so this does not change what the snapshot returns.
+    """
+
+    __slots__ = (
+        "skills", "skill_list", "trigger_index", "generation",
+        "_ranked_index", "_fuzzy_index", "_doc_stamps", "_lock",
+    )
+
+    def __init__(self, metas: list[SkillMeta], generation: int) -> None:
+        skills: dict[str, SkillMeta] = {}
+        for meta in metas:
+            skills[meta.name] = meta
+        self.skills = skills
+        self.skill_list: tuple[SkillMeta, ...] = tuple(skills.values())
+        self.trigger_index = TriggerIndex(
+            skill.lowered_triggers for skill in self.skill_list
+        )
+        self.generation = generation
+        self._ranked_index: Optional[BM25Index] = None
+        self._fuzzy_index: Optional[NgramIndex] = None
+        self._doc_stamps: dict[str, Optional[tuple[int, ...]]] = {}
+        self._lock = threading.Lock()
+
+    def ranked_index(self) -> BM25Index:
+        """Return the BM25 index, building it on first use.
+
+        Building requires reading every ``SKILL.md``, so it is deferred until
+        a ranked search is actually requested to keep construction cheap.
+        """
+        if self._ranked_index is None:
+            with self._lock:
+                if self._ranked_index is None:
+                    documents = []
+                    for skill in self.skill_list:
+                        text, stamp = _ranking_document(skill)
+                        documents.append(text)
+                        self._doc_stamps[skill.name] = stamp
+                    self._ranked_index = BM25Index(documents)
+        return self._ranked_index
+
+    def doc_stamp(self, name: str) -> Any:
+        """Stamp of the ``SKILL.md`` the ranked index read for *name*.
+
+        ``_UNKNOWN`` if the index has not been built, so the snapshot does
+        not depend on that file yet.
+        """
+        return self._doc_stamps.get(name, _UNKNOWN)
+
+    def fuzzy_index(self) -> NgramIndex:
+        """Return the n-gram similarity index, building it on first use."""
+        if self._fuzzy_index is None:
+            with self._lock:
+                if self._fuzzy_index is None:
+                    self._fuzzy_index = NgramIndex(
+                        " ".join([skill.name.replace("_", " "), skill.description, *skill.triggers])
+                        for skill in self.skill_list
+                    )
+        return self._fuzzy_index
+
+
+def _ranking_document(skill: SkillMeta) -> tuple[str, Optional[tuple[int, ...]]]:
+    """Concatenate the text a skill is ranked on.
+
+    Also returns the stamp of the ``SKILL.md`` that was read (``None`` if
+    there is none), so :meth:`SkillRegistry.reload` can tell whether the
+    index went stale.
+    """
+    parts = [skill.name.replace("_", " "), skill.description, *skill.triggers]
+    stamp = None
+    try:
+        with open(skill.directory / "SKILL.md", "r", encoding="utf-8") as fh:
+            st = os.fstat(fh.fileno())
+            parts.append(fh.read())
+        stamp = (st.st_mtime_ns, st.st_size)
+    except OSError:
+        pass
+    return "\n".join(parts), stamp
 
 
 class SkillRegistry:
@@ -33,82 +193,649 @@ class SkillRegistry:
     base_path:
         Root directory that contains individual skill sub-directories.
         Defaults to the ``SKILLS_BASE_PATH`` env-var, or ``./skills``.
+    manifest_path:
+        Optional JSON file used to snapshot the parsed metadata of every
+        skill.  On construction the snapshot is reused for every skill whose
+        ``skill.yaml`` mtime and size are unchanged, so only new or edited
+        skills are parsed.  Defaults to the ``SKILLS_MANIFEST_PATH`` env-var;
+        when neither is set no manifest is read or written.
+    lazy:
+        When true, construction only records which sub-directories hold a
+        ``skill.yaml``.  Each skill is parsed the first time it is looked up
+        by :meth:`get_skill_by_name` or returned by a trigger search, and
+        memoized.  Trigger searches match against a catalog of just the
+        triggers, taken from the manifest records where ``skill.yaml`` is
+        unchanged (skills without one are parsed to learn theirs).  Listing,
+        ranked and fuzzy searches, and :meth:`reload` need every skill, so
+        they load all remaining skills.
+    max_workers:
+        Size of the thread pool used to stat and parse skills concurrently,
+        which mainly helps on slow or network-mounted skill trees.  ``None``
+        uses the :class:`~concurrent.futures.ThreadPoolExecutor` default and
+        ``1`` loads sequentially.  Result order is unaffected.
+    cache_size:
+        Number of distinct searches kept in an LRU cache keyed on the lowered
+        query text and search options.  The cache is cleared whenever the
+        skill set is (re)indexed.  ``0`` disables it.
     """
 
-    def __init__(self, base_path: Optional[str] = None) -> None:
+    def __init__(
+        self,
+        base_path: Optional[str] = None,
+        manifest_path: Optional[str] = None,
+        lazy: bool = False,
+        max_workers: Optional[int] = None,
+        cache_size: int = 1024,
+    ) -> None:
         resolved = base_path or os.environ.get("SKILLS_BASE_PATH", "./skills")
         self.base_path = Path(resolved).resolve()
-        self._skills: dict[str, SkillMeta] = {}
-        self._load_skills()
+        manifest = manifest_path or os.environ.get("SKILLS_MANIFEST_PATH")
+        self.manifest_path = Path(manifest).resolve() if manifest else None
+        self.lazy = lazy
+        self.max_workers = max_workers
+        self._snapshot = _Snapshot([], generation=0)
+        self._search_cache = LRUCache(maxsize=cache_size)
+        self._lock = threading.RLock()
+        self._manifest: dict = {}
+        self._base_mtime: Optional[int] = None
+        self._children: list[Path] = []
+        self._pending: dict[str, Path] = {}
+        # Per directory name: parsed meta, manifest entry and the stamps of
+        # every watched file (used by reload() to detect changes).
+        self._loaded: dict[str, SkillMeta] = {}
+        self._entries: dict[str, dict] = {}
+        self._fingerprints: dict[str, tuple] = {}
+        # Skills resolved by name before the first full load (lazy mode).
+        self._partial: dict[str, SkillMeta] = {}
+        # Lazy mode: skill directories and their trigger index, built on the
+        # first trigger search before a full load.
+        self._catalog: Optional[tuple[tuple[Path, ...], TriggerIndex]] = None
+        self._complete = False
+        self._watch_thread: Optional[threading.Thread] = None
+        self._watch_stop = threading.Event()
+        self._discover_skills()
+        if not lazy:
+            self._ensure_loaded()
 
     # ------------------------------------------------------------------
     # Public API
     # ------------------------------------------------------------------
 
-    def search_skills(self, query: str, context: str = "") -> list[dict]:
+    @property
+    def generation(self) -> int:
+        """Counter incremented every time a new skill set is published."""
+        return self._snapshot.generation
+
+    def search_skills(
+        self,
+        query: str,
+        context: str = "",
+        *,
+        ranked: bool = False,
+        top_k: Optional[int] = None,
+        min_score: float = 0.0,
+        fuzzy_threshold: Optional[float] = None,
+    ) -> list[dict]:
         """Return skills whose trigger keywords match *query* or *context*.
 
-        The matching is intentionally simple: every trigger phrase is checked
-        against the lowered query + context string.  This keeps the registry
-        deterministic and fast (no LLM call needed).
+        The matching is intentionally simple: a skill matches when any of its
+        trigger phrases is a substring of the lowered query + context string.
+        All triggers are compiled into a single :class:`TriggerIndex`, so the
+        text is scanned once regardless of how many skills are registered.
+        This keeps the registry deterministic and fast (no LLM call needed).
+
+        With ``ranked=True`` the skills are instead scored with BM25 over
+        their triggers, description and ``SKILL.md`` body.  Results are
+        ordered by descending ``score`` (included in each dict), limited to
+        skills scoring above *min_score*, and truncated to *top_k* if given.
+
+        If *fuzzy_threshold* is set and the trigger pass finds nothing, a
+        second stage compares the text against each skill's name, description
+        and triggers by character n-gram cosine similarity, returning skills
+        above the threshold with their ``score``.  This catches typos and
+        spelling variants that no trigger matches exactly.
         """
         combined = f"{query} {context}".lower()
-        results: list[dict] = []
-        for skill in self._skills.values():
-            for trigger in skill.triggers:
-                if trigger.lower() in combined:
-                    results.append(self._skill_to_dict(skill))
-                    break
+        if not ranked and not self._complete:
+            # Lazy mode: match the trigger catalog and load only the hits.
+            key = (self._snapshot.generation, combined, ranked, top_k, min_score, fuzzy_threshold)
+            cached = self._search_cache.get(key)
+            if cached is not None:
+                return list(cached)
+            directories, index = self._trigger_catalog()
+            matches = self._load_matches(directories, index.match(combined))
+            if matches or fuzzy_threshold is None:
+                results = [meta.as_dict() for meta in matches[:top_k]]
+                self._search_cache.put(key, tuple(results))
+                return results
+
+        snap = self._current_snapshot()
+        key = (snap.generation, combined, ranked, top_k, min_score, fuzzy_threshold)
+        cached = self._search_cache.get(key)
+        if cached is not None:
+            return list(cached)
+
+        skills = snap.skill_list
+        if ranked:
+            hits = snap.ranked_index().search(combined, top_k, min_score)
+            results = [self._scored_dict(skills[i], score) for i, score in hits]
+        else:
+            matches = snap.trigger_index.match(combined)
+            if not matches and fuzzy_threshold is not None:
+                hits = snap.fuzzy_index().search(combined, top_k, fuzzy_threshold)
+                results = [self._scored_dict(skills[i], score) for i, score in hits]
+            else:
+                if top_k is not None:
+                    matches = matches[:top_k]
+                results = [skills[i].as_dict() for i in matches]
+
+        self._search_cache.put(key, tuple(results))
         return results
 
+    def search_skills_many(
+        self,
+        queries: list[str],
+        context: str = "",
+    ) -> list[list[dict]]:
+        """Run trigger search for a batch of *queries* in one call.
+
+        Equivalent to ``[self.search_skills(q, context) for q in queries]``
+        but scans each distinct lowered query only once.
+        """
+        if not self._complete:
+            directories, index = self._trigger_catalog()
+            return [
+                [meta.as_dict() for meta in self._load_matches(directories, ids)]
+                for ids in index.match_many(f"{q} {context}" for q in queries)
+            ]
+        snap = self._current_snapshot()
+        skills = snap.skill_list
+        return [
+            [skills[i].as_dict() for i in ids]
+            for ids in snap.trigger_index.match_many(f"{q} {context}" for q in queries)
+        ]
+
+    def cache_info(self) -> CacheInfo:
+        """Return hit/miss statistics of the search result cache."""
+        return self._search_cache.info()
+
     def get_skill_by_name(self, name: str) -> Optional[SkillMeta]:
-        return self._skills.get(name)
+        meta = self._snapshot.skills.get(name)
+        if meta is not None or self._complete:
+            return meta
+        meta = self._partial.get(name)
+        if meta is not None:
+            return meta
+        with self._lock:
+            child = self._pending.get(name)
+            if child is not None:
+                self._load_child(child)
+            meta = self._partial.get(name)
+            if meta is None:
+                # The skill's name differs from its directory name, or it
+                # does not exist: only a full load can tell.
+                self._ensure_loaded()
+                meta = self._snapshot.skills.get(name)
+        return meta
+
+    def get_all_skills(self) -> tuple[SkillMeta, ...]:
+        """Return the metadata of every skill, in discovery order."""
+        return self._current_snapshot().skill_list
 
     def list_skills(self) -> list[dict]:
-        return [self._skill_to_dict(s) for s in self._skills.values()]
+        return [skill.as_dict() for skill in self._current_snapshot().skill_list]
+
+    def reload(self) -> bool:
+        """Rescan *base_path* and publish a new snapshot if anything changed.
+
+        A skill counts as changed when its ``skill.yaml``, ``SKILL.md``,
+        ``schema.json`` or entry-point file was added, removed or has a new
+        mtime or size.  Only changed skills are re-read; everything else is
+        carried over.  The new snapshot replaces the old one in a single
+        assignment, so concurrent searches see either the old or the new
+        skill set, never a mix.  Returns whether a new snapshot was published.
+
+        Loading only stats ``skill.yaml``; the other files are first stamped
+        here (or restored from the manifest).  A change made before that is
+        not reported, as nothing loaded so far depended on those files, except
+        a ``SKILL.md`` already read into the ranked index, whose stamp the
+        snapshot keeps.
+        """
+        with self._lock:
+            self._ensure_loaded()
+            children = self._scan_children()
+            names = {child.name for child in children}
+            removed = [name for name in self._fingerprints if name not in names]
+            stale = []
+            stamps = {}
+            for child in children:
+                meta = self._loaded.get(child.name)
+                fresh = stamps[child.name] = self._fingerprint(child, meta)
+                known = self._fingerprints.get(child.name)
+                if known is not None and meta is not None and known[1] is _UNKNOWN:
+                    known = (known[0], self._snapshot.doc_stamp(meta.name), *known[2:])
+                if known is None or any(
+                    old is not _UNKNOWN and old != new for old, new in zip(known, fresh)
+                ):
+                    stale.append(child)
+                else:
+                    self._set_fingerprint(child.name, fresh)
+            if not stale and not removed:
+                self._save_manifest()  # records the stamps taken above
+                return False
+
+            for name in removed:
+                self._loaded.pop(name, None)
+                self._entries.pop(name, None)
+                self._fingerprints.pop(name, None)
+            for child, result in zip(stale, self._read_children(stale)):
+                self._loaded.pop(child.name, None)
+                self._register_child(child, result)
+                # Stamps from before the re-read: an edit racing it is seen next time.
+                self._set_fingerprint(child.name, stamps[child.name])
+            self._children = children
+            if self.base_path.is_dir():
+                self._base_mtime = self.base_path.stat().st_mtime_ns
+            self._publish()
+            self._save_manifest()
+            logger.info(
+                "Reloaded skills: %d changed, %d removed", len(stale), len(removed)
+            )
+            return True
+
+    def start_watching(self, interval: float = 2.0) -> None:
+        """Poll for skill changes every *interval* seconds in the background.
+
+        Polling compares file mtimes (see :meth:`reload`), so it works on any
+        filesystem without inotify.  Calling this twice is a no-op.
+        """
+        with self._lock:
+            if self._watch_thread is not None:
+                return
+            self._watch_stop.clear()
+            self._watch_thread = threading.Thread(
+                target=self._watch_loop,
+                args=(interval,),
+                name="skill-registry-watch",
+                daemon=True,
+            )
+            self._watch_thread.start()
+
+    def stop_watching(self) -> None:
+        """Stop the background watcher started by :meth:`start_watching`."""
+        thread = self._watch_thread
+        if thread is None:
+            return
+        self._watch_stop.set()
+        thread.join()
+        self._watch_thread = None
 
     # ------------------------------------------------------------------
     # Internal helpers
     # ------------------------------------------------------------------
 
-    def _load_skills(self) -> None:
-        """Scan *base_path* for sub-directories containing ``skill.yaml``."""
+    def _current_snapshot(self) -> _Snapshot:
+        self._ensure_loaded()
+        return self._snapshot
+
+    def _watch_loop(self, interval: float) -> None:
+        while not self._watch_stop.wait(interval):
+            try:
+                self.reload()
+            except Exception:
+                logger.exception("Skill reload failed")
+
+    def _discover_skills(self) -> None:
+        """Record the sub-directories of *base_path* that may hold a skill.
+
+        When a manifest is configured and *base_path* has not been modified
+        since it was written, the recorded listing is reused instead of
+        calling ``iterdir``.
+        """
         if not self.base_path.is_dir():
             logger.warning("Skills base path does not exist: %s", self.base_path)
             return
 
-        for child in sorted(self.base_path.iterdir()):
-            if not child.is_dir():
-                continue
-            yaml_path = child / "skill.yaml"
-            if not yaml_path.exists():
-                continue
-            try:
-                meta = self._parse_yaml(yaml_path, child)
-                self._skills[meta.name] = meta
-                logger.info("Loaded skill: %s (v%s)", meta.name, meta.version)
-            except Exception:
-                logger.exception("Failed to load skill from %s", child)
+        self._manifest = self._read_manifest()
+        self._entries = {
+            entry["dir"]: entry for entry in self._manifest.get("skills", [])
+        }
+        self._base_mtime = self.base_path.stat().st_mtime_ns
+        if self._manifest and self._manifest.get("base_mtime_ns") == self._base_mtime:
+            names = self._manifest["children"]
+            self._children = [self.base_path / name for name in names]
+        else:
+            self._children = self._scan_children()
+        self._pending = {child.name: child for child in self._children}
+
+    def _scan_children(self) -> list[Path]:
+        """List the sub-directories of *base_path* in sorted order."""
+        if not self.base_path.is_dir():
+            return []
+        # scandir reports entry types without a stat() per child.
+        with os.scandir(self.base_path) as it:
+            names = sorted(entry.name for entry in it if entry.is_dir())
+        return [self.base_path / name for name in names]
+
+    def _ensure_loaded(self) -> None:
+        """Parse every pending skill, then publish the first snapshot.
+
+        Unchanged skills are restored from the manifest instead of being
+        re-parsed, and the manifest is rewritten if anything changed.
+        """
+        if self._complete:
+            return
+        with self._lock:
+            if self._complete:
+                return
+            pending = list(self._pending.values())
+            for child, result in zip(pending, self._read_children(pending)):
+                self._register_child(child, result)
+            self._pending.clear()
+            self._partial.clear()
+            self._publish()
+            self._save_manifest()
+            self._complete = True
+
+    def _publish(self) -> None:
+        """Build a snapshot of the loaded skills and swap it in."""
+        # Discovery order, regardless of the order skills were loaded in.
+        ordered = [self._loaded[c.name] for c in self._children if c.name in self._loaded]
+        self._snapshot = _Snapshot(ordered, self._snapshot.generation + 1)
+        self._search_cache.clear()
+
+    def _load_child(self, child: Path) -> Optional[SkillMeta]:
+        """Load the skill in *child*, from the manifest if it is unchanged."""
+        meta = self._register_child(child, self._read_child(child))
+        if meta is not None:
+            self._partial[meta.name] = meta
+        return meta
+
+    def _read_children(self, children: list[Path]) -> list[tuple]:
+        """:meth:`_read_child` every entry of *children*, in parallel if large."""
+        return self._map_children(self._read_child, children)
+
+    def _map_children(self, fn: Any, children: list[Path]) -> list:
+        """``[fn(child) for child in children]``, in parallel if large."""
+        if self.max_workers != 1 and len(children) >= _PARALLEL_THRESHOLD:
+            with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+                return list(pool.map(fn, children))
+        return [fn(child) for child in children]
+
+    def _trigger_catalog(self) -> tuple[tuple[Path, ...], TriggerIndex]:
+        """Return the skill directories and an index of their triggers.
+
+        Used by trigger searches in lazy mode instead of the full snapshot.
+        Triggers come from the loaded skill or from its manifest record when
+        ``skill.yaml`` is unchanged; only the remaining skills are parsed
+        (and memoized, as they had to be read anyway).
+        """
+        catalog = self._catalog
+        if catalog is not None:
+            return catalog
+        with self._lock:
+            if self._catalog is not None:
+                return self._catalog
+            children = list(self._children)
+            triggers = self._map_children(self._recorded_triggers, children)
+            unknown = [child for child, found in zip(children, triggers) if found is None]
+            for child, result in zip(unknown, self._read_children(unknown)):
+                meta = self._register_child(child, result)
+                if meta is not None:
+                    self._partial[meta.name] = meta
+            directories, lowered = [], []
+            for child, found in zip(children, triggers):
+                if found is None:
+                    meta = self._loaded.get(child.name)
+                    if meta is None:
+                        continue
+                    found = meta.lowered_triggers
+                directories.append(child)
+                lowered.append(found)
+            self._catalog = (tuple(directories), TriggerIndex(lowered))
+            return self._catalog
+
+    def _recorded_triggers(self, child: Path) -> Optional[tuple[str, ...]]:
+        """Lowered triggers of *child* without parsing it, or ``None``."""
+        meta = self._loaded.get(child.name)
+        if meta is not None:
+            return meta.lowered_triggers
+        entry = self._entries.get(child.name)
+        if entry is None or entry["stamp"] != self._file_stamp(child / "skill.yaml"):
+            return None
+        return tuple(trigger.lower() for trigger in entry["meta"]["triggers"])
+
+    def _load_matches(self, directories: tuple[Path, ...], ids: list[int]) -> list[SkillMeta]:
+        """Return the memoized metas of ``directories[i]`` for each of *ids*."""
+        metas = []
+        for i in ids:
+            child = directories[i]
+            meta = self._loaded.get(child.name)
+            if meta is None:
+                with self._lock:
+                    meta = self._loaded.get(child.name) or self._load_child(child)
+            if meta is not None:
+                metas.append(meta)
+        return metas
+
+    def _read_child(
+        self,
+        child: Path,
+    ) -> tuple[Optional[SkillMeta], Optional[dict], tuple]:
+        """Stat and parse *child* without touching registry state.
+
+        Returns ``(meta, entry, fingerprint)``: the parsed meta (``None`` if
+        the directory holds no loadable skill), its manifest entry (``None``
+        when no manifest is configured) and the stamps of its watched files.
+        Only ``skill.yaml`` is stat'ed; the other stamps come from the
+        manifest entry, or are left ``_UNKNOWN`` for :meth:`reload` to take.
+        Safe to call from worker threads.
+        """
+        yaml_path = child / "skill.yaml"
+        stamp = self._file_stamp(yaml_path)
+        unknown = (_as_tuple(stamp), _UNKNOWN, _UNKNOWN, _UNKNOWN)
+        if stamp is None:
+            return None, None, unknown
+        entry = self._entries.get(child.name)
+        try:
+            if entry is not None and entry["stamp"] == stamp:
+                meta = self._meta_from_record(entry["meta"], child)
+                files = entry.get("files")
+                if files is None:
+                    return meta, entry, unknown
+                return meta, entry, (_as_tuple(stamp), *map(_as_tuple, files))
+            meta = self._parse_yaml(yaml_path, child)
+        except Exception:
+            logger.exception("Failed to load skill from %s", child)
+            return None, None, unknown
+        fingerprint = unknown
+        if self.manifest_path is None:
+            return meta, None, fingerprint
+        entry = {"dir": child.name, "stamp": stamp, "meta": self._meta_to_record(meta)}
+        return meta, entry, fingerprint
+
+    def _register_child(
+        self,
+        child: Path,
+        result: tuple[Optional[SkillMeta], Optional[dict], tuple],
+    ) -> Optional[SkillMeta]:
+        meta, entry, fingerprint = result
+        self._pending.pop(child.name, None)
+        self._fingerprints[child.name] = fingerprint
+        if meta is None:
+            self._entries.pop(child.name, None)
+            return None
+        if entry is not None:
+            self._entries[child.name] = entry
+        self._loaded[child.name] = meta
+        logger.info("Loaded skill: %s (v%s)", meta.name, meta.version)
+        return meta
+
+    def _set_fingerprint(self, name: str, fingerprint: tuple) -> None:
+        """Record *fingerprint* for directory *name*, and in its manifest entry."""
+        self._fingerprints[name] = fingerprint
+        entry = self._entries.get(name)
+        if entry is not None:
+            # A new dict: the old one may be shared with the last saved manifest.
+            files = [list(stamp) if stamp is not None else None for stamp in fingerprint[1:]]
+            self._entries[name] = {**entry, "files": files}
+
+    def _fingerprint(self, child: Path, meta: Optional[SkillMeta]) -> tuple:
+        """Return the stamps of every file whose change should reload *child*."""
+        entry_point = meta.entry_point if meta is not None else "main.py"
+        return (
+            _as_tuple(self._file_stamp(child / "skill.yaml")),
+            _as_tuple(self._file_stamp(child / "SKILL.md")),
+            _as_tuple(self._file_stamp(child / "schema.json")),
+            _as_tuple(self._file_stamp(child / entry_point)),
+        )
+
+    def _save_manifest(self) -> None:
+        """Write the manifest if one is configured and its content changed."""
+        if self.manifest_path is None or self._base_mtime is None:
+            return
+        snapshot = {
+            "version": _MANIFEST_VERSION,
+            "base_path": str(self.base_path),
+            "base_mtime_ns": self._base_mtime,
+            "children": [child.name for child in self._children],
+            "skills": [
+                self._entries[child.name]
+                for child in self._children
+                if child.name in self._entries and child.name in self._loaded
+            ],
+        }
+        if snapshot != self._manifest:
+            self._write_manifest(snapshot)
+            self._manifest = snapshot
+
+    def _read_manifest(self) -> dict:
+        """Return the stored manifest, or ``{}`` if it is missing or stale."""
+        if self.manifest_path is None or not self.manifest_path.exists():
+            return {}
+        try:
+            data = json.loads(self.manifest_path.read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError):
+            logger.warning("Ignoring unreadable skills manifest: %s", self.manifest_path)
+            return {}
+        if (
+            not isinstance(data, dict)
+            or data.get("version") != _MANIFEST_VERSION
+            or data.get("base_path") != str(self.base_path)
+        ):
+            return {}
+        return data
+
+    def _write_manifest(self, snapshot: dict) -> None:
+        """Atomically replace the manifest file with *snapshot*.
+
+        Each writer uses its own temporary file, so registries in several
+        processes sharing one manifest never interleave their writes.
+        """
+        tmp_name = None
+        try:
+            self.manifest_path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_name = tempfile.mkstemp(
+                dir=self.manifest_path.parent,
+                prefix=self.manifest_path.name + ".",
+                suffix=".tmp",
+            )
+            with os.fdopen(fd, "w", encoding="utf-8") as fh:
+                fh.write(json.dumps(snapshot))
+            os.replace(tmp_name, self.manifest_path)
+        except OSError:
+            logger.warning("Could not write skills manifest: %s", self.manifest_path)
+            if tmp_name is not None:
+                try:
+                    os.unlink(tmp_name)
+                except OSError:
+                    pass
+
+    @staticmethod
+    def _file_stamp(path: Path) -> Optional[list[int]]:
+        """Return ``[mtime_ns, size]`` for *path*, or ``None`` if missing."""
+        try:
+            st = path.stat()
+        except OSError:
+            return None
+        return [st.st_mtime_ns, st.st_size]
 
     @staticmethod
     def _parse_yaml(yaml_path: Path, directory: Path) -> SkillMeta:
         with open(yaml_path, "r", encoding="utf-8") as fh:
-            data = yaml.safe_load(fh)
+            data = yaml.load(fh, Loader=_YAML_LOADER)
 
+        execution = data.get("execution") or {}
         return SkillMeta(
             name=data["name"],
             description=data["description"],
-            triggers=data.get("triggers", []),
+            triggers=tuple(data.get("triggers") or ()),
             entry_point=data.get("entry_point", "main.py"),
             version=str(data.get("version", "1.0.0")),
             directory=directory,
+            backend=execution.get("backend"),
+            cacheable=_as_flag(execution, "cacheable"),
+            cache_ttl=_as_seconds(execution, "cache_ttl"),
+            timeout=_as_seconds(execution, "timeout"),
         )
 
     @staticmethod
-    def _skill_to_dict(skill: SkillMeta) -> dict:
+    def _scored_dict(skill: SkillMeta, score: float) -> dict:
+        return _ReadOnlyDict(skill.as_dict(), score=score)
+
+    @staticmethod
+    def _meta_to_record(meta: SkillMeta) -> dict:
         return {
-            "name": skill.name,
-            "description": skill.description,
-            "triggers": skill.triggers,
-            "version": skill.version,
+            "name": meta.name,
+            "description": meta.description,
+            "triggers": list(meta.triggers),
+            "entry_point": meta.entry_point,
+            "version": meta.version,
+            "backend": meta.backend,
+            "cacheable": meta.cacheable,
+            "cache_ttl": meta.cache_ttl,
+            "timeout": meta.timeout,
         }
+
+    @staticmethod
+    def _meta_from_record(record: dict, directory: Path) -> SkillMeta:
+        return SkillMeta(
+            name=record["name"],
+            description=record["description"],
+            triggers=tuple(record["triggers"]),
+            entry_point=record["entry_point"],
+            version=record["version"],
+            directory=directory,
+            backend=record["backend"],
+            cacheable=record["cacheable"],
+            cache_ttl=record["cache_ttl"],
+            timeout=record["timeout"],
+        )
+
+
+def _as_tuple(stamp: Optional[list[int]]) -> Optional[tuple[int, ...]]:
+    return tuple(stamp) if stamp is not None else None
+
+
+def _as_flag(execution: dict, key: str) -> bool:
+    """Read a boolean ``execution`` setting; a quoted ``"false"`` is false."""
+    value = execution.get(key, False)
+    if isinstance(value, bool):
+        return value
+    if isinstance(value, str) and value.strip().lower() in ("true", "false"):
+        return value.strip().lower() == "true"
+    raise ValueError(f"execution.{key} must be true or false, got {value!r}")
+
+
+def _as_seconds(execution: dict, key: str) -> Optional[float]:
+    """Read a duration ``execution`` setting as a positive number of seconds."""
+    value = execution.get(key)
+    if value is None:
+        return None
+    try:
+        seconds = float(value) if not isinstance(value, bool) else math.nan
+    except (TypeError, ValueError):
+        seconds = math.nan
+    if not (0 < seconds < math.inf):
+        raise ValueError(f"execution.{key} must be a positive number of seconds, got {value!r}")
+    return seconds
@@ -9,6 +9,7 @@ from langgraph.graph import END, StateGraph
 
 from .nodes import (
     GraphState,
+    RoutingStats,
     analyze_query,
     execute_skills,
     load_skill_context,
@@ -16,12 +17,28 @@ from .nodes import (
     route_next,
     select_skills,
 )
+from .llm_cache import LLMResponseCache
+from .llm_provider import LLMProvider
 from .skill_executor import SkillExecutor
 from .skill_registry import SkillRegistry
 
 
 def create_skills_graph(
     skills_base_path: Optional[str] = None,
+    manifest_path: Optional[str] = None,
+    search_top_k: Optional[int] = None,
+    search_min_score: float = 0.0,
+    fuzzy_threshold: Optional[float] = None,
+    fast_path_threshold: Optional[float] = None,
+    routing_stats: Optional[RoutingStats] = None,
+    watch_interval: Optional[float] = None,
+    executor_backend: str = "inline",
+    skill_concurrency: int = 4,
+    batch_params: bool = False,
+    warm_up: bool = False,
+    executor: Optional[SkillExecutor] = None,
+    llm_provider: Optional[LLMProvider] = None,
+    llm_cache: Optional[LLMResponseCache] = None,
 ) -> StateGraph:
     """Build and compile the skills agent graph.
 
@@ -30,27 +47,104 @@ def create_skills_graph(
     skills_base_path:
         Root directory containing skill sub-directories.
         Forwarded to :class:`SkillRegistry`.
+    manifest_path:
+        Optional skills manifest file used to skip re-parsing unchanged
+        ``skill.yaml`` files.  Forwarded to :class:`SkillRegistry`.
+    search_top_k, search_min_score:
+        When *search_top_k* is set, ``analyze`` uses ranked BM25 search and
+        offers at most that many skills scoring above *search_min_score* to
+        the router instead of every trigger match.
+    fuzzy_threshold:
+        Minimum n-gram similarity for the fuzzy fallback used when no
+        trigger matches the query.  ``None`` disables the fallback.
+    fast_path_threshold:
+        Match confidence (see :func:`~src.nodes.match_confidence`) at which
+        ``analyze`` selects the best skill itself and skips the
+        ``select_skills`` LLM call.  ``None`` disables the fast path.
+    routing_stats:
+        Optional :class:`~src.nodes.RoutingStats` counting how often the
+        fast path fires.
+    watch_interval:
+        If set, the registry polls the skills directory every
+        *watch_interval* seconds and atomically swaps in added, removed or
+        edited skills without rebuilding the graph.
+    executor_backend:
+        Default :class:`SkillExecutor` backend (``"inline"`` or
+        ``"process"``); skills may override it in their ``skill.yaml``.
+    skill_concurrency:
+        Maximum number of selected skills whose params extraction and
+        execution run at the same time in ``execute_skills``.
+    batch_params:
+        Extract the params of all selected skills with a single LLM call
+        (falling back to per-skill calls for anything it fails to cover).
+    warm_up:
+        Start :meth:`SkillExecutor.start_warm_up` in the background, so the
+        first request to each skill does not pay for imports, file reads and
+        schema compilation.  Readiness is exposed by the executor.
+    executor:
+        Optional pre-built :class:`SkillExecutor` (its registry is used as
+        well, and *skills_base_path*, *manifest_path* and *executor_backend*
+        are ignored).  Pass one to keep a handle for readiness checks,
+        e.g. ``executor.is_warm``, or for ``shutdown()``.
+    llm_provider:
+        :class:`LLMProvider` supplying the chat clients of the ``select``,
+        ``params`` and ``respond`` roles.  Defaults to the process-wide
+        provider, so graphs share pooled connections.
+    llm_cache:
+        Optional :class:`LLMResponseCache` used for the routing
+        (``select_skills``) and params extraction calls, which are
+        deterministic; the final ``respond`` call is never cached.
 
     Returns
     -------
     A compiled LangGraph :class:`StateGraph` ready for ``.invoke()``.
     """
-    registry = SkillRegistry(base_path=skills_base_path)
-    executor = SkillExecutor(registry)
+    if executor is None:
+        registry = SkillRegistry(
+            base_path=skills_base_path,
+            manifest_path=manifest_path,
+        )
+        executor = SkillExecutor(registry, backend=executor_backend)
+    registry = executor.registry
+    if watch_interval is not None:
+        registry.start_watching(watch_interval)
+    if warm_up:
+        executor.start_warm_up()
 
     # Bind dependencies via functools.partial so nodes stay pure functions
-    _analyze = functools.partial(analyze_query, registry=registry)
+    _analyze = functools.partial(
+        analyze_query,
+        registry=registry,
+        top_k=search_top_k,
+        min_score=search_min_score,
+        fuzzy_threshold=fuzzy_threshold,
+        fast_path_threshold=fast_path_threshold,
+        stats=routing_stats,
+    )
+    _select = functools.partial(
+        select_skills,
+        llm_provider=llm_provider,
+        llm_cache=llm_cache,
+    )
     _load_ctx = functools.partial(load_skill_context, executor=executor)
-    _execute = functools.partial(execute_skills, executor=executor)
+    _execute = functools.partial(
+        execute_skills,
+        executor=executor,
+        max_concurrency=skill_concurrency,
+        batch_params=batch_params,
+        llm_provider=llm_provider,
+        llm_cache=llm_cache,
+    )
+    _respond = functools.partial(respond, llm_provider=llm_provider)
 
     workflow = StateGraph(GraphState)
 
     # -- Add nodes --
     workflow.add_node("analyze", _analyze)
-    workflow.add_node("select_skills", select_skills)
+    workflow.add_node("select_skills", _select)
     workflow.add_node("load_skill_context", _load_ctx)
     workflow.add_node("execute_skills", _execute)
-    workflow.add_node("respond", respond)
+    workflow.add_node("respond", _respond)
 
     # -- Entry point --
     workflow.set_entry_point("analyze")
@@ -61,6 +155,7 @@ def create_skills_graph(
         route_next,
         {
             "select_skills": "select_skills",
+            "load_skill_context": "load_skill_context",
             "respond": "respond",
         },
     )
@@ -6,12 +6,21 @@ and the graph node functions (with LLM calls mocked out).
 
 from __future__ import annotations
 
+import asyncio
+import dataclasses
+import functools
 import json
+import os
+import random
+import shutil
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
 import pytest
 from langchain_core.messages import AIMessage, HumanMessage
+from langgraph.graph import END, StateGraph
 
 # ---------------------------------------------------------------------------
 # Resolve the skills directory relative to this test file
@@ -84,6 +93,67 @@ class TestSkillRegistry:
         results = registry.search_skills("tell me a joke")
         assert results == []
 
+    def test_ranked_search_orders_by_score(self):
+        registry = SkillRegistry(base_path=SKILLS_DIR)
+        results = registry.search_skills("create a Q4 sales report", ranked=True)
+        assert results[0]["name"] == "report_generator"
+        scores = [r["score"] for r in results]
+        assert scores == sorted(scores, reverse=True)
+
+    def test_ranked_search_top_k_and_threshold(self):
+        registry = SkillRegistry(base_path=SKILLS_DIR)
+        results = registry.search_skills("extract text from a pdf", ranked=True, top_k=1)
+        assert [r["name"] for r in results] == ["pdf"]
+        top_score = results[0]["score"]
+        assert registry.search_skills(
+            "extract text from a pdf", ranked=True, min_score=top_score
+        ) == []
+
+    def test_ranked_search_uses_skill_doc(self, tmp_path):
+        skill_dir = _write_skill(tmp_path, "alpha", ["alpha task"])
+        (skill_dir / "SKILL.md").write_text("Handles zebra migrations.", encoding="utf-8")
+        _write_skill(tmp_path, "beta", ["beta task"])
+        registry = SkillRegistry(base_path=str(tmp_path))
+        assert registry.search_skills("zebra") == []
+        assert [r["name"] for r in registry.search_skills("zebra", ranked=True)] == ["alpha"]
+
+    def test_fuzzy_fallback_handles_typos(self):
+        registry = SkillRegistry(base_path=SKILLS_DIR)
+        assert registry.search_skills("analyse the dataset") == []
+        results = registry.search_skills("analyse the dataset", fuzzy_threshold=0.3)
+        assert [r["name"] for r in results] == ["data_analyzer"]
+        assert 0.3 < results[0]["score"] <= 1.0
+
+    def test_fuzzy_fallback_threshold_rejects_unrelated(self):
+        registry = SkillRegistry(base_path=SKILLS_DIR)
+        assert registry.search_skills("tell me a joke", fuzzy_threshold=0.3) == []
+
+    def test_fuzzy_not_used_when_triggers_match(self):
+        registry = SkillRegistry(base_path=SKILLS_DIR)
+        results = registry.search_skills("merge pdf files", fuzzy_threshold=0.0)
+        assert [r["name"] for r in results] == ["pdf"]
+        assert "score" not in results[0]
+
+    def test_search_many_matches_single_search(self):
+        registry = SkillRegistry(base_path=SKILLS_DIR)
+        queries = [
+            "I want to create a sales report",
+            "tell me a joke",
+            "merge pdf documents together",
+            "I want to create a sales report",
+            "",
+        ]
+        batch = registry.search_skills_many(queries)
+        assert batch == [registry.search_skills(q) for q in queries]
+        assert batch[0] is not batch[3]
+
+    def test_search_many_with_context(self):
+        registry = SkillRegistry(base_path=SKILLS_DIR)
+        batch = registry.search_skills_many(["hello", "hi"], context="compose email")
+        assert [[r["name"] for r in row] for row in batch] == [
+            ["email_composer"], ["email_composer"],
+        ]
+
     def test_get_skill_by_name(self):
         registry = SkillRegistry(base_path=SKILLS_DIR)
         meta = registry.get_skill_by_name("report_generator")
@@ -91,6 +161,39 @@ class TestSkillRegistry:
         assert meta.name == "report_generator"
         assert meta.entry_point == "main.py"
 
+    def test_skill_meta_is_immutable(self):
+        registry = SkillRegistry(base_path=SKILLS_DIR)
+        meta = registry.get_skill_by_name("pdf")
+        assert not hasattr(meta, "__dict__")
+        assert meta.lowered_triggers == tuple(t.lower() for t in meta.triggers)
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            meta.name = "other"
+
+    def test_result_dicts_are_shared_and_read_only(self):
+        registry = SkillRegistry(base_path=SKILLS_DIR)
+        first = registry.search_skills("merge pdf documents")[0]
+        second = registry.search_skills("split pdf pages")[0]
+        assert first is second
+        with pytest.raises(TypeError):
+            first["name"] = "changed"
+        copy = dict(first)
+        copy["name"] = "changed"
+        assert json.loads(json.dumps(first))["name"] == "pdf"
+
+    def test_search_cache_hits(self):
+        registry = SkillRegistry(base_path=SKILLS_DIR)
+        first = registry.search_skills("Create a sales report")
+        second = registry.search_skills("create a SALES report")
+        assert first == second
+        info = registry.cache_info()
+        assert (info.hits, info.misses) == (1, 1)
+
+    def test_search_cache_disabled(self):
+        registry = SkillRegistry(base_path=SKILLS_DIR, cache_size=0)
+        registry.search_skills("Create a sales report")
+        registry.search_skills("Create a sales report")
+        assert registry.cache_info().hits == 0
+
     def test_get_skill_not_found(self):
         registry = SkillRegistry(base_path=SKILLS_DIR)
         assert registry.get_skill_by_name("nonexistent") is None
@@ -100,11 +203,447 @@ class TestSkillRegistry:
         assert registry.list_skills() == []
 
 
+def _write_skill(root: Path, name: str, triggers: list[str], description: str = "") -> Path:
+    """Create a minimal skill directory under *root* and return it."""
+    skill_dir = root / name
+    skill_dir.mkdir(parents=True, exist_ok=True)
+    (skill_dir / "skill.yaml").write_text(
+        f"name: {name}\n"
+        f"description: {description or name + ' skill'}\n"
+        "triggers:\n" + "".join(f"  - {t}\n" for t in triggers),
+        encoding="utf-8",
+    )
+    (skill_dir / "main.py").write_text(
+        "def execute(params):\n    return {'status': 'success', 'params': params}\n",
+        encoding="utf-8",
+    )
+    return skill_dir
+
+
+class TestSkillManifest:
+    def test_manifest_written_and_reused(self, tmp_path):
+        skills_root = tmp_path / "skills"
+        _write_skill(skills_root, "alpha", ["alpha task"])
+        _write_skill(skills_root, "beta", ["beta task"])
+        manifest = tmp_path / "manifest.json"
+
+        first = SkillRegistry(base_path=str(skills_root), manifest_path=str(manifest))
+        assert manifest.exists()
+
+        with patch.object(SkillRegistry, "_parse_yaml", side_effect=AssertionError):
+            second = SkillRegistry(
+                base_path=str(skills_root), manifest_path=str(manifest)
+            )
+        assert second.list_skills() == first.list_skills()
+        assert [r["name"] for r in second.search_skills("run the beta task")] == ["beta"]
+        assert second.get_skill_by_name("alpha").directory == skills_root / "alpha"
+
+    def test_only_changed_skills_reparsed(self, tmp_path):
+        skills_root = tmp_path / "skills"
+        _write_skill(skills_root, "alpha", ["alpha task"])
+        _write_skill(skills_root, "beta", ["beta task"])
+        manifest = tmp_path / "manifest.json"
+        SkillRegistry(base_path=str(skills_root), manifest_path=str(manifest))
+
+        _write_skill(skills_root, "beta", ["beta task", "second beta trigger"])
+        _write_skill(skills_root, "gamma", ["gamma task"])
+
+        original = SkillRegistry._parse_yaml
+        with patch.object(
+            SkillRegistry, "_parse_yaml", side_effect=original
+        ) as parse:
+            registry = SkillRegistry(
+                base_path=str(skills_root), manifest_path=str(manifest)
+            )
+        parsed = sorted(call.args[1].name for call in parse.call_args_list)
+        assert parsed == ["beta", "gamma"]
+        assert registry.get_skill_by_name("beta").triggers == (
+            "beta task", "second beta trigger",
+        )
+
+    def test_corrupt_manifest_ignored(self, tmp_path):
+        skills_root = tmp_path / "skills"
+        _write_skill(skills_root, "alpha", ["alpha task"])
+        manifest = tmp_path / "manifest.json"
+        manifest.write_text("{not json", encoding="utf-8")
+        registry = SkillRegistry(base_path=str(skills_root), manifest_path=str(manifest))
+        assert [s["name"] for s in registry.list_skills()] == ["alpha"]
+        assert json.loads(manifest.read_text(encoding="utf-8"))["skills"]
+
+    def test_concurrent_writers_use_private_temp_files(self, tmp_path):
+        skills_root = tmp_path / "skills"
+        for i in range(5):
+            _write_skill(skills_root, f"skill_{i}", [f"task {i}"])
+        manifest = tmp_path / "manifest.json"
+        registry = SkillRegistry(base_path=str(skills_root), manifest_path=str(manifest))
+        snapshot = json.loads(manifest.read_text(encoding="utf-8"))
+        with patch("src.skill_registry.os.replace", wraps=os.replace) as replace:
+            with ThreadPoolExecutor(max_workers=8) as pool:
+                list(pool.map(lambda _: registry._write_manifest(snapshot), range(32)))
+        assert len({call.args[0] for call in replace.call_args_list}) == 32
+        assert json.loads(manifest.read_text(encoding="utf-8")) == snapshot
+        assert [p.name for p in tmp_path.iterdir() if p.suffix == ".tmp"] == []
+
+
+class TestParallelDiscovery:
+    def test_parallel_matches_sequential(self, tmp_path):
+        for i in range(30):
+            _write_skill(tmp_path, f"skill_{i:02d}", [f"task {i:02d}", "common"])
+        (tmp_path / "skill_05" / "skill.yaml").write_text("name: [unclosed", encoding="utf-8")
+        (tmp_path / "not_a_skill").mkdir()
+
+        sequential = SkillRegistry(base_path=str(tmp_path), max_workers=1)
+        parallel = SkillRegistry(base_path=str(tmp_path), max_workers=4)
+        assert parallel.list_skills() == sequential.list_skills()
+        names = [s["name"] for s in parallel.list_skills()]
+        assert names == sorted(f"skill_{i:02d}" for i in range(30) if i != 5)
+        assert parallel.search_skills("common") == sequential.search_skills("common")
+
+
+class TestRegistryReload:
+    def test_reload_noop_when_unchanged(self, tmp_path):
+        _write_skill(tmp_path, "alpha", ["alpha task"])
+        registry = SkillRegistry(base_path=str(tmp_path))
+        generation = registry.generation
+        assert registry.reload() is False
+        assert registry.generation == generation
+
+    def test_reload_picks_up_added_changed_and_removed(self, tmp_path):
+        _write_skill(tmp_path, "alpha", ["alpha task"])
+        _write_skill(tmp_path, "beta", ["beta task"])
+        registry = SkillRegistry(base_path=str(tmp_path))
+        assert registry.search_skills("beta task")
+
+        _write_skill(tmp_path, "alpha", ["alpha task", "renamed alpha trigger"])
+        _write_skill(tmp_path, "gamma", ["gamma task"])
+        shutil.rmtree(tmp_path / "beta")
+
+        original = SkillRegistry._parse_yaml
+        with patch.object(SkillRegistry, "_parse_yaml", side_effect=original) as parse:
+            assert registry.reload() is True
+        assert sorted(call.args[1].name for call in parse.call_args_list) == ["alpha", "gamma"]
+        assert [s["name"] for s in registry.list_skills()] == ["alpha", "gamma"]
+        assert registry.search_skills("beta task") == []
+        assert registry.get_skill_by_name("beta") is None
+        assert [r["name"] for r in registry.search_skills("renamed alpha trigger")] == ["alpha"]
+
+    def test_doc_change_triggers_new_snapshot(self, tmp_path):
+        skill_dir = _write_skill(tmp_path, "alpha", ["alpha task"])
+        registry = SkillRegistry(base_path=str(tmp_path))
+        assert registry.search_skills("zebra", ranked=True) == []
+        old_snapshot = registry._snapshot
+
+        (skill_dir / "SKILL.md").write_text("zebra handling", encoding="utf-8")
+        assert registry.reload() is True
+        assert [r["name"] for r in registry.search_skills("zebra", ranked=True)] == ["alpha"]
+        # Readers holding the old snapshot still see the old index.
+        assert old_snapshot.ranked_index().search("zebra") == []
+
+    def test_construction_stats_only_skill_yaml(self, tmp_path):
+        for name in ("alpha", "beta"):
+            _write_skill(tmp_path, name, [f"{name} task"])
+        with patch.object(
+            SkillRegistry, "_file_stamp", side_effect=SkillRegistry._file_stamp
+        ) as stamp:
+            SkillRegistry(base_path=str(tmp_path))
+        assert sorted(call.args[0].name for call in stamp.call_args_list) == ["skill.yaml"] * 2
+
+    def test_schema_change_after_first_reload(self, tmp_path):
+        skill_dir = _write_skill(tmp_path, "alpha", ["alpha task"])
+        registry = SkillRegistry(base_path=str(tmp_path))
+        assert registry.reload() is False  # takes the baseline stamps
+        (skill_dir / "schema.json").write_text("{}", encoding="utf-8")
+        assert registry.reload() is True
+        assert registry.reload() is False
+
+    def test_stamps_restored_from_manifest(self, tmp_path):
+        skills_root = tmp_path / "skills"
+        skill_dir = _write_skill(skills_root, "alpha", ["alpha task"])
+        manifest = str(tmp_path / "manifest.json")
+        assert SkillRegistry(base_path=str(skills_root), manifest_path=manifest).reload() is False
+        assert "files" in json.loads(Path(manifest).read_text())["skills"][0]
+
+        registry = SkillRegistry(base_path=str(skills_root), manifest_path=manifest)
+        (skill_dir / "main.py").write_text("def execute(params):\n    return {}\n")
+        assert registry.reload() is True
+
+    def test_watcher_reloads_in_background(self, tmp_path):
+        _write_skill(tmp_path, "alpha", ["alpha task"])
+        registry = SkillRegistry(base_path=str(tmp_path))
+        registry.start_watching(interval=0.01)
+        try:
+            _write_skill(tmp_path, "beta", ["beta task"])
+            deadline = time.monotonic() + 5
+            while not registry.search_skills("beta task") and time.monotonic() < deadline:
+                time.sleep(0.01)
+        finally:
+            registry.stop_watching()
+        assert [r["name"] for r in registry.search_skills("beta task")] == ["beta"]
+
+
+class TestLazyRegistry:
+    def test_get_skill_parses_only_requested(self, tmp_path):
+        for name in ("alpha", "beta", "gamma"):
+            _write_skill(tmp_path, name, [f"{name} task"])
+        original = SkillRegistry._parse_yaml
+        with patch.object(SkillRegistry, "_parse_yaml", side_effect=original) as parse:
+            registry = SkillRegistry(base_path=str(tmp_path), lazy=True)
+            assert parse.call_count == 0
+            meta = registry.get_skill_by_name("beta")
+            assert meta.name == "beta"
+            assert registry.get_skill_by_name("beta") is meta
+            assert parse.call_count == 1
+
+    def test_search_keeps_discovery_order(self, tmp_path):
+        for name in ("alpha", "beta", "gamma"):
+            _write_skill(tmp_path, name, ["shared trigger"])
+        registry = SkillRegistry(base_path=str(tmp_path), lazy=True)
+        registry.get_skill_by_name("gamma")
+        names = [r["name"] for r in registry.search_skills("a shared trigger")]
+        assert names == ["alpha", "beta", "gamma"]
+
+    def test_search_loads_only_hits_from_manifest(self, tmp_path):
+        skills_root = tmp_path / "skills"
+        for name in ("alpha", "beta", "gamma"):
+            _write_skill(skills_root, name, [f"{name} task"])
+        manifest = str(tmp_path / "manifest.json")
+        SkillRegistry(base_path=str(skills_root), manifest_path=manifest)
+
+        registry = SkillRegistry(base_path=str(skills_root), manifest_path=manifest, lazy=True)
+        original = SkillRegistry._meta_from_record
+        with patch.object(SkillRegistry, "_parse_yaml", side_effect=AssertionError), \
+                patch.object(SkillRegistry, "_meta_from_record", side_effect=original) as build:
+            assert [r["name"] for r in registry.search_skills("a beta task")] == ["beta"]
+            assert registry.search_skills_many(["beta task", "nothing"]) == [
+                [registry.get_skill_by_name("beta").as_dict()], []
+            ]
+        assert build.call_count == 1
+        assert not registry._complete
+        assert [r["name"] for r in registry.search_skills("x")] == []
+
+    def test_fuzzy_fallback_loads_everything(self, tmp_path):
+        for name in ("alpha", "beta"):
+            _write_skill(tmp_path, name, [f"{name} task"])
+        registry = SkillRegistry(base_path=str(tmp_path), lazy=True)
+        assert registry.search_skills("alpha task")[0]["name"] == "alpha"
+        results = registry.search_skills("betta tsk", fuzzy_threshold=0.3)
+        assert results[0]["name"] == "beta"
+        assert registry._complete
+
+    def test_name_differs_from_directory(self, tmp_path):
+        skill_dir = _write_skill(tmp_path, "alpha", ["alpha task"])
+        yaml_path = skill_dir / "skill.yaml"
+        yaml_path.write_text(
+            yaml_path.read_text(encoding="utf-8").replace("name: alpha", "name: renamed"),
+            encoding="utf-8",
+        )
+        registry = SkillRegistry(base_path=str(tmp_path), lazy=True)
+        assert registry.get_skill_by_name("renamed").directory == skill_dir
+        assert registry.get_skill_by_name("missing") is None
+
+
+# ===================================================================
+# Cache tests
+# ===================================================================
+
+from src.cache import LRUCache, SQLiteCache
+
+
+class TestLRUCache:
+    def test_evicts_least_recently_used(self):
+        cache = LRUCache(maxsize=2)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        assert cache.get("a") == 1
+        cache.put("c", 3)
+        assert cache.get("b") is None
+        assert cache.get("a") == 1 and cache.get("c") == 3
+        assert cache.info().hits == 3
+
+    def test_ttl_expiry(self):
+        cache = LRUCache(maxsize=4, ttl=10)
+        with patch("src.cache.time.monotonic", return_value=100.0):
+            cache.put("a", 1)
+        with patch("src.cache.time.monotonic", return_value=105.0):
+            assert cache.get("a") == 1
+        with patch("src.cache.time.monotonic", return_value=111.0):
+            assert cache.get("a") is None
+        assert len(cache) == 0
+
+    def test_weighted_size(self):
+        cache = LRUCache(maxsize=10, sizeof=len)
+        cache.put("a", "xxxxxx")
+        cache.put("b", "yyyyyy")
+        assert cache.get("a") is None
+        cache.put("big", "z" * 11)
+        assert cache.get("big") is None and cache.get("b") == "yyyyyy"
+
+
+class TestSQLiteCache:
+    def test_persists_and_prunes(self, tmp_path):
+        path = str(tmp_path / "cache.db")
+        cache = SQLiteCache(path, max_entries=2)
+        for key in ("a", "b", "c"):
+            cache.put(key, key.upper())
+        cache.close()
+        reopened = SQLiteCache(path, max_entries=2)
+        assert reopened.get("a") is None
+        assert reopened.get("c") == "C"
+        assert len(reopened) == 2
+
+    def test_ttl_expiry(self, tmp_path):
+        cache = SQLiteCache(str(tmp_path / "cache.db"), ttl=10)
+        with patch("src.cache.time.time", return_value=1000.0):
+            cache.put("a", "1")
+        with patch("src.cache.time.time", return_value=1011.0):
+            assert cache.get("a") is None
+
+    def test_get_with_expiry(self, tmp_path):
+        cache = SQLiteCache(str(tmp_path / "cache.db"))
+        with patch("src.cache.time.time", return_value=1000.0):
+            cache.put("a", "1", ttl=10)
+            cache.put("b", "2")
+            assert cache.get("a", with_expiry=True) == ("1", 1010.0)
+            assert cache.get("b", with_expiry=True) == ("2", None)
+            assert SQLiteCache.remaining_ttl(1010.0) == 10.0
+
+
+# ===================================================================
+# Param validation tests
+# ===================================================================
+
+from src.param_validation import ParamValidationError, compile_schema
+
+
+class TestParamValidation:
+    SCHEMA = {
+        "type": "object",
+        "properties": {
+            "mode": {"type": "string", "enum": ["fast", "slow"]},
+            "count": {"type": "integer", "minimum": 1},
+            "ratio": {"type": "number"},
+            "flag": {"type": "boolean"},
+            "items": {
+                "type": "array",
+                "items": {
+                    "type": "object",
+                    "properties": {"id": {"type": "integer"}},
+                    "required": ["id"],
+                },
+            },
+        },
+        "required": ["mode"],
+    }
+
+    def test_malformed_keywords_ignored(self):
+        validate = compile_schema({
+            "type": "object",
+            "properties": ["a"],
+            "required": "a",
+            "minimum": "5",
+            "enum": "ab",
+        })
+        assert validate({"b": 1}) == {"b": 1}
+        nested = compile_schema({"properties": {"n": {"type": [{}], "maxLength": "3"}}})
+        assert nested({"n": "long"}) == {"n": "long"}
+
+    def test_valid_params_returned_unchanged(self):
+        validate = compile_schema(self.SCHEMA)
+        params = {"mode": "fast", "count": 2, "extra": object()}
+        assert validate(params) is params
+
+    def test_coercion_copies(self):
+        validate = compile_schema(self.SCHEMA)
+        params = {"mode": "slow", "count": "3", "ratio": "0.5", "flag": "false",
+                  "items": [{"id": "7"}]}
+        result = validate(params)
+        assert result == {"mode": "slow", "count": 3, "ratio": 0.5, "flag": False,
+                          "items": [{"id": 7}]}
+        assert params["items"][0]["id"] == "7"
+
+    @pytest.mark.parametrize(
+        "params, path, fragment",
+        [
+            ({}, "", "missing required property 'mode'"),
+            ({"mode": "medium"}, "mode", "not one of"),
+            ({"mode": "fast", "count": 0}, "count", "minimum"),
+            ({"mode": "fast", "count": "many"}, "count", "expected integer"),
+            ({"mode": "fast", "items": [{"id": 1}, {}]}, "items[1]", "'id'"),
+            ("fast", "", "expected object, got string"),
+        ],
+    )
+    def test_precise_errors(self, params, path, fragment):
+        with pytest.raises(ParamValidationError) as excinfo:
+            compile_schema(self.SCHEMA)(params)
+        assert excinfo.value.path == path
+        assert fragment in str(excinfo.value)
+
+    def test_closed_object(self):
+        validate = compile_schema({"type": "object", "additionalProperties": False})
+        with pytest.raises(ParamValidationError, match="unexpected property 'x'"):
+            validate({"x": 1})
+
+
+# ===================================================================
+# TriggerIndex tests
+# ===================================================================
+
+from src.skill_index import TriggerIndex
+
+
+class TestTriggerIndex:
+    def test_overlapping_triggers(self):
+        index = TriggerIndex([["he"], ["she"], ["hers"], ["his"]])
+        assert index.match("ushers") == [0, 1, 2]
+
+    def test_case_insensitive(self):
+        index = TriggerIndex([["Sales Report"], ["pdf"]])
+        assert index.match("Create a SALES REPORT from this PDF") == [0, 1]
+
+    def test_empty_trigger_matches_everything(self):
+        index = TriggerIndex([["x"], [""]])
+        assert index.match("anything") == [1]
+
+    def test_matches_naive_substring_scan(self):
+        rng = random.Random(7)
+        alphabet = "abc "
+        skills = [
+            ["".join(rng.choice(alphabet) for _ in range(rng.randint(1, 4)))
+             for _ in range(rng.randint(0, 3))]
+            for _ in range(40)
+        ]
+        index = TriggerIndex(skills)
+        for _ in range(200):
+            text = "".join(rng.choice(alphabet) for _ in range(rng.randint(0, 12)))
+            expected = [
+                i for i, triggers in enumerate(skills)
+                if any(t.lower() in text.lower() for t in triggers)
+            ]
+            assert index.match(text) == expected
+
+
+from src.skill_index import NgramIndex
+
+
+class TestNgramIndex:
+    def test_identical_text_scores_one(self):
+        index = NgramIndex(["compose email", "sales report"])
+        hits = index.search("compose email")
+        assert hits[0][0] == 0
+        assert hits[0][1] == pytest.approx(1.0, abs=1e-5)
+
+    def test_top_k_and_empty(self):
+        index = NgramIndex(["alpha", "alphabet", "alpine"])
+        assert len(index.search("alph", top_k=2)) == 2
+        assert NgramIndex([]).search("anything") == []
+        assert index.search("") == []
+
+
 # ===================================================================
 # SkillExecutor tests
 # ===================================================================
 
-from src.skill_executor import SkillExecutor
+from src.skill_executor import SkillExecutor, _call_execute
 
 
 class TestSkillExecutor:
@@ -196,6 +735,613 @@ class TestSkillExecutor:
         assert "error" in result
 
 
+class TestAsyncExecution:
+    @pytest.fixture()
+    def executor(self, tmp_path):
+        skill_dir = _write_skill(tmp_path, "io_bound", ["fetch"])
+        (skill_dir / "main.py").write_text(
+            "import asyncio\n"
+            "async def execute(params):\n"
+            "    await asyncio.sleep(params.get('delay', 0))\n"
+            "    return {'status': 'success', 'id': params.get('id')}\n",
+            encoding="utf-8",
+        )
+        _write_skill(tmp_path, "sync_skill", ["sync"])
+        executor = SkillExecutor(SkillRegistry(base_path=str(tmp_path)))
+        yield executor
+        executor.shutdown()
+
+    def test_async_execute_runs_concurrently(self, executor):
+        async def run():
+            return await asyncio.gather(*(
+                executor.execute_skill_async("io_bound", {"id": i, "delay": 0.2})
+                for i in range(10)
+            ))
+
+        start = time.perf_counter()
+        results = asyncio.run(run())
+        assert time.perf_counter() - start < 1.0
+        assert [r["id"] for r in results] == list(range(10))
+
+    def test_sync_skill_offloaded(self, executor):
+        result = asyncio.run(executor.execute_skill_async("sync_skill", {"a": 1}))
+        assert result["params"] == {"a": 1}
+
+    def test_async_missing_skill(self, executor):
+        assert "error" in asyncio.run(executor.execute_skill_async("missing", {}))
+
+    def test_sync_api_drives_coroutine_skill(self, executor):
+        assert executor.execute_skill("io_bound", {"id": 7}) == {"status": "success", "id": 7}
+
+
+class TestExecuteMany:
+    @pytest.fixture()
+    def executor(self, tmp_path):
+        skill_dir = _write_skill(tmp_path, "slow", ["slow"])
+        (skill_dir / "main.py").write_text(
+            "import time\n"
+            "def execute(params):\n"
+            "    time.sleep(params.get('delay', 0))\n"
+            "    if params.get('fail'):\n"
+            "        raise RuntimeError('boom')\n"
+            "    return {'id': params['id']}\n",
+            encoding="utf-8",
+        )
+        executor = SkillExecutor(SkillRegistry(base_path=str(tmp_path)))
+        yield executor
+        executor.shutdown()
+
+    def test_results_in_order_with_isolated_errors(self, executor):
+        calls = [("slow", {"id": i, "delay": 0.05 * (5 - i)}) for i in range(5)]
+        calls.insert(2, ("slow", {"id": -1, "fail": True}))
+        calls.append(("missing", {}))
+        results = executor.execute_many(calls, max_concurrency=4)
+        assert [r.get("id") for r in results] == [0, 1, None, 2, 3, 4, None]
+        assert results[2] == {"error": "boom"}
+        assert "not found" in results[-1]["error"]
+
+    def test_runs_concurrently(self, executor):
+        start = time.perf_counter()
+        executor.execute_many([("slow", {"id": i, "delay": 0.2}) for i in range(8)])
+        assert time.perf_counter() - start < 1.0
+
+    def test_async_variant_bounded(self, executor):
+        calls = [("slow", {"id": i, "delay": 0.1}) for i in range(4)]
+        start = time.perf_counter()
+        results = asyncio.run(executor.execute_many_async(calls, max_concurrency=2))
+        elapsed = time.perf_counter() - start
+        assert [r["id"] for r in results] == [0, 1, 2, 3]
+        assert 0.2 <= elapsed < 1.0
+
+
+class TestResultMemoization:
+    @pytest.fixture()
+    def skills_root(self, tmp_path):
+        skill_dir = _write_skill(tmp_path, "pure", ["pure"])
+        with open(skill_dir / "skill.yaml", "a", encoding="utf-8") as fh:
+            fh.write("execution:\n  cacheable: true\n  cache_ttl: 60\n")
+        _write_skill(tmp_path, "impure", ["impure"])
+        return tmp_path
+
+    def test_cacheable_skill_memoized(self, skills_root):
+        executor = SkillExecutor(SkillRegistry(base_path=str(skills_root)))
+        with patch("src.skill_executor._call_execute", wraps=_call_execute) as call:
+            first = executor.execute_skill("pure", {"b": 2, "a": 1})
+            second = executor.execute_skill("pure", {"a": 1, "b": 2})
+            executor.execute_skill("pure", {"a": 2})
+        assert first == second
+        assert first is not second
+        assert call.call_count == 2
+        info = executor.result_cache_info()
+        assert info["memory"].hits == 1
+        assert info["disk"] is None
+
+    def test_non_cacheable_skill_always_runs(self, skills_root):
+        executor = SkillExecutor(SkillRegistry(base_path=str(skills_root)))
+        with patch("src.skill_executor._call_execute", wraps=_call_execute) as call:
+            executor.execute_skill("impure", {})
+            executor.execute_skill("impure", {})
+        assert call.call_count == 2
+
+    def test_disk_tier_shared_between_executors(self, skills_root, tmp_path):
+        db = str(tmp_path / "results.db")
+        registry = SkillRegistry(base_path=str(skills_root))
+        SkillExecutor(registry, result_cache_path=db).execute_skill("pure", {"a": 1})
+        fresh = SkillExecutor(registry, result_cache_path=db)
+        with patch("src.skill_executor._call_execute", side_effect=AssertionError):
+            result = fresh.execute_skill("pure", {"a": 1})
+        assert result["params"] == {"a": 1}
+        assert fresh.result_cache_info()["disk"].hits == 1
+
+    def test_disk_hit_keeps_remaining_ttl(self, tmp_path):
+        skill_dir = _write_skill(tmp_path / "skills", "brief", ["brief"])
+        with open(skill_dir / "skill.yaml", "a", encoding="utf-8") as fh:
+            fh.write("execution:\n  cacheable: true\n  cache_ttl: 0.4\n")
+        db = str(tmp_path / "results.db")
+        registry = SkillRegistry(base_path=str(tmp_path / "skills"))
+        SkillExecutor(registry, result_cache_path=db).execute_skill("brief", {})
+        time.sleep(0.25)
+        fresh = SkillExecutor(registry, result_cache_path=db)
+        with patch("src.skill_executor._call_execute", wraps=_call_execute) as call:
+            fresh.execute_skill("brief", {})  # disk hit, promoted to memory
+            assert call.call_count == 0
+            time.sleep(0.25)  # past the original 0.4 s, within a fresh TTL
+            fresh.execute_skill("brief", {})
+            assert call.call_count == 1
+
+    @pytest.mark.parametrize("execution, expected", [
+        ("  cacheable: 'false'\n  cache_ttl: '90'\n", (False, 90.0)),
+        ("  cacheable: 'True'\n", (True, None)),
+        ("  cacheable: true\n  cache_ttl: 5m\n", None),
+        ("  cacheable: true\n  cache_ttl: -1\n", None),
+        ("  cacheable: maybe\n", None),
+    ])
+    def test_execution_settings_validated(self, tmp_path, execution, expected):
+        skill_dir = _write_skill(tmp_path, "odd", ["odd"])
+        with open(skill_dir / "skill.yaml", "a", encoding="utf-8") as fh:
+            fh.write("execution:\n" + execution)
+        meta = SkillRegistry(base_path=str(tmp_path)).get_skill_by_name("odd")
+        if expected is None:
+            assert meta is None  # rejected with a logged error
+        else:
+            assert (meta.cacheable, meta.cache_ttl) == expected
+
+    def test_store_failure_keeps_result(self, skills_root):
+        executor = SkillExecutor(SkillRegistry(base_path=str(skills_root)))
+        with patch.object(executor._results, "put", side_effect=TypeError("bad ttl")):
+            assert executor.execute_skill("pure", {"a": 1})["params"] == {"a": 1}
+
+    def test_bundled_report_generator_is_cacheable(self):
+        registry = SkillRegistry(base_path=SKILLS_DIR)
+        meta = registry.get_skill_by_name("report_generator")
+        assert meta.cacheable and meta.cache_ttl == 300
+
+
+class TestStreamingExecution:
+    @pytest.fixture()
+    def executor(self):
+        return SkillExecutor(SkillRegistry(base_path=SKILLS_DIR))
+
+    def test_pdf_pages_streamed_then_final_result(self, executor):
+        params = {"operation": "extract_text", "input_path": "report.pdf"}
+        events = list(executor.stream_skill("pdf", params))
+        chunks = [e["data"] for e in events if e["event"] == "chunk"]
+        assert [c["page"] for c in chunks] == list(range(10))
+        assert events[-1] == {"event": "result", "data": executor.execute_skill("pdf", params)}
+
+    def test_webapp_actions_streamed(self, executor):
+        events = list(executor.stream_skill("webapp_testing", {
+            "url": "http://localhost:3000",
+            "actions": [{"type": "click", "selector": "#a"}, {"type": "screenshot"}],
+        }))
+        assert [e["event"] for e in events] == ["chunk", "chunk", "result"]
+        assert events[0]["data"]["action"] == "click"
+        assert len(events[-1]["data"]["results"]) == 2
+
+    def test_non_streaming_skill_yields_result_only(self, executor):
+        events = list(executor.stream_skill(
+            "report_generator", {"report_type": "sales", "period": "Q4"}
+        ))
+        assert len(events) == 1
+        assert events[0]["data"]["status"] == "success"
+
+    def test_generator_execute_drained(self, tmp_path):
+        skill_dir = _write_skill(tmp_path, "gen", ["gen"])
+        (skill_dir / "main.py").write_text(
+            "def execute(params):\n"
+            "    yield {'step': 1}\n"
+            "    if params.get('empty'):\n"
+            "        return None\n"
+            "    return {'status': 'success'}\n",
+            encoding="utf-8",
+        )
+        executor = SkillExecutor(SkillRegistry(base_path=str(tmp_path)))
+        assert executor.execute_skill("gen", {}) == {"status": "success"}
+        assert "no result" in executor.execute_skill("gen", {"empty": True})["error"]
+        events = list(executor.stream_skill("gen", {}))
+        assert events[0] == {"event": "chunk", "data": {"step": 1}}
+
+    def test_stream_deadline_closes_generator(self, tmp_path):
+        skill_dir = _write_skill(tmp_path, "ticker", ["tick"])
+        (skill_dir / "main.py").write_text(
+            "import time\n"
+            "CLOSED = []\n"
+            "def execute_stream(params):\n"
+            "    try:\n"
+            "        for i in range(100):\n"
+            "            time.sleep(0.02)\n"
+            "            yield {'i': i}\n"
+            "    finally:\n"
+            "        CLOSED.append(True)\n"
+            "    return {'status': 'success'}\n"
+            "def execute(params):\n"
+            "    return {'status': 'success'}\n",
+            encoding="utf-8",
+        )
+        executor = SkillExecutor(SkillRegistry(base_path=str(tmp_path)))
+        events = list(executor.stream_skill("ticker", {}, timeout=0.1))
+        assert 1 <= len(events) - 1 < 100
+        assert events[-1]["data"]["error_type"] == "timeout"
+        module = executor._modules[skill_dir / "main.py"][1]
+        # Closed on the pool thread once the in-flight step returns.
+        for _ in range(50):
+            if module.CLOSED:
+                break
+            time.sleep(0.02)
+        assert module.CLOSED == [True]
+
+    def test_blocked_stream_hits_deadline(self, tmp_path):
+        skill_dir = _write_skill(tmp_path, "stall", ["stall"])
+        (skill_dir / "main.py").write_text(
+            "import time\n"
+            "def execute_stream(params):\n"
+            "    yield {'step': 0}\n"
+            "    time.sleep(1.0)\n"
+            "    yield {'step': 1}\n"
+            "    return {'status': 'success'}\n"
+            "def execute(params):\n"
+            "    return {'status': 'success'}\n",
+            encoding="utf-8",
+        )
+        executor = SkillExecutor(SkillRegistry(base_path=str(tmp_path)))
+        start = time.monotonic()
+        events = list(executor.stream_skill("stall", {}, timeout=0.2))
+        assert time.monotonic() - start < 0.6
+        assert events[0] == {"event": "chunk", "data": {"step": 0}}
+        assert len(events) == 2  # the late chunk is not forwarded
+        assert events[-1]["data"]["error_type"] == "timeout"
+
+
+class TestExecutionDeadlines:
+    @pytest.fixture()
+    def skills_root(self, tmp_path):
+        skill_dir = _write_skill(tmp_path, "hang", ["hang"])
+        with open(skill_dir / "skill.yaml", "a", encoding="utf-8") as fh:
+            fh.write("execution:\n  timeout: 0.1\n")
+        (skill_dir / "main.py").write_text(
+            "import time\n"
+            "def execute(params):\n"
+            "    time.sleep(params.get('delay', 0))\n"
+            "    if params.get('raise_timeout'):\n"
+            "        raise TimeoutError('upstream timed out')\n"
+            "    return {'status': 'success'}\n",
+            encoding="utf-8",
+        )
+        async_dir = _write_skill(tmp_path, "slow_async", ["slow async"])
+        (async_dir / "main.py").write_text(
+            "import asyncio\n"
+            "STATE = {'cancelled': False}\n"
+            "async def execute(params):\n"
+            "    try:\n"
+            "        await asyncio.sleep(params.get('delay', 0))\n"
+            "    except asyncio.CancelledError:\n"
+            "        STATE['cancelled'] = True\n"
+            "        raise\n"
+            "    return {'status': 'success'}\n",
+            encoding="utf-8",
+        )
+        return tmp_path
+
+    @pytest.fixture()
+    def executor(self, skills_root):
+        executor = SkillExecutor(SkillRegistry(base_path=str(skills_root)))
+        yield executor
+        executor.shutdown()
+
+    def test_timeout_from_yaml(self, executor):
+        assert executor.registry.get_skill_by_name("hang").timeout == 0.1
+        start = time.perf_counter()
+        result = executor.execute_skill("hang", {"delay": 1})
+        assert time.perf_counter() - start < 0.5
+        assert result["error_type"] == "timeout"
+        assert "hang" in result["error"]
+        assert executor.execute_skill("hang", {})["status"] == "success"
+
+    def test_quoted_timeout_coerced(self, tmp_path):
+        skill_dir = _write_skill(tmp_path, "quoted", ["quoted"])
+        with open(skill_dir / "skill.yaml", "a", encoding="utf-8") as fh:
+            fh.write("execution:\n  timeout: '2'\n")
+        _write_skill(tmp_path, "bad", ["bad"])
+        with open(tmp_path / "bad" / "skill.yaml", "a", encoding="utf-8") as fh:
+            fh.write("execution:\n  timeout: soon\n")
+        executor = SkillExecutor(SkillRegistry(base_path=str(tmp_path)))
+        assert executor.registry.get_skill_by_name("quoted").timeout == 2.0
+        assert executor.registry.get_skill_by_name("bad") is None
+        assert executor.execute_skill("quoted", {"a": 1})["params"] == {"a": 1}
+
+    def test_per_call_override(self, executor):
+        result = executor.execute_skill("hang", {"delay": 0.3}, timeout=2)
+        assert result == {"status": "success"}
+
+    def test_default_timeout(self, skills_root):
+        executor = SkillExecutor(
+            SkillRegistry(base_path=str(skills_root)), default_timeout=0.1
+        )
+        result = executor.execute_skill("slow_async", {"delay": 1})
+        assert result["error_type"] == "timeout"
+        module = executor._modules[skills_root / "slow_async" / "main.py"][1]
+        assert module.STATE["cancelled"]
+
+    def test_skill_timeout_error_not_reported_as_deadline(self, executor):
+        result = executor.execute_skill("hang", {"raise_timeout": True})
+        assert result == {"error": "upstream timed out"}
+
+    def test_async_cancels_coroutine(self, executor):
+        result = asyncio.run(
+            executor.execute_skill_async("slow_async", {"delay": 1}, timeout=0.1)
+        )
+        assert result["error_type"] == "timeout"
+        module = executor._modules[executor.registry.get_skill_by_name(
+            "slow_async").directory / "main.py"][1]
+        assert module.STATE["cancelled"]
+
+    def test_execute_many_isolates_timeouts(self, executor):
+        results = executor.execute_many(
+            [("hang", {"delay": 1}), ("slow_async", {})], timeout=0.1
+        )
+        assert results[0]["error_type"] == "timeout"
+        assert results[1] == {"status": "success"}
+
+
+class TestExecutorParamValidation:
+    @pytest.fixture()
+    def executor(self):
+        return SkillExecutor(SkillRegistry(base_path=SKILLS_DIR))
+
+    def test_invalid_params_rejected_before_execution(self, executor):
+        with patch("src.skill_executor._call_execute", side_effect=AssertionError):
+            result = executor.execute_skill("report_generator", {"report_type": "weekly"})
+        assert result["error_type"] == "invalid_params"
+        assert result["path"] == ""
+        assert "'period'" in result["error"]
+
+    def test_params_coerced(self, executor):
+        with patch("src.skill_executor._call_execute", return_value={}) as call:
+            executor.execute_skill("pdf", {"operation": "rotate", "rotation_degrees": "180"})
+        assert call.call_args.args[2]["rotation_degrees"] == 180
+
+    def test_validator_compiled_once(self, executor):
+        with patch("src.skill_executor.compile_schema", wraps=compile_schema) as compile_:
+            for _ in range(3):
+                executor.execute_skill("report_generator", {"report_type": "sales",
+                                                            "period": "Q1"})
+        assert compile_.call_count == 1
+
+    def test_malformed_schema_does_not_block_execution(self, tmp_path):
+        skill_dir = _write_skill(tmp_path, "odd", ["odd"])
+        (skill_dir / "schema.json").write_text(
+            '{"type": "object", "properties": ["a"]}', encoding="utf-8"
+        )
+        executor = SkillExecutor(SkillRegistry(base_path=str(tmp_path)))
+        assert executor.execute_skill("odd", {"a": 1})["params"] == {"a": 1}
+        with patch("src.skill_executor.compile_schema", side_effect=RuntimeError("boom")):
+            executor.invalidate()
+            assert executor.execute_skill("odd", {"a": 2})["params"] == {"a": 2}
+            events = list(executor.stream_skill("odd", {"a": 3}))
+            assert asyncio.run(executor.execute_skill_async("odd", {"a": 4}))["params"] == {"a": 4}
+        assert events[-1]["data"]["params"] == {"a": 3}
+
+    def test_validation_can_be_disabled(self):
+        executor = SkillExecutor(SkillRegistry(base_path=SKILLS_DIR), validate_params=False)
+        with patch("src.skill_executor._call_execute", return_value={"ok": True}):
+            assert executor.execute_skill("report_generator", {}) == {"ok": True}
+
+
+class TestProcessBackend:
+    @pytest.fixture()
+    def skills_root(self, tmp_path):
+        skill_dir = _write_skill(tmp_path, "cpu_heavy", ["crunch"])
+        with open(skill_dir / "skill.yaml", "a", encoding="utf-8") as fh:
+            fh.write("execution:\n  backend: process\n")
+        (skill_dir / "main.py").write_text(
+            "import os\n"
+            "def execute(params):\n"
+            "    if params.get('fail'):\n"
+            "        raise ValueError('bad input')\n"
+            "    return {'status': 'success', 'pid': os.getpid()}\n",
+            encoding="utf-8",
+        )
+        _write_skill(tmp_path, "light", ["light"])
+        return tmp_path
+
+    def test_routes_per_skill_from_yaml(self, skills_root):
+        registry = SkillRegistry(base_path=str(skills_root))
+        assert registry.get_skill_by_name("cpu_heavy").backend == "process"
+        executor = SkillExecutor(registry, max_workers=1)
+        try:
+            result = executor.execute_skill("cpu_heavy", {})
+            assert result["status"] == "success"
+            assert result["pid"] != os.getpid()
+            assert executor.execute_skill("light", {"x": 1})["params"] == {"x": 1}
+            assert executor.execute_skill("cpu_heavy", {"fail": True}) == {"error": "bad input"}
+        finally:
+            executor.shutdown()
+
+    def test_deadline_kills_stuck_worker(self, tmp_path):
+        hang = _write_skill(tmp_path, "hang", ["hang"])
+        quick = _write_skill(tmp_path, "quick", ["quick"])
+        for skill_dir in (hang, quick):
+            with open(skill_dir / "skill.yaml", "a", encoding="utf-8") as fh:
+                fh.write("execution:\n  backend: process\n  timeout: 5\n")
+        (hang / "main.py").write_text(
+            "import time\n"
+            "def execute(params):\n"
+            "    time.sleep(30)\n"
+            "    return {'status': 'late'}\n",
+            encoding="utf-8",
+        )
+        executor = SkillExecutor(SkillRegistry(base_path=str(tmp_path)), max_workers=1)
+        try:
+            executor.warm_up()
+            stuck_pool = executor._process_pool
+            result = executor.execute_skill("hang", {}, timeout=0.5)
+            assert result["error_type"] == "timeout"
+            start = time.perf_counter()
+            assert executor.execute_skill("quick", {"x": 1})["params"] == {"x": 1}
+            assert time.perf_counter() - start < 4.5
+            assert executor._process_pool is not stuck_pool
+        finally:
+            executor.shutdown()
+
+    @pytest.fixture()
+    def sleepers(self, tmp_path):
+        """Process-routed skills "fast" (1 s) and "slow" (30 s), warmed up."""
+        for name, delay in (("fast", 1.0), ("slow", 30)):
+            skill_dir = _write_skill(tmp_path, name, [name])
+            with open(skill_dir / "skill.yaml", "a", encoding="utf-8") as fh:
+                fh.write("execution:\n  backend: process\n")
+            (skill_dir / "main.py").write_text(
+                "import time\n"
+                "def execute(params):\n"
+                f"    time.sleep({delay})\n"
+                "    return {'status': 'success'}\n",
+                encoding="utf-8",
+            )
+        executor = SkillExecutor(SkillRegistry(base_path=str(tmp_path)), max_workers=2)
+        executor.warm_up()
+        yield executor
+        executor.shutdown()
+
+    def test_deadline_spares_concurrent_calls(self, sleepers):
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            fast = pool.submit(sleepers.execute_skill, "fast", {})
+            time.sleep(0.2)  # "fast" is running when "slow" overruns
+            slow = pool.submit(sleepers.execute_skill, "slow", {}, timeout=0.5)
+            assert slow.result()["error_type"] == "timeout"
+            assert fast.result() == {"status": "success"}
+
+    def test_deadline_spares_concurrent_async_calls(self, sleepers):
+        async def _both():
+            fast = asyncio.ensure_future(sleepers.execute_skill_async("fast", {}))
+            await asyncio.sleep(0.2)
+            slow = await sleepers.execute_skill_async("slow", {}, timeout=0.5)
+            return await fast, slow
+
+        fast, slow = asyncio.run(_both())
+        assert slow["error_type"] == "timeout"
+        assert fast == {"status": "success"}
+
+    def test_unknown_backend_rejected(self):
+        with pytest.raises(ValueError):
+            SkillExecutor(SkillRegistry(base_path=SKILLS_DIR), backend="gpu")
+
+
+class TestSkillContextCache:
+    def test_warm_lookup_skips_disk(self, tmp_path):
+        skill_dir = _write_skill(tmp_path, "alpha", ["alpha task"])
+        (skill_dir / "SKILL.md").write_text("# Alpha", encoding="utf-8")
+        executor = SkillExecutor(SkillRegistry(base_path=str(tmp_path)))
+        first = executor.load_skill_context("alpha")
+        with patch.object(SkillExecutor, "_read_text", side_effect=AssertionError):
+            second = executor.load_skill_context("alpha")
+        assert first == second == {"skill_doc": "# Alpha", "schema": None}
+        info = executor.context_cache_info()
+        assert (info.hits, info.misses) == (1, 1)
+
+    def test_edited_doc_is_reread(self, tmp_path):
+        skill_dir = _write_skill(tmp_path, "alpha", ["alpha task"])
+        (skill_dir / "SKILL.md").write_text("# Alpha", encoding="utf-8")
+        executor = SkillExecutor(SkillRegistry(base_path=str(tmp_path)))
+        executor.load_skill_context("alpha")
+        (skill_dir / "SKILL.md").write_text("# Alpha, revised", encoding="utf-8")
+        assert executor.load_skill_context("alpha")["skill_doc"] == "# Alpha, revised"
+
+    def test_size_bound_evicts(self, tmp_path):
+        for name in ("alpha", "beta"):
+            skill_dir = _write_skill(tmp_path, name, [f"{name} task"])
+            (skill_dir / "SKILL.md").write_text("x" * 60, encoding="utf-8")
+        executor = SkillExecutor(
+            SkillRegistry(base_path=str(tmp_path)), context_cache_bytes=100
+        )
+        executor.load_skill_context("alpha")
+        executor.load_skill_context("beta")
+        executor.load_skill_context("alpha")
+        assert executor.context_cache_info().hits == 0
+        assert executor.context_cache_info().currsize == 1
+
+
+class TestSkillExecutorModuleCache:
+    def test_module_imported_once(self, tmp_path):
+        _write_skill(tmp_path, "alpha", ["alpha task"])
+        executor = SkillExecutor(SkillRegistry(base_path=str(tmp_path)))
+        original = SkillExecutor._import_module
+        with patch.object(SkillExecutor, "_import_module", side_effect=original) as imp:
+            for i in range(3):
+                assert executor.execute_skill("alpha", {"i": i})["params"] == {"i": i}
+        assert imp.call_count == 1
+
+    def test_module_state_persists_between_calls(self, tmp_path):
+        skill_dir = _write_skill(tmp_path, "counter", ["count"])
+        (skill_dir / "main.py").write_text(
+            "_CALLS = []\n"
+            "def execute(params):\n"
+            "    _CALLS.append(1)\n"
+            "    return {'calls': len(_CALLS)}\n",
+            encoding="utf-8",
+        )
+        executor = SkillExecutor(SkillRegistry(base_path=str(tmp_path)))
+        executor.execute_skill("counter", {})
+        assert executor.execute_skill("counter", {}) == {"calls": 2}
+        executor.invalidate("counter")
+        assert executor.execute_skill("counter", {}) == {"calls": 1}
+
+    def test_changed_entry_point_reimported(self, tmp_path):
+        skill_dir = _write_skill(tmp_path, "alpha", ["alpha task"])
+        executor = SkillExecutor(SkillRegistry(base_path=str(tmp_path)))
+        assert executor.execute_skill("alpha", {})["status"] == "success"
+        (skill_dir / "main.py").write_text(
+            "def execute(params):\n    return {'status': 'updated version'}\n",
+            encoding="utf-8",
+        )
+        assert executor.execute_skill("alpha", {}) == {"status": "updated version"}
+
+
+class TestWarmUp:
+    def test_warm_up_preloads_everything(self):
+        executor = SkillExecutor(SkillRegistry(base_path=SKILLS_DIR))
+        summary = executor.warm_up()
+        assert summary["failed"] == {}
+        assert "report_generator" in summary["warmed"]
+        with patch.object(SkillExecutor, "_import_module", side_effect=AssertionError), \
+                patch("src.skill_executor.compile_schema", side_effect=AssertionError):
+            result = executor.execute_skill(
+                "report_generator", {"report_type": "sales", "period": "Q4"}
+            )
+            executor.load_skill_context("report_generator")
+        assert result["status"] == "success"
+        assert executor.context_cache_info().misses == len(summary["warmed"])
+
+    def test_failures_reported(self, tmp_path):
+        _write_skill(tmp_path, "good", ["good"])
+        bad = _write_skill(tmp_path, "bad", ["bad"])
+        (bad / "main.py").write_text("raise ImportError('nope')\n", encoding="utf-8")
+        summary = SkillExecutor(SkillRegistry(base_path=str(tmp_path))).warm_up()
+        assert summary == {"warmed": ["good"], "failed": {"bad": "nope"}}
+
+    def test_background_warm_up_via_graph(self, tmp_path):
+        _write_skill(tmp_path, "alpha", ["alpha"])
+        executor = SkillExecutor(SkillRegistry(base_path=str(tmp_path)))
+        assert not executor.is_warm
+        create_skills_graph(executor=executor, warm_up=True)
+        future = executor.start_warm_up()
+        assert executor.start_warm_up() is future
+
+        async def _ready():
+            return await asyncio.wrap_future(future)
+
+        assert asyncio.run(_ready())["warmed"] == ["alpha"]
+        assert executor.is_warm
+
+    def test_crashed_warm_up_not_reported_warm(self):
+        executor = SkillExecutor(SkillRegistry(base_path=SKILLS_DIR))
+        with patch.object(executor, "warm_up", side_effect=RuntimeError("disk gone")):
+            future = executor.start_warm_up()
+            with pytest.raises(RuntimeError):
+                future.result(timeout=5)
+        assert not executor.is_warm
+        assert str(future.exception()) == "disk gone"
+
+
 # ===================================================================
 # Individual skill tests
 # ===================================================================
@@ -497,19 +1643,194 @@ class TestPdfSkill:
         assert "Unknown operation" in result["message"]
 
 
+# ===================================================================
+# LLM provider tests
+# ===================================================================
+
+from src.llm_provider import LLMProvider, LLMSettings, get_default_provider
+
+
+class TestLLMProvider:
+    def test_clients_shared_per_settings(self):
+        factory = MagicMock(side_effect=lambda settings, http: MagicMock(settings=settings))
+        provider = LLMProvider(
+            roles={"respond": LLMSettings(temperature=0.7)},
+            client_factory=factory,
+        )
+        select, params, respond_llm = (provider.get(r) for r in ("select", "params", "respond"))
+        assert select is params
+        assert respond_llm is not select
+        assert respond_llm.settings.temperature == 0.7
+        assert provider.get("respond") is respond_llm
+        assert factory.call_count == 2
+        http_clients = {call.args[1] for call in factory.call_args_list}
+        assert len(http_clients) == 1
+
+    def test_pool_limits_and_close(self):
+        provider = LLMProvider(
+            max_connections=5, keepalive_expiry=10, client_factory=lambda s, h: h
+        )
+        http = provider.get()
+        assert provider.limits.max_connections == 5
+        provider.close()
+        assert http.is_closed
+        assert provider.get() is not http
+
+    def test_default_provider_is_process_wide(self):
+        assert get_default_provider() is get_default_provider()
+
+    def test_nodes_use_injected_provider(self):
+        llm = MagicMock()
+        llm.invoke.return_value = AIMessage(content='["report_generator"]')
+        provider = LLMProvider(client_factory=lambda settings, http: llm)
+        state = _make_state(available_skills=[{"name": "report_generator"}])
+        result = select_skills(state, llm_provider=provider)
+        assert result["selected_skills"] == ["report_generator"]
+        llm.invoke.return_value = AIMessage(content="done")
+        assert respond(state, llm_provider=provider)["messages"][-1].content == "done"
+
+
+# ===================================================================
+# LLM response cache tests
+# ===================================================================
+
+from src.llm_cache import LLMResponseCache
+
+
+class TestLLMResponseCache:
+    @staticmethod
+    def _llm(content="answer", temperature=0):
+        llm = MagicMock()
+        llm.temperature = temperature
+        llm.deployment_name = "gpt-test"
+        llm.model_name = None
+        llm.max_tokens = None
+        llm.invoke.return_value = AIMessage(content=content)
+        return llm
+
+    def test_repeat_prompt_served_from_memory(self):
+        cache = LLMResponseCache()
+        llm = self._llm()
+        prompt = [HumanMessage(content="route this")]
+        assert cache.invoke(llm, prompt).content == "answer"
+        assert cache.invoke(llm, prompt).content == "answer"
+        cache.invoke(llm, [HumanMessage(content="something else")])
+        assert llm.invoke.call_count == 2
+        assert cache.info()["memory"].hits == 1
+
+    def test_model_identity_in_key(self):
+        cache = LLMResponseCache()
+        prompt = [HumanMessage(content="route this")]
+        first, second = self._llm(), self._llm("other")
+        second.deployment_name = "gpt-other"
+        cache.invoke(first, prompt)
+        assert cache.invoke(second, prompt).content == "other"
+
+    def test_sampling_models_not_cached(self):
+        cache = LLMResponseCache()
+        llm = self._llm(temperature=0.7)
+        prompt = [HumanMessage(content="be creative")]
+        cache.invoke(llm, prompt)
+        cache.invoke(llm, prompt)
+        assert llm.invoke.call_count == 2
+
+    def test_unset_temperature_not_cached(self):
+        cache = LLMResponseCache()
+        llm = self._llm(temperature=None)
+        prompt = [HumanMessage(content="route this")]
+        cache.invoke(llm, prompt)
+        cache.invoke(llm, prompt)
+        assert llm.invoke.call_count == 2
+
+    def test_disk_hit_keeps_remaining_ttl(self, tmp_path):
+        path = str(tmp_path / "llm.sqlite")
+        prompt = [HumanMessage(content="route this")]
+        LLMResponseCache(ttl=0.4, path=path).invoke(self._llm(), prompt)
+        time.sleep(0.25)
+        cache = LLMResponseCache(ttl=0.4, path=path)
+        assert cache.invoke(self._llm("fresh"), prompt).content == "answer"
+        time.sleep(0.25)  # past the original 0.4 s, within a fresh TTL
+        assert cache.invoke(self._llm("fresh"), prompt).content == "fresh"
+
+    def test_disk_tier_shared(self, tmp_path):
+        path = str(tmp_path / "llm.sqlite")
+        prompt = [HumanMessage(content="route this")]
+        LLMResponseCache(path=path).invoke(self._llm(), prompt)
+        llm = self._llm()
+        fresh = LLMResponseCache(path=path)
+        assert fresh.invoke(llm, prompt).content == "answer"
+        llm.invoke.assert_not_called()
+        assert fresh.info()["disk"].hits == 1
+
+    def test_ttl_expiry(self):
+        cache = LLMResponseCache(ttl=0.05)
+        llm = self._llm()
+        prompt = [HumanMessage(content="route this")]
+        cache.invoke(llm, prompt)
+        time.sleep(0.1)
+        cache.invoke(llm, prompt)
+        assert llm.invoke.call_count == 2
+
+    @patch("src.nodes._get_llm")
+    def test_select_skills_uses_cache(self, mock_get_llm):
+        llm = self._llm('["report_generator"]')
+        mock_get_llm.return_value = llm
+        cache = LLMResponseCache()
+        state = _make_state(available_skills=[{"name": "report_generator"}])
+        for _ in range(2):
+            result = select_skills(state, llm_cache=cache)
+            assert result["selected_skills"] == ["report_generator"]
+        assert llm.invoke.call_count == 1
+        changed = _make_state(available_skills=[{"name": "pdf"}])
+        select_skills(changed, llm_cache=cache)
+        assert llm.invoke.call_count == 2
+
+    @patch("src.nodes._get_llm")
+    def test_unparseable_reply_not_cached(self, mock_get_llm):
+        llm = self._llm()
+        llm.invoke.side_effect = [
+            AIMessage(content="Sure! The skill is report_generator."),
+            AIMessage(content='["report_generator"]'),
+        ]
+        mock_get_llm.return_value = llm
+        cache = LLMResponseCache()
+        state = _make_state(available_skills=[{"name": "report_generator"}])
+        assert select_skills(state, llm_cache=cache)["selected_skills"] == []
+        assert select_skills(state, llm_cache=cache)["selected_skills"] == ["report_generator"]
+        assert select_skills(state, llm_cache=cache)["selected_skills"] == ["report_generator"]
+        assert llm.invoke.call_count == 2
+
+    @patch("src.nodes._get_llm")
+    def test_unparseable_params_not_cached(self, mock_get_llm, tmp_path):
+        _write_skill(tmp_path, "alpha", ["alpha"])
+        llm = self._llm()
+        llm.invoke.side_effect = [AIMessage(content="{oops"), AIMessage(content='{"x": 1}')]
+        mock_get_llm.return_value = llm
+        cache = LLMResponseCache()
+        executor = SkillExecutor(SkillRegistry(base_path=str(tmp_path)))
+        state = _make_state(selected_skills=["alpha"])
+        first = execute_skills(state, executor=executor, llm_cache=cache)
+        second = execute_skills(state, executor=executor, llm_cache=cache)
+        assert first["execution_results"]["alpha"]["params"] == {}
+        assert second["execution_results"]["alpha"]["params"] == {"x": 1}
+
+
 # ===================================================================
 # Node function tests (LLM mocked)
 # ===================================================================
 
 from src.nodes import (
     GraphState,
+    RoutingStats,
     analyze_query,
     execute_skills,
     load_skill_context,
+    match_confidence,
     respond,
     route_next,
     select_skills,
 )
+from src.skills_graph import create_skills_graph
 
 
 def _make_state(**overrides) -> GraphState:
@@ -533,6 +1854,14 @@ class TestAnalyzeQueryNode:
         assert len(result["available_skills"]) > 0
         assert result["next_action"] == "select_skills"
 
+    def test_ranked_top_k(self):
+        registry = SkillRegistry(base_path=SKILLS_DIR)
+        state = _make_state()
+        result = analyze_query(state, registry=registry, top_k=1)
+        assert [s["name"] for s in result["available_skills"]] == ["report_generator"]
+        assert "score" in result["available_skills"][0]
+        assert result["next_action"] == "select_skills"
+
     def test_no_skills(self):
         registry = SkillRegistry(base_path=SKILLS_DIR)
         state = _make_state(messages=[HumanMessage(content="hello")])
@@ -541,6 +1870,103 @@ class TestAnalyzeQueryNode:
         assert result["next_action"] == "respond"
 
 
+class TestFastPath:
+    def test_match_confidence(self):
+        assert match_confidence([]) == 0.0
+        assert match_confidence([{"name": "a"}]) == 1.0
+        assert match_confidence([{"name": "a"}, {"name": "b"}]) == 0.0
+        assert match_confidence([{"score": 3.0}, {"score": 1.0}]) == 0.75
+
+    def test_disabled_by_default(self):
+        registry = SkillRegistry(base_path=SKILLS_DIR)
+        result = analyze_query(_make_state(), registry=registry)
+        assert result["next_action"] == "select_skills"
+        assert "selected_skills" not in result
+
+    def test_single_match_skips_router(self):
+        registry = SkillRegistry(base_path=SKILLS_DIR)
+        stats = RoutingStats()
+        result = analyze_query(
+            _make_state(), registry=registry, fast_path_threshold=0.9, stats=stats
+        )
+        assert result["selected_skills"] == ["report_generator"]
+        assert result["next_action"] == "load_skill_context"
+        analyze_query(
+            _make_state(messages=[HumanMessage(content="hello")]),
+            registry=registry, fast_path_threshold=0.9, stats=stats,
+        )
+        assert stats.snapshot() == {"fast_path": 1, "llm_routed": 0, "no_match": 1}
+        assert stats.fast_path_rate == 1.0
+
+    def test_ranked_dominance_threshold(self):
+        registry = SkillRegistry(base_path=SKILLS_DIR)
+        stats = RoutingStats()
+        # report_generator scores ~8.3 against ~2.2 for the runner-up.
+        dominant = analyze_query(
+            _make_state(), registry=registry, top_k=3,
+            fast_path_threshold=0.7, stats=stats,
+        )
+        assert dominant["next_action"] == "load_skill_context"
+        strict = analyze_query(
+            _make_state(), registry=registry, top_k=3,
+            fast_path_threshold=0.9, stats=stats,
+        )
+        assert strict["next_action"] == "select_skills"
+        assert stats.fast_path_rate == 0.5
+
+    def test_trigger_tie_goes_to_router(self, tmp_path):
+        _write_skill(tmp_path, "fast", ["fast"])
+        _write_skill(tmp_path, "slow", ["slow"])
+        stats = RoutingStats()
+        state = _make_state(messages=[HumanMessage(content="slow fast")])
+        result = analyze_query(
+            state, registry=SkillRegistry(base_path=str(tmp_path)),
+            fast_path_threshold=0.5, stats=stats,
+        )
+        assert result["next_action"] == "select_skills"
+        assert stats.snapshot()["fast_path"] == 0
+
+    def test_truncation_does_not_inflate_confidence(self):
+        registry = SkillRegistry(base_path=SKILLS_DIR)
+        state = _make_state(
+            messages=[HumanMessage(content="write an email about the pdf report")]
+        )
+        result = analyze_query(state, registry=registry, top_k=1, fast_path_threshold=0.9)
+        assert len(result["available_skills"]) == 1
+        assert result["next_action"] == "select_skills"
+        assert "selected_skills" not in result
+
+    def test_fuzzy_match_never_fast_paths(self):
+        registry = SkillRegistry(base_path=SKILLS_DIR)
+        stats = RoutingStats()
+        state = _make_state(messages=[HumanMessage(content="tell me a joke about cats")])
+        result = analyze_query(
+            state, registry=registry, fuzzy_threshold=0.1,
+            fast_path_threshold=0.9, stats=stats,
+        )
+        assert len(result["available_skills"]) == 1
+        assert result["next_action"] == "select_skills"
+        assert stats.snapshot()["llm_routed"] == 1
+
+    @patch("src.nodes._get_llm")
+    def test_graph_skips_select_llm_call(self, mock_get_llm):
+        mock_llm = MagicMock()
+        mock_llm.invoke.side_effect = [
+            AIMessage(content='{"report_type": "sales", "period": "Q4"}'),
+            AIMessage(content="Here is your report."),
+        ]
+        mock_get_llm.return_value = mock_llm
+        stats = RoutingStats()
+        graph = create_skills_graph(
+            skills_base_path=SKILLS_DIR, fast_path_threshold=0.9, routing_stats=stats
+        )
+        result = graph.invoke(_make_state())
+        assert result["execution_results"]["report_generator"]["status"] == "success"
+        assert mock_llm.invoke.call_count == 2
+        assert [call.args[0] for call in mock_get_llm.call_args_list] == ["params", "respond"]
+        assert stats.snapshot()["fast_path"] == 1
+
+
 class TestSelectSkillsNode:
     @patch("src.nodes._get_llm")
     def test_selects_skill(self, mock_get_llm):
@@ -618,6 +2044,136 @@ class TestExecuteSkillsNode:
         assert result["execution_results"]["report_generator"]["status"] == "success"
 
 
+    @patch("src.nodes._get_llm")
+    def test_skills_run_concurrently_in_selection_order(self, mock_get_llm, tmp_path):
+        for name in ("alpha", "beta", "gamma"):
+            _write_skill(tmp_path, name, [name])
+
+        def _slow_invoke(messages):
+            time.sleep(0.2)
+            return AIMessage(content='{"n": 1}')
+
+        mock_llm = MagicMock()
+        mock_llm.invoke.side_effect = _slow_invoke
+        mock_get_llm.return_value = mock_llm
+        executor = SkillExecutor(SkillRegistry(base_path=str(tmp_path)))
+        state = _make_state(selected_skills=["gamma", "alpha", "beta"])
+
+        start = time.perf_counter()
+        result = execute_skills(state, executor=executor, max_concurrency=3)
+        assert time.perf_counter() - start < 0.5
+        assert list(result["execution_results"]) == ["gamma", "alpha", "beta"]
+        assert all(r["params"] == {"n": 1} for r in result["execution_results"].values())
+
+    @patch("src.nodes._get_llm")
+    def test_batched_params_single_call(self, mock_get_llm, tmp_path):
+        for name in ("alpha", "beta"):
+            _write_skill(tmp_path, name, [name])
+        mock_llm = MagicMock()
+        mock_llm.invoke.return_value = AIMessage(
+            content='{"alpha": {"a": 1}, "beta": {"b": 2}}'
+        )
+        mock_get_llm.return_value = mock_llm
+        executor = SkillExecutor(SkillRegistry(base_path=str(tmp_path)))
+
+        state = _make_state(selected_skills=["alpha", "beta"])
+        result = execute_skills(state, executor=executor, batch_params=True)
+        assert mock_llm.invoke.call_count == 1
+        assert result["execution_results"]["alpha"]["params"] == {"a": 1}
+        assert result["execution_results"]["beta"]["params"] == {"b": 2}
+
+    @patch("src.nodes._get_llm")
+    def test_batched_params_fallback(self, mock_get_llm, tmp_path):
+        for name in ("alpha", "beta", "gamma"):
+            _write_skill(tmp_path, name, [name])
+        mock_llm = MagicMock()
+        mock_llm.invoke.side_effect = [
+            AIMessage(content='{"alpha": {"a": 1}, "beta": "oops"}'),
+            AIMessage(content='{"x": 1}'),
+            AIMessage(content='{"x": 1}'),
+        ]
+        mock_get_llm.return_value = mock_llm
+        executor = SkillExecutor(SkillRegistry(base_path=str(tmp_path)))
+
+        state = _make_state(selected_skills=["alpha", "beta", "gamma"])
+        result = execute_skills(state, executor=executor, batch_params=True)
+        assert mock_llm.invoke.call_count == 3
+        assert result["execution_results"]["alpha"]["params"] == {"a": 1}
+        assert result["execution_results"]["beta"]["params"] == {"x": 1}
+        assert result["execution_results"]["gamma"]["params"] == {"x": 1}
+
+    @patch("src.nodes._get_llm")
+    def test_batched_params_unparseable(self, mock_get_llm, tmp_path):
+        for name in ("alpha", "beta"):
+            _write_skill(tmp_path, name, [name])
+        mock_llm = MagicMock()
+        mock_llm.invoke.side_effect = [
+            AIMessage(content="not json"),
+            AIMessage(content='{"x": 1}'),
+            AIMessage(content='{"x": 1}'),
+        ]
+        mock_get_llm.return_value = mock_llm
+        executor = SkillExecutor(SkillRegistry(base_path=str(tmp_path)))
+
+        state = _make_state(selected_skills=["alpha", "beta"])
+        result = execute_skills(state, executor=executor, batch_params=True)
+        assert mock_llm.invoke.call_count == 3
+        assert all(r["params"] == {"x": 1} for r in result["execution_results"].values())
+
+    @patch("src.nodes._get_llm")
+    def test_streams_chunks_in_graph(self, mock_get_llm):
+        mock_llm = MagicMock()
+        mock_llm.invoke.return_value = AIMessage(
+            content='{"operation": "split", "input_path": "doc.pdf"}'
+        )
+        mock_get_llm.return_value = mock_llm
+        executor = SkillExecutor(SkillRegistry(base_path=SKILLS_DIR))
+
+        workflow = StateGraph(GraphState)
+        workflow.add_node("execute_skills", functools.partial(execute_skills, executor=executor))
+        workflow.set_entry_point("execute_skills")
+        workflow.add_edge("execute_skills", END)
+        state = _make_state(selected_skills=["pdf", "report_generator"])
+
+        parts = list(workflow.compile().stream(state, stream_mode=["custom", "values"]))
+        chunks = [data for mode, data in parts if mode == "custom"]
+        assert [c["chunk"]["page"] for c in chunks] == list(range(10))
+        assert all(c["skill"] == "pdf" for c in chunks)
+        final = [data for mode, data in parts if mode == "values"][-1]
+        assert final["execution_results"]["pdf"]["pages_split"] == 10
+        assert final["execution_results"]["report_generator"]["error_type"] == "invalid_params"
+
+
+    @patch("src.nodes._get_llm")
+    def test_streaming_skill_keeps_deadline_in_graph(self, mock_get_llm, tmp_path):
+        skill_dir = _write_skill(tmp_path, "slow", ["slow"])
+        with open(skill_dir / "skill.yaml", "a", encoding="utf-8") as fh:
+            fh.write("execution:\n  timeout: 0.2\n")
+        (skill_dir / "main.py").write_text(
+            "import time\n"
+            "def execute_stream(params):\n"
+            "    time.sleep(2.0)\n"
+            "    yield {'step': 0}\n"
+            "    return {'status': 'success'}\n"
+            "def execute(params):\n"
+            "    return {'status': 'success'}\n",
+            encoding="utf-8",
+        )
+        mock_llm = MagicMock()
+        mock_llm.invoke.return_value = AIMessage(content="{}")
+        mock_get_llm.return_value = mock_llm
+        executor = SkillExecutor(SkillRegistry(base_path=str(tmp_path)))
+
+        workflow = StateGraph(GraphState)
+        workflow.add_node("execute_skills", functools.partial(execute_skills, executor=executor))
+        workflow.set_entry_point("execute_skills")
+        workflow.add_edge("execute_skills", END)
+        start = time.monotonic()
+        result = workflow.compile().invoke(_make_state(selected_skills=["slow"]))
+        assert time.monotonic() - start < 1.0
+        assert result["execution_results"]["slow"]["error_type"] == "timeout"
+
+
 class TestRespondNode:
     @patch("src.nodes._get_llm")
     def test_respond_with_results(self, mock_get_llm):